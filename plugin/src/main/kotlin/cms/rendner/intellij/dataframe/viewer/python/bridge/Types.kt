@@ -207,6 +207,7 @@ data class ChunkData(
 data class ValidatedChunkData(
     val data: ChunkData,
     val problems: List<StyleFunctionValidationProblem>? = null,
+    @SerialName("validation_incomplete") val validationIncomplete: Boolean = false,
 )
 
 enum class DataSourceTransformHint {
@@ -249,6 +250,27 @@ data class CreateTableSourceConfig(
     @SerialName("filter_eval_expr_provide_frame")
     @Serializable(PythonBooleanSerializer::class)
     val filterEvalExprProvideFrame: Boolean = false,
+    @SerialName("precompute_min_max")
+    @Serializable(PythonBooleanSerializer::class)
+    val precomputeMinMax: Boolean = false,
+    @SerialName("fingerprint_content_sample")
+    @Serializable(PythonBooleanSerializer::class)
+    val fingerprintContentSample: Boolean = false,
+    @SerialName("progressive_sort")
+    @Serializable(PythonBooleanSerializer::class)
+    val progressiveSort: Boolean = false,
+    @SerialName("prefetch_chunks")
+    @Serializable(PythonBooleanSerializer::class)
+    val prefetchChunks: Boolean = false,
+    @SerialName("style_precompute")
+    @Serializable(PythonBooleanSerializer::class)
+    val stylePrecompute: Boolean = false,
+    @SerialName("style_validation_workers") val styleValidationWorkers: Int? = null,
+    @SerialName("style_validation_sample_size") val styleValidationSampleSize: Int? = null,
+    /**
+     * Max seconds the validation of a chunk can take.
+     */
+    @SerialName("style_validation_time_budget") val styleValidationTimeBudget: Double? = null,
 )
 
 @Serializable
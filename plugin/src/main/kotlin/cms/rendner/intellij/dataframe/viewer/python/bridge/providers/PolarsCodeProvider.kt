@@ -42,6 +42,8 @@ class PolarsCodeProvider: ITableSourceCodeProvider {
     }
 
     override fun isApplicable(fqClassName: String): Boolean {
-        return fqClassName == "polars.dataframe.frame.DataFrame" || fqClassName == PythonQualifiedTypes.DICT
+        return fqClassName == "polars.dataframe.frame.DataFrame" ||
+            fqClassName == "polars.lazyframe.frame.LazyFrame" ||
+            fqClassName == PythonQualifiedTypes.DICT
     }
 }
\ No newline at end of file
@@ -3,6 +3,7 @@ import pytest
 from pandas import DataFrame, option_context
 
 from cms_rendner_sdfv.pandas.frame.frame_context import FrameContext
+from cms_rendner_sdfv.pandas.frame.frame_value_formatter import FrameValueFormatter
 from tests.helpers.chunk_data_validator import ChunkDataValidator
 
 df = pd.DataFrame.from_dict({
@@ -75,3 +76,23 @@ def test_use_option__max_seq_items():
         chunk_data = FrameContext(df_with_seq).get_chunk_data_generator().generate()
 
     assert chunk_data.cells[0][0].value == "(0, 1, ...)"
+
+
+@pytest.mark.parametrize("options", [['display.precision', 6], ['display.precision', 2], ['display.float_format', '${:,.2f}'.format]])
+def test_format_column_values_equals_format_cell(options):
+    df_with_dtypes = DataFrame({
+        "int": [1, -2, 3],
+        "uint8": pd.Series([1, 2, 3], dtype="uint8"),
+        "float32": pd.Series([0.1, float('nan'), -0.0], dtype="float32"),
+        "float": [1e20, float('inf'), 1 / 3],
+        "bool": [True, False, True],
+        "datetime": [pd.Timestamp('2020-01-01'), pd.Timestamp('1969-12-31 23:59:59.5'), pd.NaT],
+        "datetime_ns": [pd.Timestamp('2020-01-01') + pd.Timedelta(1, unit='ns'), pd.NaT, pd.NaT],
+        "object": [[1.0123456789], "a", None],
+    })
+
+    with option_context(*options):
+        formatter = FrameValueFormatter()
+        for col in df_with_dtypes.columns:
+            values = df_with_dtypes[col]._values
+            assert formatter.format_column_values(values, values.dtype) == [formatter.format_cell(v) for v in values]
@@ -11,8 +11,9 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, List
 
+import numpy as np
 from pandas.core.dtypes.common import (
     is_complex,
     is_float,
@@ -46,3 +47,35 @@ class FrameValueFormatter(ValueFormatter):
 
     def format_cell(self, value: Any) -> str:
         return self._default_format(value, super().format_cell)
+
+    def format_column_values(self, values: Any, dtype: Any) -> List[str]:
+        # The formatter is selected once per column, based on the dtype of the column.
+        # Values of columns with a numpy dtype are formatted in bulk,
+        # other values are formatted one by one the same way as by "format_cell".
+        if isinstance(dtype, np.dtype):
+            if dtype.kind == 'f' and dtype.itemsize <= 8:
+                if callable(self.__float_format):
+                    return [self.__float_format(v) for v in values]
+                return np.char.mod(f"%.{self.__precision}f", np.asarray(values)).tolist()
+            if dtype.kind in 'iub':
+                return np.asarray(values).astype(str).tolist()
+            if dtype == np.dtype('datetime64[ns]'):
+                return _format_datetime_values(np.asarray(values))
+        return [self.format_cell(v) for v in values]
+
+
+def _format_datetime_values(values: np.ndarray) -> List[str]:
+    # Same output as "str(Timestamp)", which only includes the fractional seconds if they are non-zero.
+    ns = values.view('i8')
+    formatted = np.where(
+        ns % 1_000_000_000 == 0,
+        np.datetime_as_string(values, unit='s'),
+        np.where(
+            ns % 1_000 == 0,
+            np.datetime_as_string(values, unit='us'),
+            np.datetime_as_string(values, unit='ns'),
+        ),
+    )
+    formatted = np.char.replace(formatted, 'T', ' ')
+    formatted[np.isnat(values)] = 'NaT'
+    return formatted.tolist()
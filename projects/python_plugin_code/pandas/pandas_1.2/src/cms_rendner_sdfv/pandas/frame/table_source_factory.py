@@ -51,7 +51,7 @@ class TableSourceFactory(AbstractTableSourceFactory):
             )
 
         pre_fingerprint = config.previous_fingerprint
-        cur_fingerprint = create_fingerprint(ds_frame, data_source)
+        cur_fingerprint = create_fingerprint(ds_frame, data_source, bool(config.fingerprint_content_sample))
         if pre_fingerprint is not None and pre_fingerprint != cur_fingerprint:
             return CreateTableSourceFailure(
                 error_kind=CreateTableSourceErrorKind.INVALID_FINGERPRINT,
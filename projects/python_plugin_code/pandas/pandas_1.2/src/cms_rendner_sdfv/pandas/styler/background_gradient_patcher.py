@@ -1,4 +1,4 @@
-#  Copyright 2021-2024 cms.rendner (Daniel Schmidt)
+#  Copyright 2021-2025 cms.rendner (Daniel Schmidt)
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -11,7 +11,8 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Optional, Union, Dict, Tuple
+import sys
+from typing import Any, Optional, Union, Dict
 
 import numpy as np
 from pandas import DataFrame, Series
@@ -19,6 +20,8 @@ from pandas import DataFrame, Series
 from cms_rendner_sdfv.pandas.styler.styler_todo import StylerTodo
 from cms_rendner_sdfv.pandas.styler.todo_patcher import TodoPatcher
 
+_intern = np.frompyfunc(sys.intern, 1, 1)
+
 
 # "background_gradient": https://github.com/pandas-dev/pandas/blob/v1.2.5/pandas/io/formats/style.py#L1162-L1241
 # "_background_gradient": https://github.com/pandas-dev/pandas/blob/v1.2.5/pandas/io/formats/style.py#L1244-L1307
@@ -26,11 +29,11 @@ class BackgroundGradientPatcher(TodoPatcher):
 
     def __init__(self, org_frame: DataFrame, todo: StylerTodo):
         super().__init__(org_frame, todo)
-        self.__computed_params_cache: Dict[str, Tuple[float, float]] = {}
+        self.__computed_css_cache: Dict[Any, np.ndarray] = {}
 
     def unlink(self):
         super().unlink()
-        self.__computed_params_cache = None
+        self.__computed_css_cache = None
 
     def create_patched_todo(self, chunk: DataFrame) -> Optional[StylerTodo]:
         return self._todo_builder(chunk) \
@@ -45,39 +48,40 @@ class BackgroundGradientPatcher(TodoPatcher):
         if chunk_or_series_from_chunk.empty:
             return chunk_or_series_from_chunk
 
-        vmin, vmax = self.__get_or_compute_parameters(chunk_parent, kwargs)
+        css = self.__get_or_compute_css(chunk_parent, kwargs)
 
-        return self.todo.apply_args.style_func(
-            chunk_or_series_from_chunk,
-            **dict(kwargs, vmin=vmin, vmax=vmax),
+        # Note:
+        # "css" was computed from "chunk_parent", which is unsorted and unfiltered.
+        # The "chunk" is a part of the visible DataFrame, which is filtered and sorted.
+        # "get_indexer_for" has to be used to extract the correct part of the "css" which belongs to the chunk.
+        ri = chunk_parent.index.get_indexer_for(chunk_or_series_from_chunk.index)
+        if isinstance(chunk_parent, Series):
+            return css[ri]
+        ci = chunk_parent.columns.get_indexer_for(chunk_or_series_from_chunk.columns)
+        return DataFrame(
+            css[np.ix_(ri, ci)],
+            index=chunk_or_series_from_chunk.index,
+            columns=chunk_or_series_from_chunk.columns,
         )
 
-    def __get_or_compute_parameters(self,
-                                    chunk_parent: Union[DataFrame, Series],
-                                    kwargs: Dict,
-                                    ) -> Tuple[float, float]:
+    def __get_or_compute_css(self, chunk_parent: Union[DataFrame, Series], kwargs: Dict) -> np.ndarray:
         cache_key = "frame"
         if isinstance(chunk_parent, Series):
             cache_key = chunk_parent.name
 
-        params = self.__computed_params_cache.get(cache_key, None)
-
-        if params is None:
-            params = self.__compute_params(chunk_parent, kwargs)
-            self.__computed_params_cache[cache_key] = params
-
-        return params
+        css = self.__computed_css_cache.get(cache_key, None)
 
-    @staticmethod
-    def __compute_params(chunk_parent: Union[DataFrame, Series], kwargs: Dict) -> Tuple[float, float]:
-        vmin = kwargs.get("vmin", None)
-        vmax = kwargs.get("vmax", None)
+        if css is None:
+            css = self.__compute_css(chunk_parent, kwargs)
+            self.__computed_css_cache[cache_key] = css
 
-        if vmin is None or vmax is None:
-            n = chunk_parent.to_numpy()
-            if vmin is None:
-                vmin = np.nanmin(n)
-            if vmax is None:
-                vmax = np.nanmax(n)
+        return css
 
-        return vmin, vmax
+    def __compute_css(self, chunk_parent: Union[DataFrame, Series], kwargs: Dict) -> np.ndarray:
+        # The colors of all cells are computed at once, with the same parameters as in pandas.
+        # Therefore, "vmin", "vmax" and "gmap" don't have to be adjusted for a chunk.
+        # The css strings are interned, cells of the same color share the same string.
+        css = self.todo.apply_args.style_func(chunk_parent, **kwargs)
+        if isinstance(css, DataFrame):
+            css = css.to_numpy(dtype=object)
+        return _intern(np.asarray(css, dtype=object))
@@ -37,6 +37,13 @@ def test_create_for_frame():
     assert isinstance(table_source, TableSource)
 
 
+def test_create_with_precomputed_min_max():
+    table_source = _create_table_source(df, CreateTableSourceConfig(precompute_min_max=True))
+    assert isinstance(table_source, TableSource)
+    assert table_source.compute_chunk_data(Region(0, 0, 3, 2)) == \
+           _create_table_source(df).compute_chunk_data(Region(0, 0, 3, 2))
+
+
 def test_create_for_dict_orient_columns():
     table_source = _create_table_source(df_dict)
     assert isinstance(table_source, TableSource)
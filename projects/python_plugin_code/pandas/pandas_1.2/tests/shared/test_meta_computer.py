@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 from cms_rendner_sdfv.base.types import CellMeta
 from cms_rendner_sdfv.pandas.shared.pandas_table_source_context import MetaComputer
@@ -66,3 +67,55 @@ def test_with_string():
 
     actual = mc.compute_cell_meta(0, df.iat[0, 0])
     assert actual is None
+
+
+@pytest.mark.parametrize(
+    "values", [
+        [1, 2, 3, 4],
+        [1.5, np.nan, -3.25, 8.0],
+        [1.5, np.inf, 2.0],
+        pd.array([1, None, 3], dtype="Int64"),
+        pd.array([None, None], dtype="Int64"),
+        [7, 7],
+        [2+3j, 1+1j],
+        ["a", "b"],
+    ]
+)
+def test_compute_column_meta_matches_compute_cell_meta(values):
+    df = pd.DataFrame.from_dict({'a': values})
+
+    mc = MetaComputer(df)
+
+    actual = mc.compute_column_meta(0, df['a'])
+    assert actual == [mc.compute_cell_meta(0, v) for v in df['a']]
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int32])
+def test_cmap_value_of_min_and_max(dtype):
+    df = pd.DataFrame.from_dict({'a': np.array([-1.7, 0.3, 2.9], dtype=dtype)})
+
+    mc = MetaComputer(df)
+
+    actual = mc.compute_column_meta(0, df['a'])
+    assert actual[0] == CellMeta.min().pack()
+    assert actual[2] == CellMeta.max().pack()
+    assert actual == [mc.compute_cell_meta(0, df.iat[r, 0]) for r in range(len(df.index))]
+
+
+def test_precompute_min_max_matches_min_max_per_column():
+    df = pd.DataFrame.from_dict({
+        'a': [1, 2, 3],
+        'b': [1.5, np.nan, -3.25],
+        'c': ["a", "b", "c"],
+        'd': [True, False, True],
+        'e': pd.array([1, None, 3], dtype="Int64"),
+        'f': [4, 5, 6],
+    })
+
+    mc = MetaComputer(df)
+    actual = mc._compute_min_max_of_all_columns()
+    assert actual == {col: mc._compute_min_max_at(col) for col in range(len(df.columns))}
+
+    mc.precompute_min_max()
+    assert [mc.compute_column_meta(col, df.iloc[:, col]) for col in range(len(df.columns))] == \
+           [MetaComputer(df).compute_column_meta(col, df.iloc[:, col]) for col in range(len(df.columns))]
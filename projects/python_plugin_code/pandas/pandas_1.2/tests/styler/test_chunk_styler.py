@@ -0,0 +1,41 @@
+import pandas as pd
+
+from cms_rendner_sdfv.pandas.styler.chunk_styler import ChunkStyler
+from tests.helpers.custom_styler_functions import highlight_even_numbers
+
+df = pd.DataFrame.from_dict({
+    "col_0": [0, 1, 2],
+    "col_1": [3, 4, 5],
+})
+
+
+def test_css_per_cell():
+    styler = df.style \
+        .applymap(highlight_even_numbers, subset=["col_0"]) \
+        .highlight_max(axis=None, color="blue")
+
+    actual = ChunkStyler(df).compute(styler._todo)
+
+    assert actual == [
+        {'background-color': 'red'}, None,
+        None, None,
+        {'background-color': 'red'}, {'background-color': 'blue'},
+    ]
+
+
+def test_css_per_cell_matches_styler():
+    styler = df.style \
+        .applymap(highlight_even_numbers) \
+        .highlight_max(axis=0, color="blue") \
+        .highlight_min(axis=1, color="green")
+
+    actual = ChunkStyler(df).compute(styler._todo)
+
+    styler._compute()
+    rows, cols = df.shape
+    # the css of a cell is stored as a list of "key: value" strings
+    expected = [
+        dict([x.strip() for x in kv.split(':')] for kv in styler.ctx[(r, c)] if kv) or None
+        for r in range(rows) for c in range(cols)
+    ]
+    assert actual == expected
@@ -11,13 +11,15 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Any
+from typing import Any, List, Dict, Tuple
 
+import numpy as np
 from pandas import DataFrame, Series, isna
-from pandas.api.types import is_numeric_dtype
+from pandas.api.types import is_numeric_dtype, is_integer_dtype, is_float_dtype
 from pandas.core.dtypes.common import is_bool_dtype
 
-from cms_rendner_sdfv.base.table_source import AbstractMetaComputer
+from cms_rendner_sdfv.base.table_source import AbstractMetaComputer, MinMaxInfo
+from cms_rendner_sdfv.base.types import CellMeta
 
 
 class MetaComputer(AbstractMetaComputer):
@@ -36,3 +38,51 @@ class MetaComputer(AbstractMetaComputer):
         if is_numeric_dtype(column.dtype) and not is_bool_dtype(column.dtype):
             return column.min(), column.max()
         return None, None
+
+    def _compute_min_max_of_all_columns(self) -> Dict[int, Tuple[Any, Any]]:
+        result: Dict[int, Tuple[Any, Any]] = {}
+
+        # columns of the same dtype are reduced together, to reduce whole blocks at once
+        # and to not upcast the min/max values to a common dtype
+        columns_by_dtype: Dict[Any, List[int]] = {}
+        for col, dtype in enumerate(self.__source_frame.dtypes):
+            if is_numeric_dtype(dtype) and not is_bool_dtype(dtype):
+                columns_by_dtype.setdefault(dtype, []).append(col)
+            else:
+                result[col] = (None, None)
+
+        for cols in columns_by_dtype.values():
+            frame = self.__source_frame.iloc[:, cols]
+            try:
+                mins, maxs = frame.min().to_numpy(), frame.max().to_numpy()
+            except Exception:
+                # the values are computed on demand per column
+                continue
+            if len(mins) == len(cols) and len(maxs) == len(cols):
+                result.update(zip(cols, zip(mins, maxs)))
+
+        return result
+
+    def _compute_column_cell_meta(self, info: MinMaxInfo, values: Any) -> List[CellMeta]:
+        values = values if isinstance(values, Series) else Series(values)
+        if not (is_integer_dtype(values.dtype) or is_float_dtype(values.dtype)) or isna(info.min) or isna(info.max):
+            return super()._compute_column_cell_meta(info, values)
+
+        is_nan = values.isna().to_numpy(dtype=bool)
+        is_min = values.eq(info.min).to_numpy(dtype=bool, na_value=False)
+        is_max = values.eq(info.max).to_numpy(dtype=bool, na_value=False)
+
+        if info.is_inf:
+            cmap = np.full(len(values), -1)
+        elif info.min == info.max:
+            cmap = np.zeros(len(values), dtype=int)
+        else:
+            # min/max are converted too, a range of a float32 column would otherwise be computed as float32
+            vmin, vmax = float(info.min), float(info.max)
+            normalized = (values.to_numpy(dtype=float, na_value=np.nan) - vmin) / (vmax - vmin)
+            cmap = np.nan_to_num(100_000 * normalized).astype(int)
+
+        return [
+            CellMeta.nan() if n else CellMeta(is_min=mi, is_max=ma, cmap_value=c)
+            for n, mi, ma, c in zip(is_nan.tolist(), is_min.tolist(), is_max.tolist(), cmap.tolist())
+        ]
@@ -53,6 +53,21 @@ def test_compute_chunk_data_with_multiindex():
     ))
 
 
+def test_compute_chunk_data_with_chunk_prefetch():
+    expected_ts = TableSource(FrameContext(multi_df), "finger-1")
+    ts = TableSource(FrameContext(multi_df), "finger-1").enable_chunk_prefetch()
+
+    for sort_ascending in [None, [False]]:
+        if sort_ascending is not None:
+            expected_ts.set_sort_criteria([0], sort_ascending)
+            ts.set_sort_criteria([0], sort_ascending)
+        for first_row in [0, 2, 4, 2]:
+            region = Region(first_row, 0, 2, 2)
+            assert ts.compute_chunk_data(region) == expected_ts.compute_chunk_data(region)
+
+    ts.unlink()
+
+
 def test_table_info_with_different_column_types():
     my_df = pd.DataFrame.from_dict({
         'a': [1],
@@ -0,0 +1,78 @@
+#  Copyright 2021-2025 cms.rendner (Daniel Schmidt)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from collections import defaultdict
+from typing import Callable, Optional, Tuple, List, Dict
+
+from pandas import DataFrame
+from pandas.io.formats.style import Styler
+
+CellCss = Optional[Dict[str, str]]
+
+
+class ChunkStyler:
+    """
+    Computes the css of the cells of a chunk without creating a pandas Styler for the chunk.
+
+    The patched todos are executed directly against the chunk DataFrame. To produce the same
+    styling as a Styler, the methods which compute and collect the css are the ones of the Styler.
+    These methods only require the attributes "data", "index", "columns" and "ctx".
+    """
+
+    _apply = Styler._apply
+    _applymap = Styler._applymap
+    _update_ctx = Styler._update_ctx
+
+    def __init__(self, data: DataFrame):
+        self.data: DataFrame = data
+        self.index = data.index
+        self.columns = data.columns
+        # The calculated css is stored by using a tuple of (rowIndex, columnIndex) coordinates.
+        # (see pandas Styler._update_ctx)
+        self.ctx: Dict[Tuple[int, int], list] = defaultdict(list)
+
+    def compute(self, todos: List[Tuple[Callable, tuple, dict]]) -> List[CellCss]:
+        for func, args, kwargs in todos:
+            func(self)(*args, **kwargs)
+        return self.__css_per_cell()
+
+    def compute_per_todo(self, todos: List[Tuple[Callable, tuple, dict]]) -> List[List[CellCss]]:
+        result = []
+        for func, args, kwargs in todos:
+            self.ctx.clear()
+            func(self)(*args, **kwargs)
+            result.append(self.__css_per_cell())
+        self.ctx.clear()
+        return result
+
+    @staticmethod
+    def merge(css_per_todo: List[List[CellCss]], cells: int) -> List[CellCss]:
+        # the css of a todo overwrites the css of the previous todos (same as in pandas Styler._update_ctx)
+        result: List[CellCss] = [None] * cells
+        for css_list in css_per_todo:
+            for i, css in enumerate(css_list):
+                if css is not None:
+                    if result[i] is None:
+                        result[i] = dict(css)
+                    else:
+                        result[i].update(css)
+        return result
+
+    def __css_per_cell(self) -> List[CellCss]:
+        # row-major, the css of a cell is at position "row * cols + col"
+        rows, cols = self.data.shape
+        result: List[CellCss] = [None] * (rows * cols)
+        for (row, col), css in self.ctx.items():
+            if css:
+                result[row * cols + col] = dict(css)
+        return result
@@ -1,4 +1,4 @@
-#  Copyright 2021-2024 cms.rendner (Daniel Schmidt)
+#  Copyright 2021-2025 cms.rendner (Daniel Schmidt)
 #
 #  Licensed under the Apache License, Version 2.0 (the "License");
 #  you may not use this file except in compliance with the License.
@@ -11,10 +11,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Optional, Union
+from functools import partial
+from typing import Dict, Optional, Union
 
 import numpy as np
-from pandas import DataFrame, Series
+from pandas import DataFrame, Index, Series
 from pandas.io.formats.style import _validate_apply_axis_arg
 
 from cms_rendner_sdfv.pandas.styler.styler_todo import StylerTodo
@@ -26,15 +27,29 @@ class HighlightBetweenPatcher(TodoPatcher):
 
     def __init__(self, org_frame: DataFrame, todo: StylerTodo):
         super().__init__(org_frame, todo)
+        # The validated "left" and "right" bounds, aligned to the positions of the chunk parents.
+        # All chunk parents of a todo share the same labels for the validated axis, therefore they
+        # are only validated once.
+        self.__validated_bounds_cache: Dict[str, np.ndarray] = {}
+
+    def unlink(self):
+        super().unlink()
+        self.__validated_bounds_cache = None
 
     def create_patched_todo(self, chunk: DataFrame) -> Optional[StylerTodo]:
+        # The positions of the styled part of the chunk in the chunk parent.
+        # Computed once per chunk and shared by all series of the chunk.
+        chunk_positions: Dict[str, np.ndarray] = {}
         return self._todo_builder(chunk) \
-            .with_style_func(self._wrap_with_chunk_parent_provider(self._styling_func)) \
+            .with_style_func(self._wrap_with_chunk_parent_provider(
+                partial(self._styling_func, chunk_positions=chunk_positions),
+            )) \
             .build()
 
     def _styling_func(self,
                       chunk_or_series_from_chunk: Union[DataFrame, Series],
                       chunk_parent: Union[DataFrame, Series],
+                      chunk_positions: Dict[str, np.ndarray],
                       **kwargs,
                       ):
         if chunk_or_series_from_chunk.empty:
@@ -45,36 +60,44 @@ class HighlightBetweenPatcher(TodoPatcher):
 
         # https://github.com/pandas-dev/pandas/blob/v1.4.0/pandas/io/formats/style.py#L3603-L3648
         if np.iterable(left) and not isinstance(left, str):
-            left = _validate_apply_axis_arg(left, "left", None, chunk_parent)
             # adjust "left" for chunk
-            left = self.__extract_chunk_bounds_from_chunk_parent_bounds(left, chunk_or_series_from_chunk, chunk_parent)
+            left = self.__get_chunk_bounds("left", left, chunk_or_series_from_chunk, chunk_parent, chunk_positions)
 
         if np.iterable(right) and not isinstance(right, str):
-            right = _validate_apply_axis_arg(right, "right", None, chunk_parent)
             # adjust "right" for chunk
-            right = self.__extract_chunk_bounds_from_chunk_parent_bounds(right, chunk_or_series_from_chunk, chunk_parent)
+            right = self.__get_chunk_bounds("right", right, chunk_or_series_from_chunk, chunk_parent, chunk_positions)
 
         return self.todo.apply_args.style_func(
             chunk_or_series_from_chunk,
             **dict(kwargs, left=left, right=right),
         )
 
-    @staticmethod
-    def __extract_chunk_bounds_from_chunk_parent_bounds(bounds: np.ndarray,
-                                                        chunk_or_series_from_chunk: Union[DataFrame, Series],
-                                                        chunk_parent: Union[DataFrame, Series],
-                                                        ) -> np.ndarray:
+    def __get_chunk_bounds(self,
+                           name: str,
+                           bounds,
+                           chunk_or_series_from_chunk: Union[DataFrame, Series],
+                           chunk_parent: Union[DataFrame, Series],
+                           chunk_positions: Dict[str, np.ndarray],
+                           ) -> np.ndarray:
+        validated_bounds = self.__validated_bounds_cache.get(name, None)
+        if validated_bounds is None:
+            validated_bounds = _validate_apply_axis_arg(bounds, name, None, chunk_parent)
+            self.__validated_bounds_cache[name] = validated_bounds
+
         # Note:
-        # "bounds" was taken from the "chunk_parent", which is unsorted and unfiltered.
+        # "bounds" were validated against the "chunk_parent", which is unsorted and unfiltered.
         # The "chunk" is a part of the visible DataFrame, which is filtered and sorted.
-        # "get_indexer_for" has to be used to extract the correct part of the "bounds" which belongs to the chunk.
+        # The positions of the chunk in the "chunk_parent" are used to extract the part of the "bounds"
+        # which belongs to the chunk.
+        ri = self.__get_positions(chunk_positions, "index", chunk_or_series_from_chunk.index, chunk_parent.index)
         if isinstance(chunk_parent, Series):
-            return bounds[chunk_parent.index.get_indexer_for(chunk_or_series_from_chunk.index)]
-        elif isinstance(chunk_parent, DataFrame):
-            ri = chunk_parent.index.get_indexer_for(chunk_or_series_from_chunk.index)
-            ci = chunk_parent.columns.get_indexer_for(chunk_or_series_from_chunk.columns)
-            if isinstance(bounds, DataFrame):
-                return bounds.iloc[(ri, ci)]
-            elif isinstance(bounds, np.ndarray):
-                return DataFrame(data=bounds, index=chunk_parent.index, columns=chunk_parent.columns).iloc[(ri, ci)]
-        return bounds
+            return validated_bounds[ri]
+        ci = self.__get_positions(chunk_positions, "columns", chunk_or_series_from_chunk.columns, chunk_parent.columns)
+        return validated_bounds[np.ix_(ri, ci)]
+
+    @staticmethod
+    def __get_positions(chunk_positions: Dict[str, np.ndarray], axis: str, labels: Index, parent_labels: Index):
+        positions = chunk_positions.get(axis, None)
+        if positions is None:
+            positions = chunk_positions[axis] = parent_labels.get_indexer_for(labels)
+        return positions
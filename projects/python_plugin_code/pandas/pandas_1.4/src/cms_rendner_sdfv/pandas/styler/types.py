@@ -40,3 +40,5 @@ class StyleFunctionValidationProblem:
 class ValidatedChunkData:
     data: Optional[ChunkDataResponse] = None
     problems: Optional[List[StyleFunctionValidationProblem]] = None
+    # True if the time budget of the validation was exceeded before all style functions were validated
+    validation_incomplete: bool = False
@@ -1,5 +1,8 @@
+import threading
+
 import numpy as np
 import pandas as pd
+import pytest
 from pandas import DataFrame
 
 from cms_rendner_sdfv.base.types import TableStructureColumnInfo, TableStructureLegend, TableStructureColumn, \
@@ -44,6 +47,81 @@ def test_previous_sort_criteria_does_not_affect_later_sort_criteria():
     assert list(index_after_first_sort) == list(index_after_last_sort)
 
 
+def test_previous_sort_permutation_is_reused(monkeypatch):
+    sort_values_calls = []
+    org_sort_values = DataFrame.sort_values
+
+    def sort_values(self, *args, **kwargs):
+        sort_values_calls.append(list(self.columns))
+        return org_sort_values(self, *args, **kwargs)
+
+    monkeypatch.setattr(DataFrame, 'sort_values', sort_values)
+
+    ctx = FrameContext(df)
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[False])
+    index_after_first_sort = ctx.visible_frame.to_frame(ctx.visible_frame.region).index
+    ctx.set_sort_criteria(sort_by_column_index=[1], sort_ascending=[True])
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[False])
+    index_after_last_sort = ctx.visible_frame.to_frame(ctx.visible_frame.region).index
+
+    # only the columns to sort by are sorted
+    assert sort_values_calls == [[0], [0]]
+    assert list(index_after_first_sort) == list(index_after_last_sort)
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_progressive_sort(ascending: bool):
+    progressive_df = DataFrame.from_dict({"col_0": [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5], "col_1": range(11)})
+    expected_index = list(progressive_df.sort_values(by="col_0", ascending=ascending, kind="stable").index)
+
+    ctx = FrameContext(progressive_df)
+    ctx.enable_progressive_sort(window_size=4)
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[ascending])
+    leading_index = list(ctx.visible_frame.to_frame(ctx.visible_frame.region).index)
+
+    for t in threading.enumerate():
+        if t is not threading.current_thread() and t.daemon:
+            t.join(timeout=5)
+
+    assert ctx.is_sort_complete()
+    assert leading_index[:4] == expected_index[:4]
+    assert sorted(leading_index) == sorted(expected_index)
+    assert list(ctx.visible_frame.to_frame(ctx.visible_frame.region).index) == expected_index
+
+
+
+def test_failed_progressive_sort_can_be_reapplied(monkeypatch):
+    progressive_df = DataFrame.from_dict({"col_0": [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5], "col_1": range(11)})
+    expected_index = list(progressive_df.sort_values(by="col_0", kind="stable").index)
+
+    def sort_values(self, *args, **kwargs):
+        raise MemoryError()
+
+    monkeypatch.setattr(DataFrame, 'sort_values', sort_values)
+
+    ctx = FrameContext(progressive_df)
+    ctx.enable_progressive_sort(window_size=4)
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[True])
+    _join_daemon_threads()
+
+    # only the leading window is sorted
+    assert not ctx.is_sort_complete()
+    assert list(ctx.visible_frame.to_frame(ctx.visible_frame.region).index)[:4] == expected_index[:4]
+
+    monkeypatch.undo()
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[True])
+    _join_daemon_threads()
+
+    assert ctx.is_sort_complete()
+    assert list(ctx.visible_frame.to_frame(ctx.visible_frame.region).index) == expected_index
+
+
+def _join_daemon_threads():
+    for t in threading.enumerate():
+        if t is not threading.current_thread() and t.daemon:
+            t.join(timeout=5)
+
+
 def test_filter_is_respected():
     ctx = FrameContext(df, FilterCriteria.from_frame(df.filter(items=[1], axis='index')))
     table_structure = ctx.get_table_structure("")
@@ -162,3 +240,13 @@ def test_table_structure_column_info_with_str_and_int_column_names():
             TableStructureColumn(dtype='int64', labels=['101'], id=2, text_align=TextAlign.RIGHT),
             TableStructureColumn(dtype='int64', labels=['0'], id=3, text_align=TextAlign.RIGHT)
         ])
+
+
+def test_column_statistics_are_cached():
+    ctx = FrameContext(df)
+
+    first = ctx.get_column_statistics(1)
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[False])
+
+    assert ctx.get_column_statistics(1) is first
+    assert ctx.get_columns_statistics([0, 1]) == {0: ctx.get_column_statistics(0), 1: first}
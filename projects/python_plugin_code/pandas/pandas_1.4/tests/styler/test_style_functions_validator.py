@@ -1,3 +1,4 @@
+import time
 from typing import Literal
 
 import numpy as np
@@ -139,6 +140,72 @@ def test_detect_not_chunk_aware_styling_function(axis: Literal['index', 'columns
     )
 
 
+@pytest.mark.parametrize("axis", ['index', 'columns'])
+def test_detect_styling_function_which_ignores_chunk_parent(axis: Literal['index', 'columns']):
+    def my_highlight_max(series: Series, chunk_parent=None):
+        return ['background-color: red' if cell == series.max() else '' for cell in series]
+
+    styler = df.style.apply(my_highlight_max, axis=axis)
+
+    validator = _create_validator(styler)
+    result = validator.validate()
+
+    assert len(validator.failed_patchers) == 1
+    assert len(result) == 1
+    assert result[0] == StyleFunctionValidationProblem(
+        reason="NOT_EQUAL",
+        message="",
+        func_info=StyleFunctionInfo(
+            index=0,
+            qname="test_detect_styling_function_which_ignores_chunk_parent.<locals>.my_highlight_max",
+            resolved_name="my_highlight_max",
+            axis=axis,
+            is_chunk_parent_requested=True,
+            is_apply=True,
+            is_pandas_builtin=False,
+            is_supported=False,
+        )
+    )
+
+
+@pytest.mark.parametrize("axis", ['index', 'columns'])
+@pytest.mark.parametrize("region", [None, Region(1, 1, 3, 3)])
+def test_detect_styling_function_which_aligns_chunk_parent_by_position(
+        axis: Literal['index', 'columns'],
+        region: Region,
+):
+    # the validated chunk is styled against the whole frame as chunk_parent,
+    # a position based access into the chunk_parent has to be reported
+    def my_highlight_equal(series: Series, chunk_parent=None):
+        return ['background-color: red' if v == p else '' for v, p in zip(series, chunk_parent)]
+
+    styler = df.style.apply(my_highlight_equal, axis=axis)
+
+    validator = _create_validator(styler)
+    result = validator.validate(region)
+
+    assert len(validator.failed_patchers) == 1
+    assert len(result) == 1
+    assert result[0].reason == "NOT_EQUAL"
+    assert result[0].func_info.is_chunk_parent_requested
+
+
+def test_detect_styling_function_which_slices_chunk_parent_by_position():
+    def my_highlight_max(series: Series, chunk_parent=None):
+        max = chunk_parent.iloc[:len(series)].max()
+        return ['background-color: red' if cell == max else '' for cell in series]
+
+    styler = df.style.apply(my_highlight_max, axis='index', subset=df.columns[1:4])
+
+    validator = _create_validator(styler)
+    result = validator.validate()
+
+    assert len(validator.failed_patchers) == 1
+    assert len(result) == 1
+    assert result[0].reason == "NOT_EQUAL"
+    assert result[0].func_info.is_chunk_parent_requested
+
+
 def test_detect_not_chunk_aware_and_throwing_styling_functions():
     def my_highlight_max(series: Series):
         is_max = series == series.max()
@@ -186,6 +253,102 @@ def test_detect_not_chunk_aware_and_throwing_styling_functions():
     )
 
 
+def test_parallel_validation_keeps_order_of_problems():
+    def my_highlight_max(series: Series):
+        is_max = series == series.max()
+        return ['background-color: red' if cell else '' for cell in is_max]
+
+    def raise_exception(_: Series):
+        raise Exception("I don't care")
+
+    def create_styler() -> Styler:
+        return df.style \
+            .apply(my_highlight_max, axis=0) \
+            .highlight_max() \
+            .apply(raise_exception, axis=1) \
+            .apply(my_highlight_max, axis=1)
+
+    expected = _create_validator(create_styler()).validate()
+
+    validator = StyleFunctionsValidator(PatchedStylerContext(create_styler()), max_workers=4)
+    result = validator.validate()
+
+    assert result == expected
+    assert [p.todo.index_in_org_styler for p in validator.failed_patchers] == [0, 2, 3]
+
+
+def test_sampled_validation_detects_not_chunk_aware_styling_function():
+    def my_highlight_max(series: Series):
+        is_max = series == series.max()
+        return ['background-color: red' if cell else '' for cell in is_max]
+
+    styler = df.style.apply(my_highlight_max, axis='index')
+
+    validator = StyleFunctionsValidator(PatchedStylerContext(styler), sample_size=df.size - 1)
+    result = validator.validate()
+
+    assert len(result) == 1
+    assert result[0].reason == "NOT_EQUAL"
+    assert not validator.is_incomplete
+
+
+
+@pytest.mark.parametrize("axis", ['index', 'columns', None])
+def test_sampled_validation_styles_only_the_sampled_parts(axis):
+    large_df = DataFrame(np.arange(600).reshape(30, 20))
+    styled_cells = []
+
+    def my_style(data):
+        styled_cells.append(data.size)
+        if isinstance(data, DataFrame):
+            return DataFrame('', index=data.index, columns=data.columns)
+        return ['' for _ in data]
+
+    def validate(sample_size: int) -> int:
+        styled_cells.clear()
+        validator = StyleFunctionsValidator(
+            PatchedStylerContext(large_df.style.apply(my_style, axis=axis)),
+            sample_size=sample_size,
+        )
+        assert validator.validate() == []
+        return sum(styled_cells)
+
+    # the styled cells of the chunk, which are also used to render the chunk
+    chunk_cells = large_df.size
+    assert validate(5) - chunk_cells < (validate(0) - chunk_cells) / 2
+
+
+def test_sampled_validation_is_deterministic():
+    def create_validator() -> StyleFunctionsValidator:
+        return StyleFunctionsValidator(PatchedStylerContext(mi_df.style.background_gradient()), sample_size=5)
+
+    region = Region(1, 1, 4, 4)
+    first = create_validator()
+    first.validate(region)
+    second = create_validator()
+    second.validate(region)
+
+    assert first._StyleFunctionsValidator__sampled_cells is not None
+    assert first._StyleFunctionsValidator__sampled_cells == second._StyleFunctionsValidator__sampled_cells
+
+
+def test_validation_is_incomplete_if_time_budget_is_exceeded():
+    def my_slow_style(series: Series):
+        time.sleep(0.01)
+        return ['' for _ in series]
+
+    styler = df.style.apply(my_slow_style, axis='index')
+
+    validator = StyleFunctionsValidator(PatchedStylerContext(styler), time_budget=0.001)
+    result = validator.validate()
+
+    assert len(result) == 0
+    assert len(validator.failed_patchers) == 0
+    assert validator.is_incomplete
+    # the validated chunk is still available for the data generation
+    assert validator.computed_chunk is not None
+
+
 @pytest.mark.parametrize("axis", ['index', 'columns'])
 def test_no_problem_for_chunk_aware_styling_function_1(axis: Literal['index', 'columns']):
     def my_highlight_max(series: Series, chunk_parent=None):
@@ -16,6 +16,7 @@ from typing import Any, Union
 from pandas import DataFrame
 from pandas.io.formats.style import Styler
 
+from cms_rendner_sdfv.base.constants import STYLE_PRECOMPUTE_MAX_CELLS
 from cms_rendner_sdfv.base.table_source import AbstractTableSource, AbstractTableSourceFactory
 from cms_rendner_sdfv.base.types import CreateTableSourceConfig, CreateTableSourceFailure, CreateTableSourceErrorKind
 from cms_rendner_sdfv.pandas.shared.create_fingerprint import create_fingerprint
@@ -42,7 +43,7 @@ class TableSourceFactory(AbstractTableSourceFactory):
         ds_frame_style = data_source
 
         pre_fingerprint = config.previous_fingerprint
-        cur_fingerprint = create_fingerprint(ds_frame, data_source)
+        cur_fingerprint = create_fingerprint(ds_frame, data_source, bool(config.fingerprint_content_sample))
         if pre_fingerprint is not None and pre_fingerprint != cur_fingerprint:
             return CreateTableSourceFailure(
                 error_kind=CreateTableSourceErrorKind.INVALID_FINGERPRINT,
@@ -71,6 +72,13 @@ class TableSourceFactory(AbstractTableSourceFactory):
                 )
 
         return PatchedStyler(
-            PatchedStylerContext(ds_frame_style, FilterCriteria.from_frame(filter_frame)),
+            PatchedStylerContext(
+                ds_frame_style,
+                FilterCriteria.from_frame(filter_frame),
+                style_precompute_max_cells=STYLE_PRECOMPUTE_MAX_CELLS if config.style_precompute else 0,
+            ),
             fingerprint=cur_fingerprint,
+            validation_workers=config.style_validation_workers or 1,
+            validation_sample_size=config.style_validation_sample_size or 0,
+            validation_time_budget=config.style_validation_time_budget or 0,
         )
@@ -0,0 +1,74 @@
+#  Copyright 2021-2025 cms.rendner (Daniel Schmidt)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from typing import Dict, List
+
+import numpy as np
+from pandas import DataFrame
+
+from cms_rendner_sdfv.base.types import Region
+from cms_rendner_sdfv.pandas.shared.visible_frame import VisibleFrame
+from cms_rendner_sdfv.pandas.styler.chunk_styler import ChunkStyler, CellCss
+from cms_rendner_sdfv.pandas.styler.todo_patcher import TodoPatcher
+
+
+class PrecomputedCss:
+    """
+    The css of all cells of a visible frame, computed at once by running the todos over the whole visible frame.
+
+    The todos are applied to the visible cells in the order of the source frame, independent of the sort order
+    of the visible frame. The css of a cell is stored by the position of the cell in the source frame. Therefore,
+    it is still valid after the visible frame was sorted. Equal css is stored only once, each cell refers to its
+    css by an id.
+    """
+
+    def __init__(self, source_frame: DataFrame, visible_frame: VisibleFrame, todo_patcher_list: List[TodoPatcher]):
+        row_positions = np.sort(np.asarray(visible_frame.row_positions_at(), dtype=np.intp))
+        col_positions = np.sort(np.asarray(visible_frame.get_column_indices(), dtype=np.intp))
+        frame = source_frame.iloc[row_positions, col_positions]
+        css = ChunkStyler(frame).compute([p.create_patched_todo(frame).to_tuple() for p in todo_patcher_list])
+
+        # id 0 is reserved for cells without css
+        self.__css_table: List[CellCss] = [None]
+        ids_by_css: Dict[tuple, int] = {}
+        css_ids = []
+        for cell_css in css:
+            if cell_css is None:
+                css_ids.append(0)
+                continue
+            key = tuple(cell_css.items())
+            css_id = ids_by_css.get(key)
+            if css_id is None:
+                css_id = ids_by_css[key] = len(self.__css_table)
+                self.__css_table.append(cell_css)
+            css_ids.append(css_id)
+
+        rows, cols = frame.shape
+        self.__css_ids = np.asarray(
+            css_ids,
+            dtype=np.min_scalar_type(len(self.__css_table) - 1),
+        ).reshape(rows, cols)
+
+        # maps the positions of the source frame to the positions of the stored css ids
+        self.__row_slots = np.full(row_positions.max() + 1 if rows else 0, -1, dtype=np.intp)
+        self.__row_slots[row_positions] = np.arange(rows)
+        self.__col_slots = np.full(col_positions.max() + 1 if cols else 0, -1, dtype=np.intp)
+        self.__col_slots[col_positions] = np.arange(cols)
+
+    def css_of_region(self, visible_frame: VisibleFrame, region: Region) -> List[CellCss]:
+        # row-major, the css of a cell is at position "row * cols + col"
+        row_positions = np.asarray(visible_frame.row_positions_at(region), dtype=np.intp)
+        col_indices = visible_frame.get_column_indices()[region.first_col:region.first_col + region.cols]
+        col_positions = np.asarray(col_indices, dtype=np.intp)
+        css_ids = self.__css_ids[np.ix_(self.__row_slots[row_positions], self.__col_slots[col_positions])]
+        return [self.__css_table[i] for i in css_ids.ravel()]
@@ -98,6 +98,18 @@ def test_multi_index_index_with_named_index_levels():
     )
 
 
+def test_multi_index_row_headers_of_sorted_frame_with_missing_labels():
+    df = pd.DataFrame.from_dict({
+        'col_0': [3, 1, 2, 0],
+    })
+    df.index = pd.MultiIndex.from_arrays([['X', 'X', None, 'Y'], [1.5, None, 2.5, 1.5]])
+
+    ctx = FrameContext(df)
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[True])
+    actual = ctx.get_chunk_data_generator().generate_by_combining_chunks(3, 1)
+    assert actual.row_headers == [['Y', '1.500000'], ['X', 'nan'], ['nan', '2.500000'], ['X', '1.500000']]
+
+
 def test_generate_ignores_max_elements_option():
     with pd.option_context("styler.render.max_elements", 1):
         df = pd.DataFrame.from_dict({
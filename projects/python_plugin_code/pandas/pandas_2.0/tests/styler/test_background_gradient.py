@@ -3,7 +3,9 @@ import pandas as pd
 import pytest
 
 from cms_rendner_sdfv.base.types import Cell, CellMeta
+from cms_rendner_sdfv.pandas.styler.chunk_styler import ChunkStyler
 from cms_rendner_sdfv.pandas.styler.patched_styler_context import PatchedStylerContext
+from cms_rendner_sdfv.pandas.styler.styler_todo import StylerTodoBuilder
 from tests.helpers.asserts.assert_style_func_parameters import assert_style_func_parameters
 from tests.helpers.asserts.assert_patched_styler import assert_patched_styler
 
@@ -188,6 +190,31 @@ def test_pandas_test_example_background_gradient_gmap_array_raises(axis, gmap):
         )
 
 
+@pytest.mark.parametrize("axis", [None, 0, 1])
+def test_css_is_computed_once_per_chunk_parent(axis):
+    ctx = PatchedStylerContext(df.style.background_gradient(axis=axis))
+    patcher = ctx.get_todo_patcher_list()[0]
+
+    calls = []
+    style_func = patcher.todo.apply_args.style_func
+
+    def counting_style_func(*args, **kwargs):
+        calls.append(args[0].name if isinstance(args[0], pd.Series) else None)
+        return style_func(*args, **kwargs)
+
+    patcher.todo = StylerTodoBuilder(patcher.todo).with_style_func(counting_style_func).build()
+
+    expected = ChunkStyler(df).compute([patcher.create_patched_todo(df).to_tuple()])
+    calls_for_whole_frame = len(calls)
+
+    css = []
+    for chunk in [df.iloc[:2], df.iloc[2:]]:
+        css.append(ChunkStyler(chunk).compute([patcher.create_patched_todo(chunk).to_tuple()]))
+
+    assert len(calls) == calls_for_whole_frame
+    assert css[0] + css[1] == expected
+
+
 def test_for_new_parameters():
     assert_style_func_parameters(
         df.style.background_gradient,
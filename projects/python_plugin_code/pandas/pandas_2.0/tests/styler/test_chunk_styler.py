@@ -0,0 +1,37 @@
+import pandas as pd
+
+from cms_rendner_sdfv.pandas.styler.chunk_styler import ChunkStyler
+from tests.helpers.custom_styler_functions import highlight_even_numbers
+
+df = pd.DataFrame.from_dict({
+    "col_0": [0, 1, 2],
+    "col_1": [3, 4, 5],
+})
+
+
+def test_css_per_cell():
+    styler = df.style \
+        .applymap(highlight_even_numbers, subset=["col_0"]) \
+        .highlight_max(axis=None, props="color: blue")
+
+    actual = ChunkStyler(df).compute(styler._todo)
+
+    assert actual == [
+        {'background-color': 'red'}, None,
+        None, None,
+        {'background-color': 'red'}, {'color': 'blue'},
+    ]
+
+
+def test_css_per_cell_matches_styler():
+    styler = df.style \
+        .applymap(highlight_even_numbers) \
+        .highlight_max(axis=0, props="color: blue") \
+        .highlight_min(axis=1, props="color: green")
+
+    actual = ChunkStyler(df).compute(styler._todo)
+
+    styler._compute()
+    rows, cols = df.shape
+    expected = [dict(styler.ctx[(r, c)]) or None for r in range(rows) for c in range(cols)]
+    assert actual == expected
@@ -2,6 +2,7 @@ import pandas as pd
 import pytest
 
 from cms_rendner_sdfv.base.types import Cell, CellMeta
+from cms_rendner_sdfv.pandas.styler import highlight_between_patcher
 from cms_rendner_sdfv.pandas.styler.patched_styler_context import PatchedStylerContext
 from tests.helpers.asserts.assert_style_func_parameters import assert_style_func_parameters
 from tests.helpers.asserts.assert_patched_styler import assert_patched_styler
@@ -148,6 +149,32 @@ def test_pandas_test_example_highlight_between(kwargs):
     )
 
 
+@pytest.mark.parametrize(
+    "axis, left, right", [
+        (0, [0, 1, 2, 3, 4], [2, 3, 4, 5, 6]),
+        (1, [0, 5, 10, 15, 20], [1, 6, 11, 16, 21]),
+        (None, df - 1, df + 1),
+    ])
+def test_bounds_are_validated_once(monkeypatch, axis, left, right):
+    validated_args = []
+    org_validate_apply_axis_arg = highlight_between_patcher._validate_apply_axis_arg
+
+    def validate_apply_axis_arg(arg, arg_name, *args, **kwargs):
+        validated_args.append(arg_name)
+        return org_validate_apply_axis_arg(arg, arg_name, *args, **kwargs)
+
+    monkeypatch.setattr(highlight_between_patcher, '_validate_apply_axis_arg', validate_apply_axis_arg)
+
+    assert_patched_styler(
+        df,
+        lambda styler: styler.highlight_between(axis=axis, left=left, right=right),
+        1,
+        2
+    )
+
+    assert validated_args == ["left", "right"]
+
+
 def test_for_new_parameters():
     assert_style_func_parameters(
         df.style.highlight_between,
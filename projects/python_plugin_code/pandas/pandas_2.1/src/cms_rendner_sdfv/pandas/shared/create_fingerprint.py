@@ -14,10 +14,14 @@
 from hashlib import blake2b
 from typing import Any
 
+import numpy as np
 from pandas import DataFrame
+from pandas.util import hash_pandas_object
 
+from cms_rendner_sdfv.base.constants import FINGERPRINT_CONTENT_SAMPLE_ROWS
 
-def create_fingerprint(frame: DataFrame, org_data_source: Any = None) -> str:
+
+def create_fingerprint(frame: DataFrame, org_data_source: Any = None, with_content_sample: bool = False) -> str:
     # A "fingerprint" is generated to help to identify if two data-frame instances are created with the
     # same data source. Two objects with non-overlapping lifetimes may have the same id() value.
     # Such a scenario can be simulated with the following minimal example:
@@ -34,4 +38,23 @@ def create_fingerprint(frame: DataFrame, org_data_source: Any = None) -> str:
         frame.index[:60],
         frame.dtypes[:60]
     ]
-    return blake2b('-'.join(str(x) for x in fingerprint_input).encode(), digest_size=16).hexdigest()
\ No newline at end of file
+    if with_content_sample:
+        fingerprint_input.append(_hash_content_sample(frame))
+    return blake2b('-'.join(str(x) for x in fingerprint_input).encode(), digest_size=16).hexdigest()
+
+
+def _hash_content_sample(frame: DataFrame) -> str:
+    # In-place modifications of the values aren't detected by the other parts of the fingerprint.
+    # Only a deterministic sample of evenly distributed rows is hashed, to keep the costs bounded for large frames.
+    rows_count = len(frame)
+    if rows_count == 0:
+        return ""
+    positions = np.unique(
+        np.linspace(0, rows_count - 1, num=min(rows_count, FINGERPRINT_CONTENT_SAMPLE_ROWS), dtype=np.int64),
+    )
+    try:
+        row_hashes = hash_pandas_object(frame.iloc[positions], index=True)
+    except Exception:
+        # values which can't be hashed are not included
+        return ""
+    return blake2b(row_hashes.to_numpy().tobytes(), digest_size=16).hexdigest()
@@ -11,34 +11,68 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+from typing import Optional
 
 from cms_rendner_sdfv.base.table_source import ChunkDataGenerator as BaseChunkDataGenerator
 from cms_rendner_sdfv.base.types import Region, ChunkDataResponse
 from cms_rendner_sdfv.pandas.styler.chunk_computer import ChunkComputer, Chunk
+from cms_rendner_sdfv.pandas.styler.styled_chunk_cache import StyledChunkCache
 
 
 class ChunkDataGenerator(BaseChunkDataGenerator):
-    def __init__(self, bounds: Region, chunk_computer: ChunkComputer):
+    def __init__(self,
+                 bounds: Region,
+                 chunk_computer: ChunkComputer,
+                 cache: Optional[StyledChunkCache] = None,
+                 cache_key: tuple = (),
+                 ):
         super().__init__(bounds)
         self.__chunk_computer = chunk_computer
         self.__current_chunk: Chunk = None
+        # the cache key has to identify the state of the visible frame (sort order) the chunks are computed from
+        self.__cache = cache
+        self.__cache_key = cache_key
+        self.__cached_chunk: Optional[ChunkDataResponse] = None
 
     def _before_generate(self, region: Region):
-        self.__current_chunk = self.__chunk_computer.compute(region)
+        if self.__cache is None:
+            self.__current_chunk = self.__chunk_computer.compute(region)
+            return
+
+        key = self.__cache_key + (region.first_row, region.first_col, region.rows, region.cols)
+        self.__cached_chunk = self.__cache.get(key)
+        if self.__cached_chunk is None:
+            # row headers and cells are cached together, independent of what is requested
+            self.__current_chunk = self.__chunk_computer.compute(region)
+            self.__cached_chunk = ChunkDataResponse()
+            self.__compute_row_headers(region, self.__cached_chunk)
+            self.__compute_cells(region, self.__cached_chunk)
+            self.__current_chunk = None
+            self.__cache.put(key, self.__cached_chunk)
 
     def _after_generate(self, region: Region):
         self.__current_chunk = None
+        self.__cached_chunk = None
 
     def _compute_cells(self, region: Region, response: ChunkDataResponse):
-        response.cells = []
-        col_range = range(region.cols)
-        for r in range(region.rows):
-            row_cells = []
-            response.cells.append(row_cells)
-            for c in col_range:
-                row_cells.append(self.__current_chunk.cell_value_at(r, c))
+        if self.__cached_chunk is not None:
+            # copy the rows, the lists of a response are extended when chunks are combined
+            response.cells = [list(row) for row in self.__cached_chunk.cells]
+        else:
+            self.__compute_cells(region, response)
 
     def _compute_row_headers(self, region: Region, response: ChunkDataResponse):
+        if self.__cached_chunk is not None:
+            if self.__cached_chunk.row_headers is not None:
+                response.row_headers = [list(labels) for labels in self.__cached_chunk.row_headers]
+        else:
+            self.__compute_row_headers(region, response)
+
+    def __compute_cells(self, region: Region, response: ChunkDataResponse):
+        col_cells = [self.__current_chunk.column_cells_at(c) for c in range(region.cols)]
+        response.cells = [list(row) for row in zip(*col_cells)] if col_cells else [[] for _ in range(region.rows)]
+
+    def __compute_row_headers(self, region: Region, response: ChunkDataResponse):
         if not self.__current_chunk.has_row_headers:
             return
         response.row_headers = []
@@ -24,18 +24,24 @@ from cms_rendner_sdfv.pandas.shared.types import FilterCriteria
 from cms_rendner_sdfv.pandas.shared.visible_frame import VisibleFrame
 from cms_rendner_sdfv.pandas.styler.apply_patcher import ApplyPatcher
 from cms_rendner_sdfv.pandas.styler.background_gradient_patcher import BackgroundGradientPatcher
-from cms_rendner_sdfv.pandas.styler.chunk_computer import ChunkComputer
+from cms_rendner_sdfv.pandas.styler.chunk_computer import ChunkComputer, Chunk
 from cms_rendner_sdfv.pandas.styler.chunk_data_generator import ChunkDataGenerator
 from cms_rendner_sdfv.pandas.styler.highlight_between_patcher import HighlightBetweenPatcher
 from cms_rendner_sdfv.pandas.styler.highlight_extrema_patcher import HighlightMaxPatcher, HighlightMinPatcher
 from cms_rendner_sdfv.pandas.styler.map_patcher import MapPatcher
+from cms_rendner_sdfv.pandas.styler.precomputed_css import PrecomputedCss
 from cms_rendner_sdfv.pandas.styler.style_function_name_resolver import StyleFunctionNameResolver
+from cms_rendner_sdfv.pandas.styler.styled_chunk_cache import StyledChunkCache
 from cms_rendner_sdfv.pandas.styler.styler_todo import StylerTodo
 from cms_rendner_sdfv.pandas.styler.todo_patcher import TodoPatcher
 
 
 class PatchedStylerContext(PandasTableSourceContext):
-    def __init__(self, styler: Styler, filter_criteria: Optional[FilterCriteria] = None):
+    def __init__(self,
+                 styler: Styler,
+                 filter_criteria: Optional[FilterCriteria] = None,
+                 style_precompute_max_cells: int = 0,
+                 ):
         # hidden_rows and hidden_columns can be a list or ndarray -
         # in case of an ndarray the empty check "not styler.hidden_rows"
         # raises a:
@@ -44,39 +50,81 @@ class PatchedStylerContext(PandasTableSourceContext):
         self.__has_hidden_columns: bool = len(styler.hidden_columns) > 0
         self.__styler: Styler = styler
         self.__todo_patcher_list: list[TodoPatcher] = self.__create_patchers(styler)
+        # styling of visible frames up to this number of cells is computed once for the whole visible frame,
+        # instead of once per chunk - 0 disables it
+        self.__style_precompute_max_cells: int = style_precompute_max_cells
+        self.__precomputed_css: Optional[PrecomputedCss] = None
+        # computed chunks are kept to not restyle them when scrolling back
+        self.__styled_chunk_cache = StyledChunkCache()
+        # a chunk computed during the validation of the style functions, reused for the data generation
+        self.__reusable_chunk: Optional[Chunk] = None
         super().__init__(styler.data, filter_criteria)
 
     def unlink(self):
         super().unlink()
         self.__styler = None
+        self.__precomputed_css = None
+        self.__styled_chunk_cache.clear()
+        self.__reusable_chunk = None
         [x.unlink() for x in self.__todo_patcher_list]
         self.__todo_patcher_list = None
 
+    def create_chunk_computer(self) -> ChunkComputer:
+        return ChunkComputer(
+            visible_frame=self._visible_frame,
+            org_styler=self.__styler,
+            todo_patcher_list=self.__todo_patcher_list,
+            formatter=self._formatter,
+            meta_computer=self._meta_computer,
+            precomputed_css=self.__get_precomputed_css(),
+            reusable_chunk=self.__reusable_chunk,
+        )
+
     def create_extractor_for_style_func_validation(
             self,
             chunk: DataFrame,
             patcher: TodoPatcher,
     ) -> ChunkComputer:
+        # The chunk is the whole frame of the returned computer, the patcher should be one created by
+        # "patcher_for_style_func_validation" for the chunk.
         return ChunkComputer(
             visible_frame=VisibleFrame(chunk),
             org_styler=self.__styler,
-            todo_patcher_list=[patcher.patcher_for_style_func_validation(chunk)],
+            todo_patcher_list=[patcher],
             formatter=self._formatter,
             meta_computer=MetaComputer(chunk),
         )
 
+    def reuse_chunk(self, chunk: Optional[Chunk]):
+        self.__reusable_chunk = chunk
+
+    @property
+    def styled_chunk_cache(self) -> StyledChunkCache:
+        return self.__styled_chunk_cache
+
     def get_chunk_data_generator(self):
+        # The filter and the hidden rows/columns can't change during the lifetime of a context.
+        # The key is created before the visible frame is accessed, because a progressive sort
+        # can be completed in the background in the meantime.
+        sc = self.sort_criteria
+        cache_key = (tuple(sc.by_column or ()), tuple(sc.ascending or ()), self.is_sort_complete())
         return ChunkDataGenerator(
             self._visible_frame.region,
-            ChunkComputer(
-                visible_frame=self._visible_frame,
-                org_styler=self.__styler,
-                todo_patcher_list=self.__todo_patcher_list,
-                formatter=self._formatter,
-                meta_computer=self._meta_computer,
-            ),
+            self.create_chunk_computer(),
+            cache=self.__styled_chunk_cache,
+            cache_key=cache_key,
         )
 
+    def __get_precomputed_css(self) -> Optional[PrecomputedCss]:
+        # The css is computed in the order of the source frame and stored by the cell positions of the
+        # source frame, sorting doesn't invalidate it.
+        # The filter and the hidden rows/columns can't change during the lifetime of a context.
+        if self.__precomputed_css is None and self.__todo_patcher_list:
+            rows, cols = self._visible_frame.region.frame_shape
+            if 0 < rows * cols <= self.__style_precompute_max_cells:
+                self.__precomputed_css = PrecomputedCss(self.__styler.data, self._visible_frame, self.__todo_patcher_list)
+        return self.__precomputed_css
+
     def get_todo_patcher_list(self) -> list[TodoPatcher]:
         return self.__todo_patcher_list
 
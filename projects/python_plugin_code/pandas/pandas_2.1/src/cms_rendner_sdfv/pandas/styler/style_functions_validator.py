@@ -11,21 +11,50 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Optional
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from pandas import DataFrame
 
 from cms_rendner_sdfv.base.types import Region
 from cms_rendner_sdfv.pandas.styler.chunk_computer import ChunkComputer, Chunk
+from cms_rendner_sdfv.pandas.styler.chunk_styler import CellCss
 from cms_rendner_sdfv.pandas.styler.patched_styler_context import PatchedStylerContext
 from cms_rendner_sdfv.pandas.styler.style_function_name_resolver import StyleFunctionNameResolver
 from cms_rendner_sdfv.pandas.styler.todo_patcher import TodoPatcher
 from cms_rendner_sdfv.pandas.styler.types import StyleFunctionValidationProblem, StyleFunctionInfo
 
 
+class _TimeBudgetExceeded(Exception):
+    pass
+
+
 class StyleFunctionsValidator:
-    def __init__(self, ctx: PatchedStylerContext, ignore_list: list[TodoPatcher] = None):
+    def __init__(self,
+                 ctx: PatchedStylerContext,
+                 ignore_list: list[TodoPatcher] = None,
+                 max_workers: int = 1,
+                 sample_size: int = 0,
+                 time_budget: float = 0,
+                 ):
         self.__ctx: PatchedStylerContext = ctx
         self.__ignore_list = ignore_list or []
+        # patchers are validated in parallel threads if greater than 1
+        self.__max_workers = max_workers
+        # number of randomly selected cells per validated region, only the rows or columns of a sub-chunk
+        # which contain these cells are styled and compared - 0 compares all cells
+        self.__sample_size = sample_size
+        # max seconds a validation can take, 0 disables the limit
+        self.__time_budget = time_budget
+        self.__deadline: Optional[float] = None
+        self.__sampled_cells: Optional[list[Tuple[int, int]]] = None
         self.failed_patchers: list[TodoPatcher] = []
+        # True if not all patchers were validated, because the time budget was exceeded
+        self.is_incomplete: bool = False
+        # the chunk of the validated region, can be reused to generate the chunk data
+        self.computed_chunk: Optional[Chunk] = None
 
     def validate(self, region: Optional[Region] = None) -> list[StyleFunctionValidationProblem]:
         patchers_to_validate = [
@@ -39,65 +68,122 @@ class StyleFunctionsValidator:
         if region.is_empty():
             return []
 
-        chunk_df = self.__ctx.visible_frame.to_frame(region)
-        chunk_region = Region.with_frame_shape(chunk_df.shape)
+        self.__deadline = time.monotonic() + self.__time_budget if self.__time_budget > 0 else None
+        self.__sampled_cells = self.__sample_cells(region, self.__sample_size)
 
-        validation_result = []
-        for patcher in patchers_to_validate:
-            is_equal = False
+        # The styling of the chunk is compared against the styling of its sub-chunks.
+        # The css of the chunk is taken from the same chunk which is used to generate the chunk data.
+        chunk_computer = self.__ctx.create_chunk_computer()
+        try:
+            self.computed_chunk = chunk_computer.compute(region)
+        except Exception:
+            # the failing style functions are detected by computing their css separately
+            self.computed_chunk = None
 
-            chunk_computer = self.__ctx.create_extractor_for_style_func_validation(chunk_df, patcher)
+        # Style functions which request the "chunk_parent" are validated with the chunk as chunk parent.
+        chunk_df: Optional[DataFrame] = None
+        if any(p.todo.should_provide_chunk_parent() for p in patchers_to_validate):
+            chunk_df = self.__ctx.visible_frame.to_frame(region)
 
+        def validate_patcher(patcher: TodoPatcher) -> Optional[StyleFunctionValidationProblem]:
             try:
-                chunk = chunk_computer.compute(chunk_region)
-
-                if patcher.todo.apply_args.axis_is_index():
-                    # styling is applied to each column
-                    is_equal = self.__validate_horizontal_splitted(chunk_computer, chunk)
-                elif patcher.todo.apply_args.axis_is_columns():
-                    # styling is applied to each row
-                    is_equal = self.__validate_vertical_splitted(chunk_computer, chunk)
-                else:
-                    # styling is applied to whole dataframe
-                    is_equal = self.__validate_horizontal_splitted(chunk_computer, chunk)
-                    if is_equal:
-                        is_equal = self.__validate_vertical_splitted(chunk_computer, chunk)
-
-                if not is_equal:
-                    self.failed_patchers.append(patcher)
-                    validation_result.append(
-                        StyleFunctionValidationProblem(
-                            reason="NOT_EQUAL",
-                            message="",
-                            func_info=self.__create_style_func_info(patcher),
-                        )
-                    )
-
-            except Exception as e:
+                if chunk_df is not None and patcher.todo.should_provide_chunk_parent():
+                    return self.__validate_patcher_against_chunk(chunk_df, patcher)
+                return self.__validate_patcher(chunk_computer, patcher, region)
+            except _TimeBudgetExceeded:
+                # the patcher isn't marked as failed, it will be validated again with the next region
+                self.is_incomplete = True
+                return None
+
+        if self.__max_workers > 1 and len(patchers_to_validate) > 1:
+            # The patchers are independent of each other, the results are collected in the order of the patchers.
+            with ThreadPoolExecutor(max_workers=min(self.__max_workers, len(patchers_to_validate))) as executor:
+                problems = list(executor.map(validate_patcher, patchers_to_validate))
+        else:
+            problems = [validate_patcher(p) for p in patchers_to_validate]
+
+        validation_result = []
+        for patcher, problem in zip(patchers_to_validate, problems):
+            if problem is not None:
                 self.failed_patchers.append(patcher)
-                # repr(e) gives the exception and the message string
-                # str(e) only the message string
-                validation_result.append(
-                    StyleFunctionValidationProblem(
-                        reason="EXCEPTION",
-                        message=str(e),
-                        func_info=self.__create_style_func_info(patcher),
-                    )
-                )
+                validation_result.append(problem)
 
         return validation_result
 
-    def __validate_horizontal_splitted(self, computer: ChunkComputer, chunk: Chunk) -> bool:
-        region = chunk.region
+    def __validate_patcher_against_chunk(self,
+                                         chunk_df: DataFrame,
+                                         patcher: TodoPatcher,
+                                         ) -> Optional[StyleFunctionValidationProblem]:
+        # The styling of the shared chunk can't be used as reference. A style function which accesses
+        # the chunk parent by position would produce the same wrong styling for a chunk and its
+        # sub-chunks, if both were styled against the frame of the Styler as chunk parent.
+        validation_patcher = patcher.patcher_for_style_func_validation(chunk_df)
+        computer = self.__ctx.create_extractor_for_style_func_validation(chunk_df, validation_patcher)
+        # the validation patcher isn't part of the computed chunk, its css is computed by the computer
+        return self.__validate_patcher(computer, validation_patcher, Region.with_frame_shape(chunk_df.shape))
+
+    def __validate_patcher(self,
+                           computer: ChunkComputer,
+                           patcher: TodoPatcher,
+                           region: Region,
+                           ) -> Optional[StyleFunctionValidationProblem]:
+        self.__check_time_budget()
+        try:
+            css = None if self.computed_chunk is None else self.computed_chunk.patcher_css(patcher)
+            if css is None:
+                css = computer.compute_patcher_css(patcher, region)
+
+            if patcher.todo.apply_args.axis_is_index():
+                # styling is applied to each column
+                is_equal = self.__validate_horizontal_splitted(computer, patcher, region, css)
+            elif patcher.todo.apply_args.axis_is_columns():
+                # styling is applied to each row
+                is_equal = self.__validate_vertical_splitted(computer, patcher, region, css)
+            else:
+                # styling is applied to whole dataframe
+                is_equal = self.__validate_horizontal_splitted(computer, patcher, region, css)
+                if is_equal:
+                    is_equal = self.__validate_vertical_splitted(computer, patcher, region, css)
+
+            if not is_equal:
+                return StyleFunctionValidationProblem(
+                    reason="NOT_EQUAL",
+                    message="",
+                    func_info=self.__create_style_func_info(patcher),
+                )
+
+        except _TimeBudgetExceeded:
+            raise
+        except Exception as e:
+            # repr(e) gives the exception and the message string
+            # str(e) only the message string
+            return StyleFunctionValidationProblem(
+                reason="EXCEPTION",
+                message=str(e),
+                func_info=self.__create_style_func_info(patcher),
+            )
+
+        return None
+
+    def __validate_horizontal_splitted(self,
+                                       computer: ChunkComputer,
+                                       patcher: TodoPatcher,
+                                       region: Region,
+                                       css: list[CellCss],
+                                       ) -> bool:
         for sub_region in region.iterate_local_chunkwise(self.__half_or_one(region.rows), region.cols):
-            if not self.__has_same_cell_styling(chunk, computer.compute(sub_region)):
+            if not self.__has_same_cell_styling(computer, patcher, region, css, sub_region):
                 return False
         return True
 
-    def __validate_vertical_splitted(self, computer: ChunkComputer, chunk: Chunk) -> bool:
-        region = chunk.region
+    def __validate_vertical_splitted(self,
+                                     computer: ChunkComputer,
+                                     patcher: TodoPatcher,
+                                     region: Region,
+                                     css: list[CellCss],
+                                     ) -> bool:
         for sub_region in region.iterate_local_chunkwise(region.rows, self.__half_or_one(region.cols)):
-            if not self.__has_same_cell_styling(chunk, computer.compute(sub_region)):
+            if not self.__has_same_cell_styling(computer, patcher, region, css, sub_region):
                 return False
         return True
 
@@ -116,17 +202,77 @@ class StyleFunctionsValidator:
             is_chunk_parent_requested=todo.should_provide_chunk_parent(),
         )
 
-    @staticmethod
-    def __has_same_cell_styling(chunk: Chunk, sub_chunk: Chunk) -> bool:
-        sub_region = sub_chunk.region
-        for r in range(sub_region.rows):
-            for c in range(sub_region.cols):
-                expected = chunk.cell_value_at(sub_region.first_row + r, sub_region.first_col + c)
-                actual = sub_chunk.cell_value_at(r, c)
-                if expected != actual:
-                    return False
+    def __has_same_cell_styling(self,
+                                computer: ChunkComputer,
+                                patcher: TodoPatcher,
+                                region: Region,
+                                css: list[CellCss],
+                                local_sub_region: Region,
+                                ) -> bool:
+        if self.__sampled_cells is None:
+            return self.__has_same_css(computer, patcher, region, css, local_sub_region)
+
+        first_row, first_col = local_sub_region.first_row, local_sub_region.first_col
+        cells = [
+            (r, c) for r, c in self.__sampled_cells
+            if first_row <= r < first_row + local_sub_region.rows and first_col <= c < first_col + local_sub_region.cols
+        ]
+        if not cells:
+            return True
+
+        for sampled_region in self.__sampled_sub_regions(patcher, local_sub_region, cells):
+            if not self.__has_same_css(computer, patcher, region, css, sampled_region):
+                return False
+        return True
+
+    def __has_same_css(self,
+                       computer: ChunkComputer,
+                       patcher: TodoPatcher,
+                       region: Region,
+                       css: list[CellCss],
+                       local_sub_region: Region,
+                       ) -> bool:
+        self.__check_time_budget()
+        sub_css = computer.compute_patcher_css(patcher, local_sub_region.translate(region.first_row, region.first_col))
+        sub_cols = local_sub_region.cols
+        for r in range(local_sub_region.rows):
+            start = (local_sub_region.first_row + r) * region.cols + local_sub_region.first_col
+            if css[start:start + sub_cols] != sub_css[r * sub_cols:(r + 1) * sub_cols]:
+                return False
         return True
 
+    @staticmethod
+    def __sampled_sub_regions(patcher: TodoPatcher,
+                              local_sub_region: Region,
+                              cells: list[Tuple[int, int]],
+                              ) -> list[Region]:
+        # Only the parts of the sub-region which contain sampled cells are styled.
+        sub = local_sub_region
+        if patcher.todo.apply_args.axis_is_index():
+            # styling is applied to each column
+            return [Region(sub.first_row, c, sub.rows, 1) for c in sorted({c for _, c in cells})]
+        if patcher.todo.apply_args.axis_is_columns():
+            # styling is applied to each row
+            return [Region(r, sub.first_col, 1, sub.cols) for r in sorted({r for r, _ in cells})]
+        # styling is applied to whole dataframe, the smallest region which contains all sampled cells is used
+        rows = [r for r, _ in cells]
+        cols = [c for _, c in cells]
+        return [Region(min(rows), min(cols), max(rows) - min(rows) + 1, max(cols) - min(cols) + 1)]
+
+    @staticmethod
+    def __sample_cells(region: Region, sample_size: int) -> Optional[list[Tuple[int, int]]]:
+        # local cell coordinates of the region, None if all cells have to be compared
+        cells = region.rows * region.cols
+        if sample_size <= 0 or sample_size >= cells:
+            return None
+        # The sample is seeded by the region, a region has to give the same validation result for every request.
+        rng = random.Random(f"{region.first_row}-{region.first_col}-{region.rows}-{region.cols}")
+        return sorted(divmod(i, region.cols) for i in rng.sample(range(cells), sample_size))
+
+    def __check_time_budget(self):
+        if self.__deadline is not None and time.monotonic() > self.__deadline:
+            raise _TimeBudgetExceeded()
+
     @staticmethod
     def __half_or_one(number: int):
         # expect: number > 0
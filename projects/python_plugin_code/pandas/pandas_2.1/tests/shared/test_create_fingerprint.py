@@ -30,3 +30,19 @@ def test_different_frames_with_same_source_have_same_fingerprint():
     f1 = create_fingerprint(a, df_dict)
     f2 = create_fingerprint(b, df_dict)
     assert f1 == f2
+
+
+def test_content_sample_detects_in_place_modifications():
+    frame = pd.DataFrame.from_dict(df_dict)
+    f1 = create_fingerprint(frame, with_content_sample=True)
+    frame.iloc[0, 0] = 99
+    f2 = create_fingerprint(frame, with_content_sample=True)
+    assert f1 != f2
+
+
+def test_content_sample_is_optional():
+    frame = pd.DataFrame.from_dict(df_dict)
+    f1 = create_fingerprint(frame)
+    frame.iloc[0, 0] = 99
+    f2 = create_fingerprint(frame)
+    assert f1 == f2
@@ -65,6 +65,79 @@ def test_styled_chunk_uses_formatting_from_org_styler():
     assert chunk_data.cells[0][2] == Cell(value='+2.00', meta=CellMeta.min().pack())
 
 
+def test_precomputed_styling_matches_chunk_styling():
+    def create_styler():
+        return df.style \
+            .highlight_max(axis=0, props="color: red") \
+            .map(lambda v: "background-color: blue" if v % 2 == 0 else None) \
+            .hide(axis="index", subset=[1]) \
+            .hide(axis="columns", subset=["col_2"])
+
+    fc = FilterCriteria.from_frame(df[["col_4", "col_1", "col_2", "col_0"]])
+    expected_ctx = PatchedStylerContext(create_styler(), fc)
+    actual_ctx = PatchedStylerContext(create_styler(), fc, style_precompute_max_cells=df.size)
+
+    precomputed_css = []
+    for sort_ascending in [[True], [False]]:
+        expected_ctx.set_sort_criteria(sort_by_column_index=[1], sort_ascending=sort_ascending)
+        actual_ctx.set_sort_criteria(sort_by_column_index=[1], sort_ascending=sort_ascending)
+
+        expected = expected_ctx.get_chunk_data_generator().generate_by_combining_chunks(2, 2)
+        actual = actual_ctx.get_chunk_data_generator().generate_by_combining_chunks(2, 2)
+        assert actual == expected
+        precomputed_css.append(actual_ctx._PatchedStylerContext__precomputed_css)
+
+    # computed only once, sorting doesn't change the css of a cell
+    assert precomputed_css[0] is not None
+    assert precomputed_css[0] is precomputed_css[1]
+
+
+def test_styling_is_not_precomputed_above_max_cells():
+    ctx = PatchedStylerContext(df.style.highlight_max(), style_precompute_max_cells=df.size - 1)
+    ctx.get_chunk_data_generator().generate()
+    assert ctx._PatchedStylerContext__precomputed_css is None
+
+
+def test_precomputed_styling_does_not_depend_on_sort_order_of_first_request():
+    def create_styler():
+        return df.style.apply(lambda s: ['color: red' if i == 0 else None for i in range(len(s))])
+
+    expected = PatchedStylerContext(create_styler()).get_chunk_data_generator().generate()
+
+    ctx = PatchedStylerContext(create_styler(), style_precompute_max_cells=df.size)
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[False])
+    ctx.get_chunk_data_generator().generate()
+    ctx.set_sort_criteria(sort_by_column_index=None, sort_ascending=None)
+
+    assert ctx.get_chunk_data_generator().generate() == expected
+
+
+def test_revisited_chunks_are_taken_from_cache():
+    ctx = PatchedStylerContext(df.style.highlight_max())
+    cache = ctx.styled_chunk_cache
+
+    first = ctx.get_chunk_data_generator().generate_by_combining_chunks(2, 2)
+    assert (cache.hits, cache.misses) == (0, 9)
+
+    second = ctx.get_chunk_data_generator().generate_by_combining_chunks(2, 2)
+    assert (cache.hits, cache.misses) == (9, 9)
+    assert second == first
+
+
+def test_cached_chunks_are_not_used_for_other_sort_order():
+    expected_ctx = PatchedStylerContext(df.style.highlight_max())
+    expected_ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[False])
+    expected = expected_ctx.get_chunk_data_generator().generate_by_combining_chunks(2, 2)
+
+    ctx = PatchedStylerContext(df.style.highlight_max())
+    ctx.get_chunk_data_generator().generate_by_combining_chunks(2, 2)
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[False])
+    actual = ctx.get_chunk_data_generator().generate_by_combining_chunks(2, 2)
+
+    assert actual == expected
+    assert ctx.styled_chunk_cache.hits == 0
+
+
 def test_detects_supported_pandas_style_funcs():
     styler = df.style \
         .background_gradient() \
@@ -0,0 +1,26 @@
+from cms_rendner_sdfv.base.types import ChunkDataResponse, Cell
+from cms_rendner_sdfv.pandas.styler.styled_chunk_cache import StyledChunkCache
+
+
+def _chunk(value: str) -> ChunkDataResponse:
+    return ChunkDataResponse(row_headers=[['0']], cells=[[Cell(value=value)]])
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = StyledChunkCache(max_entries=2)
+    cache.put('a', _chunk('a'))
+    cache.put('b', _chunk('b'))
+    assert cache.get('a') is not None
+
+    cache.put('c', _chunk('c'))
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_entries_are_evicted_above_max_bytes():
+    cache = StyledChunkCache(max_bytes=1)
+    cache.put('a', _chunk('a'))
+    assert cache.get('a') is None
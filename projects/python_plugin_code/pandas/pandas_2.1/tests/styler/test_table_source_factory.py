@@ -54,6 +54,14 @@ def test_create_for_styler():
     )
 
 
+def test_style_precompute_is_opt_in():
+    table_source = _create_table_source(df.style)
+    assert table_source._context._PatchedStylerContext__style_precompute_max_cells == 0
+
+    table_source = _create_table_source(df.style, CreateTableSourceConfig(style_precompute=True))
+    assert table_source._context._PatchedStylerContext__style_precompute_max_cells > 0
+
+
 def test_create_fails_on_unsupported_data_source():
     result = _create_table_source({})
 
@@ -13,6 +13,9 @@
 #  limitations under the License.
 from typing import Any
 
+import numpy as np
+from pandas import Index
+
 from cms_rendner_sdfv.base.table_source import ChunkDataGenerator as BaseChunkDataGenerator
 from cms_rendner_sdfv.base.types import Region, Cell, ChunkDataResponse
 from cms_rendner_sdfv.pandas.frame.frame_value_formatter import FrameValueFormatter
@@ -32,27 +35,40 @@ class ChunkDataGenerator(BaseChunkDataGenerator):
         self.__meta_computer = meta_computer
 
     def _compute_cells(self, region: Region, response: ChunkDataResponse):
-        response.cells = []
-        col_range = range(region.cols)
-        for r in range(region.rows):
-            row_cells = []
-            response.cells.append(row_cells)
-            for c in col_range:
-                row_cells.append(self.__chunk_cell_value_at(region, r, c))
+        col_cells = [self.__chunk_column_cells_at(region, c) for c in range(region.cols)]
+        response.cells = [list(row) for row in zip(*col_cells)] if col_cells else [[] for _ in range(region.rows)]
 
     def _compute_row_headers(self, region: Region, response: ChunkDataResponse):
+        levels = self.__visible_frame.index_levels
+        if levels is not None:
+            response.row_headers = self.__chunk_multi_index_row_labels(region, levels)
+            return
         response.row_headers = []
         for r in range(region.rows):
             response.row_headers.append(self.__chunk_row_labels_at(region, r))
 
-    def __chunk_cell_value_at(self, region: Region, row: int, col: int) -> Cell:
-        value = self.__visible_frame.cell_value_at(
-            region.first_row + row,
-            region.first_col + col,
-        )
-        _, org_col = self.__visible_frame.to_source_frame_cell_coordinates(region.first_row + row, region.first_col + col)
-        meta = self.__meta_computer.compute_cell_meta(org_col, value)
-        return Cell(value=self.__formatter.format_cell(value), meta=meta)
+    def __chunk_multi_index_row_labels(self, region: Region, levels: list[Index]) -> list[list[str]]:
+        # The labels of a MultiIndex are built from the codes of its levels.
+        # Each distinct label of a level is formatted only once, instead of once per row.
+        formatted_levels = []
+        for level, codes in zip(levels, self.__visible_frame.row_label_codes_at(region)):
+            unique_codes, inverse = np.unique(codes, return_inverse=True)
+            formatted = np.array(
+                # same label as returned by "MultiIndex.__getitem__" for a missing label
+                [self.__formatter.format_index(level._na_value if c == -1 else level[c]) for c in unique_codes],
+                dtype=object,
+            )
+            formatted_levels.append(formatted[inverse.reshape(-1)])
+        return [list(labels) for labels in zip(*formatted_levels)]
+
+    def __chunk_column_cells_at(self, region: Region, col: int) -> list[Cell]:
+        values = self.__visible_frame.column_values_at(region.first_col + col, region)
+        if len(values) == 0:
+            return []
+        _, org_col = self.__visible_frame.to_source_frame_cell_coordinates(region.first_row, region.first_col + col)
+        metas = self.__meta_computer.compute_column_meta(org_col, values)
+        formatted = self.__formatter.format_column_values(values, values.dtype)
+        return [Cell(value=v, meta=m) for v, m in zip(formatted, metas)]
 
     def __chunk_row_labels_at(self, region: Region, row: int) -> list[Any]:
         labels = self.__visible_frame.row_labels_at(region.first_row + row)
@@ -22,9 +22,18 @@ from cms_rendner_sdfv.pandas.styler.types import ValidatedChunkData
 
 
 class PatchedStyler(AbstractTableSource):
-    def __init__(self, context: PatchedStylerContext, fingerprint: str):
+    def __init__(self,
+                 context: PatchedStylerContext,
+                 fingerprint: str,
+                 validation_workers: int = 1,
+                 validation_sample_size: int = 0,
+                 validation_time_budget: float = 0,
+                 ):
         super().__init__(TableSourceKind.PATCHED_STYLER, context, fingerprint)
         self.__patchers_to_skip_in_validation: list[TodoPatcher] = []
+        self.__validation_workers = validation_workers
+        self.__validation_sample_size = validation_sample_size
+        self.__validation_time_budget = validation_time_budget
 
     def validate_and_compute_chunk_data(self,
                                         region: Region,
@@ -33,11 +42,23 @@ class PatchedStyler(AbstractTableSource):
         validator = StyleFunctionsValidator(
             self._context,
             self.__patchers_to_skip_in_validation,
+            max_workers=self.__validation_workers,
+            sample_size=self.__validation_sample_size,
+            time_budget=self.__validation_time_budget,
         )
-        problems = validator.validate(region)
+        # The validation uses the same patchers and caches as a prefetch of a chunk in the background.
+        with self._exclusive_chunk_computation():
+            problems = validator.validate(region)
+            # the chunk computed by the validator is reused, instead of computing the same region again
+            self._context.reuse_chunk(validator.computed_chunk)
+            try:
+                data = self._generate_chunk_data(region, request)
+            finally:
+                self._context.reuse_chunk(None)
         result = ValidatedChunkData(
-            data=self._context.get_chunk_data_generator().generate(region=region, request=request),
+            data=data,
             problems=problems if problems else None,
+            validation_incomplete=validator.is_incomplete,
         )
         self.__patchers_to_skip_in_validation.extend(validator.failed_patchers)
         return self.serialize(result)
@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 from typing import Literal
 
+from cms_rendner_sdfv.base.types import Region
 from cms_rendner_sdfv.pandas.shared.value_formatter import ValueFormatter
 from cms_rendner_sdfv.pandas.shared.visible_frame import MappedVisibleFrame
 
@@ -46,6 +47,12 @@ def test_cell_value_at():
     assert vf.cell_value_at(0, 1) == "4"
 
 
+def test_column_values_at():
+    vf = _create_visible_frame()
+    assert list(vf.column_values_at(0)) == [4, 4]
+    assert list(vf.column_values_at(1, Region(1, 0, 1, 2))) == ["4"]
+
+
 def test_row_labels_at():
     vf = _create_visible_frame()
     assert vf.row_labels_at(0) == [0]
@@ -83,3 +90,23 @@ def test_get_column_statistics():
         'mean': '4.0',
         'min': '4.0'
     }
+
+
+def test_get_columns_statistics():
+    vf = _create_visible_frame()
+
+    formatter = ValueFormatter()
+    actual = vf.get_columns_statistics([1, 0], formatter)
+    assert actual == {col: vf.get_column_statistics(col, formatter) for col in [1, 0]}
+
+
+def test_positions_are_stored_compact():
+    vf = MappedVisibleFrame(df, visible_rows=np.array([4, 0, 2]), visible_cols=np.array([1, 2, 3]))
+    assert vf._MappedVisibleFrame__i_rows.dtype == np.uint8
+    assert vf._MappedVisibleFrame__i_cols == range(1, 4)
+
+    assert vf.region.rows == 3
+    assert vf.get_column_indices() == [1, 2, 3]
+    assert vf.to_source_frame_cell_coordinates(0, 0) == (4, 1)
+    assert list(vf.column_values_at(0)) == ["2", "1", "4"]
+    assert vf.to_frame(vf.region).equals(df.iloc[[4, 0, 2], [1, 2, 3]])
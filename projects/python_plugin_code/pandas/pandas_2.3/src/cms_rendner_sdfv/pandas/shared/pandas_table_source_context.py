@@ -11,21 +11,24 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import threading
 from abc import ABC, abstractmethod
 from typing import Optional, Any, List, Union
 
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, RangeIndex
 from pandas.api.types import is_numeric_dtype
 from pandas.core.dtypes.common import is_bool_dtype
 
+from cms_rendner_sdfv.base.constants import PROGRESSIVE_SORT_WINDOW_SIZE
 from cms_rendner_sdfv.base.helpers import fq_type
-from cms_rendner_sdfv.base.table_source import AbstractTableSourceContext
+from cms_rendner_sdfv.base.table_source import AbstractTableSourceContext, SortPermutationCache
 from cms_rendner_sdfv.base.types import SortCriteria, TableStructure, TableStructureColumnInfo, CompletionVariant, \
     NestedCompletionVariant, TextAlign
 from cms_rendner_sdfv.pandas.shared.meta_computer import MetaComputer
 from cms_rendner_sdfv.pandas.shared.types import FilterCriteria
 from cms_rendner_sdfv.pandas.shared.value_formatter import ValueFormatter
-from cms_rendner_sdfv.pandas.shared.visible_frame import VisibleFrame, MappedVisibleFrame
+from cms_rendner_sdfv.pandas.shared.visible_frame import VisibleFrame, MappedVisibleFrame, compact_positions
 
 
 class PandasTableSourceContext(AbstractTableSourceContext, ABC):
@@ -37,14 +40,33 @@ class PandasTableSourceContext(AbstractTableSourceContext, ABC):
         self.__source_frame = source_frame
         self.__sort_criteria: SortCriteria = SortCriteria()
         self.__filter_criteria: FilterCriteria = filter_criteria if filter_criteria is not None else FilterCriteria()
+        # the filter can't change during the lifetime of a context, therefore the sort criteria is used as key
+        self.__sort_permutation_cache = SortPermutationCache(size_of=lambda p: getattr(p, 'nbytes', 0))
+        # the statistics don't depend on the sorting, therefore the column index is used as key
+        self.__column_statistics_cache: dict[int, dict[str, str]] = {}
+        # rows of the leading window which are sorted before the full sort is completed, 0 disables it
+        self.__progressive_sort_window_size: int = 0
+        # sort criteria of the visible frame, if only its leading window is sorted
+        self.__incomplete_sort_criteria: Optional[SortCriteria] = None
+        # True if the full sort, completed in the background, failed
+        self.__is_sort_failed: bool = False
+        # synchronizes the replacement of the visible frame by a sort completed in the background
+        self.__sort_lock = threading.Lock()
         self._visible_frame: VisibleFrame = self.__recompute_visible_frame()
         self._formatter = formatter if formatter is not None else ValueFormatter()
         self._meta_computer = MetaComputer(source_frame)
 
     def unlink(self):
+        with self.__sort_lock:
+            self.__unlink()
+
+    def __unlink(self):
         self.__source_frame = None
         self.__sort_criteria = None
         self.__filter_criteria = None
+        self.__sort_permutation_cache.clear()
+        self.__sort_permutation_cache = None
+        self.__column_statistics_cache = None
         self._visible_frame.unlink()
         self._visible_frame = None
         self._meta_computer.unlink()
@@ -54,6 +76,10 @@ class PandasTableSourceContext(AbstractTableSourceContext, ABC):
     def visible_frame(self) -> VisibleFrame:
         return self._visible_frame
 
+    @property
+    def sort_criteria(self) -> SortCriteria:
+        return self.__sort_criteria
+
     def get_table_structure(self, fingerprint: str) -> TableStructure:
         rows_count = self._visible_frame.region.rows
         columns_count = self._visible_frame.region.cols
@@ -70,7 +96,13 @@ class PandasTableSourceContext(AbstractTableSourceContext, ABC):
         )
 
     def get_column_statistics(self, col_index: int):
-        return self._visible_frame.get_column_statistics(col_index, self._formatter)
+        return self.get_columns_statistics([col_index])[col_index]
+
+    def get_columns_statistics(self, col_indices: list[int]) -> dict[int, dict[str, str]]:
+        missing = [col for col in dict.fromkeys(col_indices) if col not in self.__column_statistics_cache]
+        if missing:
+            self.__column_statistics_cache.update(self._visible_frame.get_columns_statistics(missing, self._formatter))
+        return {col: self.__column_statistics_cache[col] for col in col_indices}
 
     @abstractmethod
     def _get_frame_column_info(self) -> TableStructureColumnInfo:
@@ -101,9 +133,19 @@ class PandasTableSourceContext(AbstractTableSourceContext, ABC):
 
     def set_sort_criteria(self, sort_by_column_index: Optional[list[int]], sort_ascending: Optional[list[bool]]):
         new_sort_criteria = SortCriteria(sort_by_column_index, sort_ascending)
-        if new_sort_criteria != self.__sort_criteria:
-            self.__sort_criteria = new_sort_criteria
-            self._visible_frame = self.__recompute_visible_frame()
+        with self.__sort_lock:
+            if new_sort_criteria != self.__sort_criteria or self.__is_sort_failed:
+                self.__sort_criteria = new_sort_criteria
+                self._visible_frame = self.__recompute_visible_frame()
+
+    def precompute_min_max(self, in_background: bool = False):
+        self._meta_computer.precompute_min_max(in_background)
+
+    def enable_progressive_sort(self, window_size: int = PROGRESSIVE_SORT_WINDOW_SIZE):
+        self.__progressive_sort_window_size = window_size
+
+    def is_sort_complete(self) -> bool:
+        return self.__incomplete_sort_criteria is None
 
     @staticmethod
     def _get_column_text_align(col_dtype: Any) -> Union[None, TextAlign]:
@@ -123,20 +165,99 @@ class PandasTableSourceContext(AbstractTableSourceContext, ABC):
         if self.__filter_criteria.columns is not None:
             columns = columns.intersection(self.__filter_criteria.columns)
 
+        col_positions = self.__source_frame.columns.get_indexer_for(columns)
+        self.__incomplete_sort_criteria = None
+        self.__is_sort_failed = False
+
+        row_positions = None
         if not self.__sort_criteria.is_empty():
             sc = self.__sort_criteria
-            frame = self.__source_frame.loc[index, columns]
-            frame = frame.sort_values(
-                by=[frame.columns[i] for i in sc.by_column],
-                ascending=True if sc.ascending is None or len(sc.ascending) == 0 else sc.ascending,
-            )
-            index = frame.index
-
-        if index is self.__source_frame.index and columns is self.__source_frame.columns:
+            row_positions = self.__sort_permutation_cache.get(sc)
+            if row_positions is None:
+                filtered_row_positions = self.__source_frame.index.get_indexer_for(index)
+                if self.__progressive_sort_window_size > 0:
+                    row_positions = self.__compute_leading_sorted_row_positions(sc, filtered_row_positions, col_positions)
+                if row_positions is None:
+                    row_positions = compact_positions(
+                        self.__compute_sorted_row_positions(sc, filtered_row_positions, col_positions),
+                    )
+                    self.__sort_permutation_cache.put(sc, row_positions)
+                else:
+                    # the first chunks can already be displayed, the full sort is completed in the background
+                    self.__incomplete_sort_criteria = sc
+                    threading.Thread(
+                        target=self.__complete_sort,
+                        args=(sc, filtered_row_positions, col_positions),
+                        daemon=True,
+                    ).start()
+        elif index is self.__source_frame.index and columns is self.__source_frame.columns:
             return VisibleFrame(self.__source_frame)
+        else:
+            row_positions = self.__source_frame.index.get_indexer_for(index)
+
+        return MappedVisibleFrame(self.__source_frame, row_positions, col_positions)
+
+    def __compute_sorted_row_positions(self,
+                                       sc: SortCriteria,
+                                       row_positions: np.ndarray,
+                                       col_positions: np.ndarray,
+                                       ) -> np.ndarray:
+        # Only the columns to sort by are taken from the source frame, to not copy the whole frame.
+        # The keys are sorted by "sort_values" to keep the pandas semantic for NaN values and mixed types.
+        keys = self.__source_frame.iloc[row_positions, [col_positions[i] for i in sc.by_column]]
+        keys.index = RangeIndex(len(keys))
+        keys.columns = RangeIndex(len(keys.columns))
+        keys = keys.sort_values(
+            by=list(keys.columns),
+            ascending=True if sc.ascending is None or len(sc.ascending) == 0 else sc.ascending,
+            # a stable sort ensures that the leading window of a progressive sort matches the full sort
+            kind='stable' if self.__progressive_sort_window_size > 0 else 'quicksort',
+        )
+        return row_positions[keys.index.to_numpy()]
+
+    def __compute_leading_sorted_row_positions(self,
+                                               sc: SortCriteria,
+                                               row_positions: np.ndarray,
+                                               col_positions: np.ndarray,
+                                               ) -> Optional[np.ndarray]:
+        # Only the leading window is sorted, by a partial sort of a single column.
+        # The remaining rows follow in their unsorted order until the full sort is completed.
+        window_size = self.__progressive_sort_window_size
+        if len(sc.by_column) != 1 or len(row_positions) <= window_size:
+            return None
+
+        keys = self.__source_frame.iloc[row_positions, col_positions[sc.by_column[0]]]
+        if not is_numeric_dtype(keys.dtype) or is_bool_dtype(keys.dtype):
+            return None
+        keys = keys.reset_index(drop=True)
+        ascending = True if sc.ascending is None or len(sc.ascending) == 0 else sc.ascending[0]
+        leading = keys.nsmallest(window_size, keep='first') if ascending else keys.nlargest(window_size, keep='first')
+        if len(leading) < window_size:
+            # NaN values, which are sorted to the end, would be part of the leading window
+            return None
+
+        leading_positions = leading.index.to_numpy()
+        remaining = np.ones(len(row_positions), dtype=bool)
+        remaining[leading_positions] = False
+        return np.concatenate([row_positions[leading_positions], row_positions[remaining]])
+
+    def __complete_sort(self, sc: SortCriteria, row_positions: np.ndarray, col_positions: np.ndarray):
+        try:
+            sorted_row_positions = compact_positions(self.__compute_sorted_row_positions(sc, row_positions, col_positions))
+        except Exception:
+            sorted_row_positions = None
 
-        return MappedVisibleFrame(
-                self.__source_frame,
-                self.__source_frame.index.get_indexer_for(index).tolist(),
-                self.__source_frame.columns.get_indexer_for(columns).tolist(),
-            )
+        with self.__sort_lock:
+            if self.__source_frame is None:
+                # context was unlinked in the meantime
+                return
+            if sorted_row_positions is not None:
+                self.__sort_permutation_cache.put(sc, sorted_row_positions)
+            if self.__incomplete_sort_criteria == sc:
+                if sorted_row_positions is None:
+                    # The sort stays incomplete, the visible frame is only sorted in its leading window.
+                    # The next sort criteria is applied even if it is equal, to allow the user to re-apply the sort.
+                    self.__is_sort_failed = True
+                else:
+                    self.__incomplete_sort_criteria = None
+                    self._visible_frame = MappedVisibleFrame(self.__source_frame, sorted_row_positions, col_positions)
@@ -11,9 +11,10 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Dict, Any
+from typing import Dict, Any, Union
 
-from pandas import DataFrame, Series
+import numpy as np
+from pandas import DataFrame, Index, MultiIndex, Series
 
 from cms_rendner_sdfv.base.types import Region
 from cms_rendner_sdfv.pandas.shared.value_formatter import ValueFormatter
@@ -38,15 +39,38 @@ class VisibleFrame:
     def column_names(self) -> list:
         return self._source_frame.columns.names
 
+    @property
+    def index_levels(self) -> Union[None, list[Index]]:
+        index = self._source_frame.index
+        return list(index.levels) if isinstance(index, MultiIndex) else None
+
     def cell_value_at(self, row: int, col: int):
         return self._source_frame.iat[row, col]
 
+    def column_values_at(self, col: int, region: Region = None) -> Any:
+        r = self.region.get_bounded_region(region)
+        # "_values" are the underlying values of the column, a numpy array or an ExtensionArray,
+        # the items of both are of the same type as the ones returned by "iat"
+        values = self._source_frame.iloc[:, col]._values
+        return values[r.first_row:r.first_row + r.rows]
+
     def row_labels_at(self, row: int) -> list[Any]:
         labels = self._source_frame.index[row]
         if self._source_frame.index.nlevels == 1:
             return [labels]
         return list(labels)
 
+    def row_label_codes_at(self, region: Region = None) -> list[np.ndarray]:
+        # The codes of each level of a MultiIndex, a code is the position of a label in its level.
+        # A code of -1 marks a missing label.
+        positions = self.row_positions_at(region)
+        return [_take(np.asarray(codes), positions) for codes in self._source_frame.index.codes]
+
+    def row_positions_at(self, region: Region = None) -> Union[range, np.ndarray]:
+        # the positions of the rows of the region in the source frame
+        r = self.region.get_bounded_region(region)
+        return range(r.first_row, r.first_row + r.rows)
+
     def to_frame(self, region: Region) -> DataFrame:
         r = self.region.get_bounded_region(region)
         return self._source_frame.iloc[
@@ -60,6 +84,9 @@ class VisibleFrame:
     def _get_col_series(self, col_index) -> Series:
         return self._source_frame.iloc[:, col_index]
 
+    def _get_cols_frame(self, col_indices: list[int]) -> DataFrame:
+        return self._source_frame.iloc[:, col_indices]
+
     def get_column_statistics(self, col_index: int, formatter: ValueFormatter) -> Dict[str, str]:
         try:
             col_series = self._get_col_series(col_index)
@@ -70,13 +97,67 @@ class VisibleFrame:
         except TypeError as e:
             return {'error': str(e)}
 
+    def get_columns_statistics(self, col_indices: list[int], formatter: ValueFormatter) -> Dict[int, Dict[str, str]]:
+        result = {}
+        frame = self._get_cols_frame(col_indices)
+
+        # Columns of the same dtype are described together, the result of "describe" depends on the dtypes.
+        # This ensures that the statistics are the same as if they were computed for each column separately.
+        positions_by_dtype: Dict[Any, list[int]] = {}
+        for pos, dtype in enumerate(frame.dtypes):
+            positions_by_dtype.setdefault(dtype, []).append(pos)
+
+        for positions in positions_by_dtype.values():
+            try:
+                described = frame.iloc[:, positions].describe()
+            except TypeError:
+                described = None
+
+            if described is None or described.shape[1] != len(positions):
+                for pos in positions:
+                    result[col_indices[pos]] = self.get_column_statistics(col_indices[pos], formatter)
+                continue
+
+            for pos, (_, col_stats) in zip(positions, described.items()):
+                result[col_indices[pos]] = {
+                    k: formatter.format_column_statistic_entry(v)
+                    for k, v in col_stats.to_dict().items()
+                }
+
+        return result
+
+
+def compact_positions(positions: Any) -> Union[range, np.ndarray]:
+    # Positions can be stored for millions of rows, therefore they are stored as compact as possible.
+    # A contiguous run of positions is stored as range, otherwise the smallest unsigned integer dtype is used.
+    if isinstance(positions, range):
+        return positions
+    positions = np.asarray(positions)
+    if len(positions) == 0:
+        return range(0)
+    first = int(positions[0])
+    if int(positions[-1]) - first == len(positions) - 1 and np.all(np.diff(positions) == 1):
+        return range(first, first + len(positions))
+    return positions.astype(np.min_scalar_type(int(positions.max())), copy=False)
+
+
+def _as_indexer(positions: Union[range, np.ndarray]) -> Union[slice, np.ndarray]:
+    # a slice selects a view instead of a copy
+    return slice(positions.start, positions.stop) if isinstance(positions, range) else positions
+
+
+def _take(values: Any, positions: Union[range, np.ndarray]) -> Any:
+    if isinstance(positions, range):
+        return values[positions.start:positions.stop]
+    return values.take(positions)
+
 
 class MappedVisibleFrame(VisibleFrame):
-    def __init__(self, source_frame: DataFrame, visible_rows: list[int], visible_cols: list[int]):
+    def __init__(self, source_frame: DataFrame, visible_rows: Any, visible_cols: Any):
         super().__init__(source_frame)
-        self.region = Region(first_row=0, first_col=0, rows=len(visible_rows), cols=len(visible_cols))
-        self.__i_rows = visible_rows
-        self.__i_cols = visible_cols
+        self.__i_rows = compact_positions(visible_rows)
+        self.__i_cols = compact_positions(visible_cols)
+        self.region = Region(first_row=0, first_col=0, rows=len(self.__i_rows), cols=len(self.__i_cols))
 
     def unlink(self):
         super().unlink()
@@ -84,25 +165,37 @@ class MappedVisibleFrame(VisibleFrame):
         self.__i_cols = None
 
     def cell_value_at(self, row: int, col: int):
-        return self._source_frame.iat[self.__i_rows[row], self.__i_cols[col]]
+        return self._source_frame.iat[int(self.__i_rows[row]), int(self.__i_cols[col])]
+
+    def column_values_at(self, col: int, region: Region = None) -> Any:
+        r = self.region.get_bounded_region(region)
+        values = self._source_frame.iloc[:, int(self.__i_cols[col])]._values
+        return _take(values, self.__i_rows[r.first_row:r.first_row + r.rows])
 
     def row_labels_at(self, row: int):
-        labels = self._source_frame.index[self.__i_rows[row]]
+        labels = self._source_frame.index[int(self.__i_rows[row])]
         if self._source_frame.index.nlevels == 1:
             return [labels]
         return list(labels)
 
+    def row_positions_at(self, region: Region = None) -> Union[range, np.ndarray]:
+        r = self.region.get_bounded_region(region)
+        return self.__i_rows[r.first_row:r.first_row + r.rows]
+
     def to_frame(self, region: Region):
         r = self.region.get_bounded_region(region)
         i_rows = self.__i_rows[r.first_row:r.first_row + r.rows]
         i_cols = self.__i_cols[r.first_col:r.first_col + r.cols]
-        return self._source_frame.iloc[i_rows, i_cols]
+        return self._source_frame.iloc[_as_indexer(i_rows), _as_indexer(i_cols)]
 
     def to_source_frame_cell_coordinates(self, row: int, col: int):
-        return self.__i_rows[row], self.__i_cols[col]
+        return int(self.__i_rows[row]), int(self.__i_cols[col])
 
     def get_column_indices(self):
-        return self.__i_cols
+        return [int(c) for c in self.__i_cols]
 
     def _get_col_series(self, col_index) -> Series:
-        return self._source_frame.iloc[self.__i_rows, self.__i_cols[col_index]]
+        return self._source_frame.iloc[_as_indexer(self.__i_rows), int(self.__i_cols[col_index])]
+
+    def _get_cols_frame(self, col_indices: list[int]) -> DataFrame:
+        return self._source_frame.iloc[_as_indexer(self.__i_rows), [int(self.__i_cols[c]) for c in col_indices]]
@@ -11,7 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Any
+from typing import Any, Optional
 
 from pandas.io.formats.style import Styler
 
@@ -19,18 +19,25 @@ from cms_rendner_sdfv.base.types import Region, Cell
 from cms_rendner_sdfv.pandas.shared.meta_computer import MetaComputer
 from cms_rendner_sdfv.pandas.shared.value_formatter import ValueFormatter
 from cms_rendner_sdfv.pandas.shared.visible_frame import VisibleFrame
+from cms_rendner_sdfv.pandas.styler.chunk_styler import ChunkStyler, CellCss
+from cms_rendner_sdfv.pandas.styler.precomputed_css import PrecomputedCss
 from cms_rendner_sdfv.pandas.styler.todo_patcher import TodoPatcher
 
 
 class Chunk:
     def __init__(self,
                  styler: Styler,
+                 css: list[CellCss],
                  visible_frame: VisibleFrame,
                  region: Region,
                  meta_computer: MetaComputer,
                  formatter: ValueFormatter,
+                 css_per_patcher: Optional[dict[TodoPatcher, list[CellCss]]] = None,
                  ):
         self.__styler = styler
+        self.__css = css
+        # not available if the css was precomputed
+        self.__css_per_patcher = css_per_patcher
         self.__visible_frame = visible_frame
         self.__region = region
         self.__meta_computer = meta_computer
@@ -41,13 +48,20 @@ class Chunk:
     def region(self) -> Region:
         return self.__region
 
+    @property
+    def visible_frame(self) -> VisibleFrame:
+        return self.__visible_frame
+
+    def patcher_css(self, patcher: TodoPatcher) -> Optional[list[CellCss]]:
+        # The css of the cells created by the todo of the patcher, row-major.
+        return None if self.__css_per_patcher is None else self.__css_per_patcher.get(patcher)
+
     def cell_value_at(self, row: int, col: int) -> Cell:
         raw_value = self.__visible_frame.cell_value_at(
             self.__region.first_row + row,
             self.__region.first_col + col,
         )
-        css = self.__styler.ctx[(row, col)]
-        css = None if not css or css is None else dict(css)
+        css = self.__css_at(row, col)
 
         org_row, org_col = self.__to_source_frame_cell_coordinates(row, col)
         meta = self.__meta_computer.compute_cell_meta(col=org_col, value=raw_value, css=css)
@@ -55,6 +69,23 @@ class Chunk:
 
         return Cell(value=self.__formatter.format_cell(display_value), meta=meta)
 
+    def column_cells_at(self, col: int) -> list[Cell]:
+        if self.__region.rows == 0:
+            return []
+
+        raw_values = self.__visible_frame.column_values_at(self.__region.first_col + col, self.__region)
+        css_list = [self.__css_at(row, col) for row in range(self.__region.rows)]
+
+        org_col = self.__to_source_frame_cell_coordinates(0, col)[1]
+        metas = self.__meta_computer.compute_column_meta(col=org_col, values=raw_values, css=css_list)
+
+        result = []
+        for row, (raw_value, meta) in enumerate(zip(raw_values, metas)):
+            org_row = self.__to_source_frame_cell_coordinates(row, col)[0]
+            display_value = self.__styler._display_funcs[(org_row, org_col)](raw_value)
+            result.append(Cell(value=self.__formatter.format_cell(display_value), meta=meta))
+        return result
+
     def row_labels_at(self, row: int) -> list[Any]:
         labels = self.__visible_frame.row_labels_at(self.__region.first_row + row)
         org_row = self.__to_source_frame_cell_coordinates(row, 0)[0]
@@ -65,6 +96,9 @@ class Chunk:
         ]
         return [self.__formatter.format_index(lbl) for lbl in labels]
 
+    def __css_at(self, row: int, col: int) -> CellCss:
+        return self.__css[row * self.__region.cols + col]
+
     def __to_source_frame_cell_coordinates(self, row: int, col: int):
         return self.__visible_frame.to_source_frame_cell_coordinates(
             self.__region.first_row + row,
@@ -79,48 +113,57 @@ class ChunkComputer:
                  todo_patcher_list: list[TodoPatcher],
                  meta_computer: MetaComputer,
                  formatter: ValueFormatter,
+                 precomputed_css: Optional[PrecomputedCss] = None,
+                 reusable_chunk: Optional[Chunk] = None,
                  ):
         self.__visible_frame: VisibleFrame = visible_frame
         self.__org_styler: Styler = org_styler
         self.__todo_patcher_list: list[TodoPatcher] = todo_patcher_list
         self.__meta_computer = meta_computer
         self.__formatter = formatter
+        self.__precomputed_css = precomputed_css
+        # an already computed chunk, which is returned instead of recomputing its region
+        self.__reusable_chunk = reusable_chunk
 
     def compute(self, region: Region) -> Chunk:
         # The plugin only renders the visible (non-hidden cols/rows) of the styled DataFrame.
         # Therefore, create chunk from the visible data.
         region = self.__visible_frame.region.get_bounded_region(region)
-        chunk_df = self.__visible_frame.to_frame(region)
-
-        # Create a styler from the chunk DataFrame.
-        # The calculated css is stored in "chunk_styler.ctx" by using a tuple of (rowIndex, columnIndex) coordinates.
-        # (see pandas Styler._update_ctx)
-        chunk_styler = chunk_df.style
-
-        # assign patched todos
-        # The apply/map params are patched to not operate outside the chunk bounds.
-        chunk_styler._todo = [
-            p.create_patched_todo(chunk_df).to_tuple()
-            for p in self.__todo_patcher_list
-        ]
-        # Compute the styling for the chunk.
-        chunk_styler._compute()
-
-        # copy over some required state props
-        chunk_styler._display_funcs = self.__org_styler._display_funcs
-        chunk_styler._display_funcs_index = self.__org_styler._display_funcs_index
-        chunk_styler._display_funcs_columns = self.__org_styler._display_funcs_columns
-
-        chunk_styler.hide_index_ = self.__org_styler.hide_index_
-        chunk_styler.hide_index_names = self.__org_styler.hide_index_names
-
-        chunk_styler.hide_columns_ = self.__org_styler.hide_columns_
-        chunk_styler.hide_column_names = self.__org_styler.hide_column_names
-
+        reusable_chunk = self.__reusable_chunk
+        if reusable_chunk is not None \
+                and reusable_chunk.region == region \
+                and reusable_chunk.visible_frame is self.__visible_frame:
+            return reusable_chunk
+
+        css_per_patcher = None
+        if self.__precomputed_css is not None:
+            css = self.__precomputed_css.css_of_region(self.__visible_frame, region)
+        else:
+            patcher_css = self.__compute_css_per_patcher(region, self.__todo_patcher_list)
+            css = ChunkStyler.merge(patcher_css, region.rows * region.cols)
+            css_per_patcher = dict(zip(self.__todo_patcher_list, patcher_css))
+
+        # The display functions and the hidden state are read from the original Styler.
         return Chunk(
-            styler=chunk_styler,
+            styler=self.__org_styler,
+            css=css,
             visible_frame=self.__visible_frame,
             region=region,
             formatter=self.__formatter,
             meta_computer=self.__meta_computer,
+            css_per_patcher=css_per_patcher,
         )
+
+    def compute_patcher_css(self, patcher: TodoPatcher, region: Region) -> list[CellCss]:
+        region = self.__visible_frame.region.get_bounded_region(region)
+        return self.__compute_css_per_patcher(region, [patcher])[0]
+
+    def __compute_css_per_patcher(self, region: Region, patchers: list[TodoPatcher]) -> list[list[CellCss]]:
+        chunk_df = self.__visible_frame.to_frame(region)
+
+        # The patched todos are executed without creating a Styler for the chunk DataFrame.
+        # The apply/map params are patched to not operate outside the chunk bounds.
+        return ChunkStyler(chunk_df).compute_per_todo([
+            p.create_patched_todo(chunk_df).to_tuple()
+            for p in patchers
+        ])
@@ -0,0 +1,79 @@
+#  Copyright 2021-2025 cms.rendner (Daniel Schmidt)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import sys
+from typing import Optional, Tuple
+
+from cms_rendner_sdfv.base.types import ChunkDataResponse
+
+# approximated size of a "Cell" and of a list entry, without the size of the referenced strings
+_CELL_OVERHEAD_BYTES = 64
+
+
+def _size_of(response: ChunkDataResponse) -> int:
+    size = 0
+    for row in response.cells or []:
+        for cell in row:
+            size += _CELL_OVERHEAD_BYTES + sys.getsizeof(cell.value)
+            if cell.meta is not None:
+                size += sys.getsizeof(cell.meta)
+    for labels in response.row_headers or []:
+        size += sum(sys.getsizeof(lbl) for lbl in labels)
+    return size
+
+
+class StyledChunkCache:
+    """
+    LRU cache for the computed chunks of a styled frame.
+
+    A chunk contains the display values and the css derived meta of the cells and the row headers.
+    The key of a chunk has to include everything the content depends on, like the region and the sort order.
+    """
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 32 * 1024 * 1024):
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        # insertion order is used as LRU order, the least recently used entry is the first one
+        self.__entries: dict[tuple, Tuple[ChunkDataResponse, int]] = dict()
+        self.__total_bytes = 0
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def clear(self):
+        self.__entries.clear()
+        self.__total_bytes = 0
+
+    def get(self, key: tuple) -> Optional[ChunkDataResponse]:
+        entry = self.__entries.pop(key, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.__entries[key] = entry
+        return entry[0]
+
+    def put(self, key: tuple, chunk: ChunkDataResponse):
+        old_entry = self.__entries.pop(key, None)
+        if old_entry is not None:
+            self.__total_bytes -= old_entry[1]
+
+        size = _size_of(chunk)
+        if size > self.__max_bytes:
+            return
+
+        self.__entries[key] = (chunk, size)
+        self.__total_bytes += size
+
+        while len(self.__entries) > self.__max_entries or self.__total_bytes > self.__max_bytes:
+            lru_key = next(iter(self.__entries))
+            self.__total_bytes -= self.__entries.pop(lru_key)[1]
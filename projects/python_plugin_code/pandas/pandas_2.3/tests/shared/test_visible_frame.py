@@ -2,6 +2,7 @@ import numpy as np
 import pandas as pd
 
 from cms_rendner_sdfv.base.constants import COL_STATISTIC_ENTRY_MAX_STR_LEN
+from cms_rendner_sdfv.base.types import Region
 from cms_rendner_sdfv.pandas.shared.value_formatter import ValueFormatter
 from cms_rendner_sdfv.pandas.shared.visible_frame import VisibleFrame
 
@@ -39,6 +40,12 @@ def test_cell_value_at():
     assert vf.cell_value_at(0, 1) == "1"
 
 
+def test_column_values_at():
+    vf = VisibleFrame(source_frame=df)
+    assert list(vf.column_values_at(0)) == [vf.cell_value_at(r, 0) for r in range(vf.region.rows)]
+    assert list(vf.column_values_at(1, Region(1, 0, 2, 2))) == ["4", "4"]
+
+
 def test_row_labels_at():
     vf = VisibleFrame(source_frame=df)
     assert vf.row_labels_at(0) == [0]
@@ -95,3 +102,19 @@ def test_truncate_column_statistics():
     vf = VisibleFrame(source_frame=pd.DataFrame.from_dict({'A': ['ab' * COL_STATISTIC_ENTRY_MAX_STR_LEN]}))
     actual = vf.get_column_statistics(0, ValueFormatter())
     assert len(actual.get('top')) == COL_STATISTIC_ENTRY_MAX_STR_LEN
+
+
+def test_get_columns_statistics_matches_get_column_statistics():
+    vf = VisibleFrame(
+        source_frame=pd.DataFrame.from_dict({
+            'categorical': pd.Categorical(['d', 'e', 'f']),
+            'numeric': [1, 2, 3],
+            'str': ['a', 'b', 'b'],
+            'float': [1.5, np.nan, 2.5],
+            'numeric_2': [4, 5, 6],
+            'bool': [True, False, True],
+        }))
+
+    formatter = ValueFormatter()
+    actual = vf.get_columns_statistics([0, 1, 2, 3, 4, 5], formatter)
+    assert actual == {col: vf.get_column_statistics(col, formatter) for col in range(6)}
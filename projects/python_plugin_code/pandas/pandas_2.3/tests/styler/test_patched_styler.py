@@ -1,3 +1,6 @@
+import threading
+import time
+
 import pandas as pd
 import numpy as np
 import pytest
@@ -90,6 +93,57 @@ def test_validate_and_compute_chunk_data():
     )
 
 
+def test_validate_and_compute_chunk_data_styles_region_once():
+    styled_series = []
+
+    def my_style(series):
+        styled_series.append(len(series))
+        return ['color: red' if v % 2 == 0 else '' for v in series]
+
+    ps = PatchedStyler(PatchedStylerContext(df.style.apply(my_style, axis='index')), "finger-1")
+    actual = ps.validate_and_compute_chunk_data(Region(0, 0, 2, 2))
+
+    # chunk (two columns) and the two sub-chunks of the validation (two columns each)
+    assert styled_series == [2, 2, 1, 1, 1, 1]
+    expected_ctx = PatchedStylerContext(df.style.apply(my_style, axis='index'))
+    assert actual == ps.serialize(
+        ValidatedChunkData(
+            data=expected_ctx.get_chunk_data_generator().generate(Region(0, 0, 2, 2)),
+            problems=None,
+        )
+    )
+
+
+def test_validate_and_compute_chunk_data_with_chunk_prefetch():
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def my_style(series):
+        return ['color: red' if v % 2 == 0 else '' for v in series]
+
+    def my_tracked_style(series):
+        with lock:
+            running.append(1)
+            max_running.append(len(running))
+        time.sleep(0.005)
+        with lock:
+            running.pop()
+        return my_style(series)
+
+    expected_ps = PatchedStyler(PatchedStylerContext(df.style.apply(my_style, axis='index')), "finger-1")
+    ps = PatchedStyler(PatchedStylerContext(df.style.apply(my_tracked_style, axis='index')), "finger-1")
+    ps.enable_chunk_prefetch()
+
+    regions = [Region(first_row, 0, 2, 2) for first_row in [0, 2, 4, 2]]
+    expected = [expected_ps.validate_and_compute_chunk_data(region) for region in regions]
+    assert [ps.validate_and_compute_chunk_data(region) for region in regions] == expected
+
+    ps.unlink()
+    # the validation never runs in parallel to a prefetch of a chunk
+    assert max(max_running) == 1
+
+
 def test_table_info_with_different_column_types():
     my_df = pd.DataFrame.from_dict({
         'a': [1],
@@ -12,11 +12,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 from dataclasses import dataclass
+from typing import List, Union
 
 import polars as pl
 
 from cms_rendner_sdfv.base.table_source import ChunkDataGenerator as BaseChunkDataGenerator
 from cms_rendner_sdfv.base.types import Region, ChunkDataResponse, Cell
+from cms_rendner_sdfv.polars.lazy_visible_frame import LazyVisibleFrame
 from cms_rendner_sdfv.polars.meta_computer import MetaComputer
 from cms_rendner_sdfv.polars.visible_frame import VisibleFrame
 
@@ -29,7 +31,7 @@ class FormatOptions:
 
 class ChunkDataGenerator(BaseChunkDataGenerator):
     def __init__(self,
-                 visible_frame: VisibleFrame,
+                 visible_frame: Union[VisibleFrame, LazyVisibleFrame],
                  format_options: FormatOptions,
                  meta_computer: MetaComputer,
                  ):
@@ -43,27 +45,79 @@ class ChunkDataGenerator(BaseChunkDataGenerator):
             cfg.set_fmt_str_lengths(self.__format_options.str_len)
             cfg.set_fmt_table_cell_list_len(self.__format_options.cell_list_len)
 
-            response.cells = []
-            is_first_cols_iteration = True
+            col_cells: List[List[Cell]] = []
             for c in range(region.cols):
-                series = self.__visible_frame.series_at(region.first_col + c)
-                for r, row_in_series in enumerate(self.__visible_frame.row_idx_iter(region)):
-                    raw_v = series.item(row_in_series)
-                    v = series._s.get_fmt(row_in_series, self.__format_options.str_len)
-                    if v[0] == '"':
-                        v = v[1:]
-                    if v[-1] == '"':
-                        v = v[0:-1]
-
-                    org_col_idx = self.__visible_frame.get_col_index_in_source_frame(region.first_col + c)
-                    cell = Cell(
-                        value=v,
-                        meta=self.__meta_computer.compute_cell_meta(org_col_idx, raw_v),
+                chunk_series = self.__visible_frame.series_chunk_at(region.first_col + c, region)
+                org_col_idx = self.__visible_frame.get_col_index_in_source_frame(region.first_col + c)
+                col_cells.append([
+                    Cell(value=v, meta=m)
+                    for v, m in zip(
+                        self._format_values(chunk_series),
+                        self.__meta_computer.compute_column_meta(org_col_idx, chunk_series),
                     )
+                ])
 
-                    if is_first_cols_iteration:
-                        response.cells.append([cell])
-                    else:
-                        response.cells[r].append(cell)
+            response.cells = [list(row) for row in zip(*col_cells)]
 
-                is_first_cols_iteration = False
+    def _format_values(self, series: pl.Series) -> List[str]:
+        str_len = self.__format_options.str_len
+        if _is_string_like(series.dtype):
+            # Formatting string values via "get_fmt" wraps them into double quotes, which aren't wanted.
+            # Therefore, the truncation is done in one vectorized step instead.
+            values = pl.lit(series.cast(pl.Utf8))
+            return pl.select(
+                pl.when(values.str.len_chars() > str_len)
+                .then(values.str.slice(0, str_len) + '…')
+                .otherwise(values)
+                .fill_null('null')
+            ).to_series().to_list()
+        if _is_nested(series.dtype):
+            # Formatting the full nested values is expensive for large lists.
+            # Therefore, the lists are shrunk beforehand to the elements which are displayed.
+            series = series.to_frame('v').select(
+                _truncate_nested(pl.col('v'), series.dtype, self.__format_options),
+            ).to_series()
+        # Polars has no bulk formatting which matches "get_fmt" for the remaining dtypes. Casting to "Utf8"
+        # ignores the float precision and the thousands separator of the polars config and formats temporal
+        # values differently. Therefore, these values are still formatted per cell.
+        return [series._s.get_fmt(i, str_len) for i in range(len(series))]
+
+
+def _is_string_like(dtype: pl.DataType) -> bool:
+    if dtype == pl.Utf8 or dtype == pl.Categorical:
+        return True
+    # "Enum" is not available in all supported polars versions
+    return hasattr(pl, 'Enum') and dtype == pl.Enum
+
+
+def _is_nested(dtype: pl.DataType) -> bool:
+    return isinstance(dtype, (pl.List, pl.Array, pl.Struct))
+
+
+def _truncate_nested(expr: pl.Expr, dtype: pl.DataType, format_options: FormatOptions) -> pl.Expr:
+    if isinstance(dtype, pl.Array):
+        # "Array" has no "head" in all supported polars versions, both types are formatted the same way
+        return _truncate_nested(expr.arr.to_list(), pl.List(dtype.inner), format_options)
+
+    if isinstance(dtype, pl.List):
+        if _is_nested(dtype.inner):
+            expr = expr.list.eval(_truncate_nested(pl.element(), dtype.inner, format_options))
+        list_len = format_options.cell_list_len
+        if list_len < 1:
+            return expr
+        # polars displays the first "list_len - 1" elements and the last one,
+        # keeping one additional element ensures that the omitted elements are still indicated by "…"
+        return pl.when(expr.list.len() > list_len + 1) \
+            .then(pl.concat_list([expr.list.head(list_len), expr.list.tail(1)])) \
+            .otherwise(expr)
+
+    if isinstance(dtype, pl.Struct):
+        return pl.when(expr.is_not_null()).then(
+            pl.struct([
+                _truncate_nested(expr.struct.field(f.name), f.dtype, format_options).alias(f.name)
+                for f in dtype.fields
+            ])
+        )
+
+    # strings are rendered by polars, which doesn't truncate strings inside of nested values
+    return expr
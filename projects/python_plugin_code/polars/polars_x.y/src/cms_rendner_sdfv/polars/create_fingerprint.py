@@ -12,12 +12,18 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 from hashlib import blake2b
-from typing import Any
+from typing import Any, Union
 
-from polars import DataFrame
+from polars import DataFrame, LazyFrame
 
+from cms_rendner_sdfv.base.constants import FINGERPRINT_CONTENT_SAMPLE_ROWS
+from cms_rendner_sdfv.polars.lazy_visible_frame import collect_schema
 
-def create_fingerprint(frame: DataFrame, org_data_source: Any = None) -> str:
+
+def create_fingerprint(frame: Union[DataFrame, LazyFrame],
+                       org_data_source: Any = None,
+                       with_content_sample: bool = False,
+                       ) -> str:
     # A "fingerprint" is generated to help to identify if two data-frame instances are created with the
     # same data source. Two objects with non-overlapping lifetimes may have the same id() value.
     # Such a scenario can be simulated with the following minimal example:
@@ -29,10 +35,32 @@ def create_fingerprint(frame: DataFrame, org_data_source: Any = None) -> str:
     #     used_ids.add(my_id)
     #
     # Therefore, additional data is included to create a better fingerprint.
+    #
+    # The shape of a LazyFrame isn't included, computing the row count requires a query of the data source.
+    schema = collect_schema(frame)
     fingerprint_input = [
         id(org_data_source if org_data_source is not None else frame),
-        frame.shape,
-        frame.columns[:60],
-        frame.dtypes[:60]
+        frame.shape if isinstance(frame, DataFrame) else len(schema),
+        list(schema.keys())[:60],
+        list(schema.values())[:60]
     ]
+    # The content of a LazyFrame isn't sampled, this would require a query of the data source.
+    if with_content_sample and isinstance(frame, DataFrame):
+        fingerprint_input.append(_hash_content_sample(frame))
     return blake2b('-'.join(str(x) for x in fingerprint_input).encode(), digest_size=16).hexdigest()
+
+
+def _hash_content_sample(frame: DataFrame) -> str:
+    # In-place modifications of the values aren't detected by the other parts of the fingerprint.
+    # Only a deterministic sample of evenly distributed rows is hashed, to keep the costs bounded for large frames.
+    rows_count = frame.height
+    if rows_count == 0 or frame.width == 0:
+        return ""
+    sample_size = min(rows_count, FINGERPRINT_CONTENT_SAMPLE_ROWS)
+    positions = sorted({i * (rows_count - 1) // max(1, sample_size - 1) for i in range(sample_size)})
+    try:
+        row_hashes = frame[positions].hash_rows()
+    except Exception:
+        # values which can't be hashed are not included
+        return ""
+    return blake2b(str(row_hashes.to_list()).encode(), digest_size=16).hexdigest()
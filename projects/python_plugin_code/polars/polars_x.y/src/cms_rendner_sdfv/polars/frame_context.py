@@ -12,16 +12,19 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import os
-from typing import List, Optional, Union, Any, Dict
+import threading
+from typing import List, Optional, Union, Any, Dict, Tuple
 
-from polars import DataFrame, DataType, datatypes
+from polars import DataFrame, DataType, LazyFrame, Series, col, datatypes, int_range
 
-from cms_rendner_sdfv.base.constants import CELL_MAX_STR_LEN, CELL_MAX_LIST_LEN
+from cms_rendner_sdfv.base.constants import CELL_MAX_STR_LEN, CELL_MAX_LIST_LEN, PROGRESSIVE_SORT_WINDOW_SIZE
 from cms_rendner_sdfv.base.helpers import fq_type
-from cms_rendner_sdfv.base.table_source import AbstractTableSourceContext
+from cms_rendner_sdfv.base.table_source import AbstractTableSourceContext, SortPermutationCache
 from cms_rendner_sdfv.base.types import SortCriteria, TableStructure, TableStructureColumnInfo, TableStructureColumn, \
     CompletionVariant, NestedCompletionVariant, TextAlign
 from cms_rendner_sdfv.polars.chunk_data_generator import ChunkDataGenerator, FormatOptions
+from cms_rendner_sdfv.polars.lazy_visible_frame import LazyVisibleFrame, ROW_IDX_COL_NAME, collect_schema, count_rows, \
+    with_row_index
 from cms_rendner_sdfv.polars.meta_computer import MetaComputer
 from cms_rendner_sdfv.polars.visible_frame import VisibleFrame
 
@@ -40,28 +43,64 @@ def _compute_format_options() -> FormatOptions:
 
 
 class FrameContext(AbstractTableSourceContext):
-    def __init__(self, source_frame: DataFrame, filtered_frame: Union[DataFrame, None] = None):
+    def __init__(self,
+                 source_frame: Union[DataFrame, LazyFrame],
+                 filtered_frame: Union[DataFrame, LazyFrame, None] = None,
+                 filter_row_idx: Union[None, Series] = None,
+                 ):
         self.__source_frame = source_frame
+        self.__source_schema: Dict[str, DataType] = collect_schema(source_frame)
         self.__filtered_frame = filtered_frame
+        # positions of the rows of the source frame which match a filter expression
+        self.__filter_row_idx = filter_row_idx
+        # row count of a LazyFrame, requires a query and is therefore computed only once
+        self.__lazy_rows_count: Union[None, int] = None
         self.__sort_criteria: SortCriteria = SortCriteria()
-        self.__visible_frame: VisibleFrame = self._recompute_visible_frame()
+        # the filter can't change during the lifetime of a context, therefore the sort criteria is used as key
+        self.__sort_permutation_cache = SortPermutationCache(size_of=lambda s: s.estimated_size())
+        # the statistics don't depend on the sorting, therefore the column index is used as key
+        self.__column_statistics_cache: Dict[int, Dict[str, str]] = {}
+        # rows of the leading window which are sorted before the full sort is completed, 0 disables it
+        self.__progressive_sort_window_size: int = 0
+        # sort criteria of the visible frame, if only its leading window is sorted
+        self.__incomplete_sort_criteria: Optional[SortCriteria] = None
+        # True if the full sort, completed in the background, failed
+        self.__is_sort_failed: bool = False
+        # synchronizes the replacement of the visible frame by a sort completed in the background
+        self.__sort_lock = threading.Lock()
+        self.__visible_frame: Union[VisibleFrame, LazyVisibleFrame] = self._recompute_visible_frame()
         self.__format_options = _compute_format_options()
         self.__meta_computer = MetaComputer(source_frame)
 
     def unlink(self):
+        with self.__sort_lock:
+            self.__unlink()
+
+    def __unlink(self):
         self.__source_frame = None
+        self.__source_schema = None
         self.__filtered_frame = None
+        self.__filter_row_idx = None
         self.__sort_criteria = None
+        self.__sort_permutation_cache.clear()
+        self.__sort_permutation_cache = None
+        self.__column_statistics_cache = None
         self.__visible_frame = None
         self.__meta_computer.unlink()
         self.__meta_computer = None
 
     @property
-    def visible_frame(self) -> VisibleFrame:
+    def visible_frame(self) -> Union[VisibleFrame, LazyVisibleFrame]:
         return self.__visible_frame
 
     def get_column_statistics(self, col_index: int) -> Dict[str, str]:
-        return self.__visible_frame.get_column_statistics(col_index)
+        return self.get_columns_statistics([col_index])[col_index]
+
+    def get_columns_statistics(self, col_indices: List[int]) -> Dict[int, Dict[str, str]]:
+        missing = [col for col in col_indices if col not in self.__column_statistics_cache]
+        if missing:
+            self.__column_statistics_cache.update(self.__visible_frame.get_columns_statistics(missing))
+        return {col: self.__column_statistics_cache[col] for col in col_indices}
 
     def get_column_name_completion_variants(self, source: Any, is_synthetic_df: bool) -> List[
         Union[CompletionVariant, NestedCompletionVariant]]:
@@ -71,24 +110,34 @@ class FrameContext(AbstractTableSourceContext):
             # To use columns that have already been filtered out, the original unfiltered data source is used.
             source = self.__source_frame
 
-        if not isinstance(source, DataFrame):
+        if not isinstance(source, (DataFrame, LazyFrame)):
             return result
 
         str_fqt = fq_type("")
-        for col in source.columns:
+        for col in collect_schema(source).keys():
             result.append(CompletionVariant(fq_type=str_fqt, value=col))
 
         return result
 
     def set_sort_criteria(self, sort_by_column_index: Optional[List[int]], sort_ascending: Optional[List[bool]]):
         new_sort_criteria = SortCriteria(sort_by_column_index, sort_ascending)
-        if new_sort_criteria != self.__sort_criteria:
-            self.__sort_criteria = new_sort_criteria
-            self.__visible_frame = self._recompute_visible_frame()
+        with self.__sort_lock:
+            if new_sort_criteria != self.__sort_criteria or self.__is_sort_failed:
+                self.__sort_criteria = new_sort_criteria
+                self.__visible_frame = self._recompute_visible_frame()
+
+    def precompute_min_max(self, in_background: bool = False):
+        self.__meta_computer.precompute_min_max(in_background)
+
+    def enable_progressive_sort(self, window_size: int = PROGRESSIVE_SORT_WINDOW_SIZE):
+        self.__progressive_sort_window_size = window_size
+
+    def is_sort_complete(self) -> bool:
+        return self.__incomplete_sort_criteria is None
 
     def get_table_structure(self, fingerprint: str) -> TableStructure:
         rows_count, columns_count = self.__visible_frame.region.frame_shape
-        org_rows_count, org_cols_count = self.__source_frame.shape
+        org_rows_count, org_cols_count = self.__get_source_frame_shape()
         if rows_count == 0 or columns_count == 0:
             rows_count = columns_count = 0
         return TableStructure(
@@ -104,8 +153,8 @@ class FrameContext(AbstractTableSourceContext):
     def _get_frame_column_info(self) -> TableStructureColumnInfo:
         ts_columns: List[TableStructureColumn] = []
 
-        col_names = self.__source_frame.columns
-        col_dtypes = self.__source_frame.dtypes
+        col_names = list(self.__source_schema.keys())
+        col_dtypes = list(self.__source_schema.values())
         for col in self.visible_frame.get_column_indices():
             col_dtype = col_dtypes[col]
             ts_columns.append(
@@ -128,15 +177,22 @@ class FrameContext(AbstractTableSourceContext):
     def get_chunk_data_generator(self):
         return ChunkDataGenerator(self.__visible_frame, self.__format_options, self.__meta_computer)
 
-    def _recompute_visible_frame(self) -> VisibleFrame:
+    def __get_source_frame_shape(self) -> Tuple[int, int]:
+        if isinstance(self.__source_frame, DataFrame):
+            return self.__source_frame.shape
+        if self.__filtered_frame is None and self.__filter_row_idx is None:
+            return self.__visible_frame.region.frame_shape
+        return count_rows(self.__source_frame), len(self.__source_schema)
+
+    def _recompute_visible_frame(self) -> Union[VisibleFrame, LazyVisibleFrame]:
         col_idx = None
 
         if self.__filtered_frame is None:
             data_frame = self.__source_frame
         else:
             col_idx = []
-            org_col_names = self.__source_frame.columns
-            for c_name in self.__filtered_frame.columns:
+            org_col_names = list(self.__source_schema.keys())
+            for c_name in collect_schema(self.__filtered_frame).keys():
                 try:
                     col_idx.append(org_col_names.index(c_name))
                 except ValueError:
@@ -148,24 +204,148 @@ class FrameContext(AbstractTableSourceContext):
 
             data_frame = self.__filtered_frame
 
+        self.__incomplete_sort_criteria = None
+        self.__is_sort_failed = False
         sorted_row_idx = None
         if not self.__sort_criteria.is_empty():
-            # get col names before we insert "with_row_count" col
-            # otherwise we would have to translate all col idx by one
-            col_names = data_frame.columns
+            sc = self.__sort_criteria
+            sorted_row_idx = self.__sort_permutation_cache.get(sc)
+            if sorted_row_idx is None:
+                if self.__progressive_sort_window_size > 0:
+                    sorted_row_idx = self.__compute_leading_sorted_row_idx(data_frame, sc)
+                if sorted_row_idx is None:
+                    sorted_row_idx = self.__compute_sorted_row_idx(data_frame, sc)
+                    self.__sort_permutation_cache.put(sc, sorted_row_idx)
+                else:
+                    # the first chunks can already be displayed, the full sort is completed in the background
+                    self.__incomplete_sort_criteria = sc
+                    threading.Thread(target=self.__complete_sort, args=(data_frame, col_idx, sc), daemon=True).start()
+        elif self.__filter_row_idx is not None:
+            sorted_row_idx = self.__filter_row_idx
 
-            # ensures that we always have our own col which starts with a zero index
-            # in case the user has configured something else
-            row_idx_col_name: str = "cms_render_sdfv__row_nr"
+        return self.__create_visible_frame(data_frame, col_idx, sorted_row_idx)
 
-            if hasattr(data_frame, 'with_row_index'):
-                frame_with_index = data_frame.with_row_index(row_idx_col_name)
-            else:
-                frame_with_index = data_frame.with_row_count(row_idx_col_name)
-
-            by_names = [col_names[i] for i in self.__sort_criteria.by_column]
-            sorted_row_idx = frame_with_index \
-                .sort(by_names, descending=[not asc for asc in self.__sort_criteria.ascending]) \
-                .get_column(row_idx_col_name)
+    def __create_visible_frame(self,
+                               data_frame: Union[DataFrame, LazyFrame],
+                               col_idx: Union[None, List[int]],
+                               sorted_row_idx: Union[None, Series],
+                               ) -> Union[VisibleFrame, LazyVisibleFrame]:
+        if isinstance(data_frame, LazyFrame):
+            return LazyVisibleFrame(
+                unsorted_source_frame=data_frame,
+                rows_count=self.__get_rows_count(data_frame),
+                sorted_row_idx=sorted_row_idx,
+                org_col_idx=col_idx,
+            )
 
         return VisibleFrame(unsorted_source_frame=data_frame, sorted_row_idx=sorted_row_idx, org_col_idx=col_idx)
+
+    def __get_rows_count(self, data_frame: Union[DataFrame, LazyFrame]) -> int:
+        if self.__filter_row_idx is not None:
+            return len(self.__filter_row_idx)
+        if isinstance(data_frame, DataFrame):
+            return data_frame.height
+        if self.__lazy_rows_count is None:
+            self.__lazy_rows_count = count_rows(data_frame)
+        return self.__lazy_rows_count
+
+    def __complete_sort(self,
+                        data_frame: Union[DataFrame, LazyFrame],
+                        col_idx: Union[None, List[int]],
+                        sc: SortCriteria,
+                        ):
+        try:
+            sorted_row_idx = self.__compute_sorted_row_idx(data_frame, sc)
+        except Exception:
+            sorted_row_idx = None
+
+        with self.__sort_lock:
+            if self.__source_frame is None:
+                # context was unlinked in the meantime
+                return
+            if sorted_row_idx is not None:
+                self.__sort_permutation_cache.put(sc, sorted_row_idx)
+            if self.__incomplete_sort_criteria == sc:
+                if sorted_row_idx is None:
+                    # The sort stays incomplete, the visible frame is only sorted in its leading window.
+                    # The next sort criteria is applied even if it is equal, to allow the user to re-apply the sort.
+                    self.__is_sort_failed = True
+                else:
+                    self.__incomplete_sort_criteria = None
+                    self.__visible_frame = self.__create_visible_frame(data_frame, col_idx, sorted_row_idx)
+
+    def __compute_leading_sorted_row_idx(self,
+                                         data_frame: Union[DataFrame, LazyFrame],
+                                         sc: SortCriteria,
+                                         ) -> Union[None, Series]:
+        # Only the leading window is sorted, by a partial sort of a single column.
+        # The remaining rows follow in their unsorted order until the full sort is completed.
+        window_size = self.__progressive_sort_window_size
+        if len(sc.by_column) != 1 or not hasattr(data_frame, 'bottom_k'):
+            return None
+
+        schema = collect_schema(data_frame)
+        name = list(schema.keys())[sc.by_column[0]]
+        dtype = schema[name]
+        if not dtype.is_numeric() or dtype == datatypes.Boolean:
+            return None
+        if self.__get_rows_count(data_frame) <= window_size:
+            return None
+
+        frame_with_index = with_row_index(data_frame, ROW_IDX_COL_NAME).select([ROW_IDX_COL_NAME, name])
+        if self.__filter_row_idx is not None:
+            frame_with_index = frame_with_index.filter(col(ROW_IDX_COL_NAME).is_in(self.__filter_row_idx))
+
+        # null and NaN values would be part of the leading window, which isn't supported by the partial sort
+        checks = [col(name).null_count().alias('nulls')]
+        if dtype in (datatypes.Float32, datatypes.Float64):
+            checks.append(col(name).is_nan().sum().alias('nans'))
+        checked = frame_with_index.select(checks)
+        if isinstance(checked, LazyFrame):
+            checked = checked.collect()
+        if any(checked.row(0)):
+            return None
+
+        # the row index is used as second key, to order equal values in the same way as a stable sort
+        descending = not sc.ascending[0]
+        if descending:
+            leading = frame_with_index.top_k(window_size, by=[name, -col(ROW_IDX_COL_NAME).cast(datatypes.Int64)])
+        else:
+            leading = frame_with_index.bottom_k(window_size, by=[name, ROW_IDX_COL_NAME])
+        leading = leading.sort([name, ROW_IDX_COL_NAME], descending=[descending, False])
+        if isinstance(leading, LazyFrame):
+            leading = leading.collect()
+
+        leading_row_idx = leading.get_column(ROW_IDX_COL_NAME)
+        all_row_idx = self.__filter_row_idx if self.__filter_row_idx is not None \
+            else int_range(0, self.__get_rows_count(data_frame), eager=True)
+        remaining_row_idx = all_row_idx.filter(~all_row_idx.is_in(leading_row_idx)).cast(leading_row_idx.dtype)
+        return leading_row_idx.append(remaining_row_idx)
+
+    def __compute_sorted_row_idx(self, data_frame: Union[DataFrame, LazyFrame], sc: SortCriteria) -> Series:
+        # get col names before we insert "with_row_count" col
+        # otherwise we would have to translate all col idx by one
+        col_names = list(collect_schema(data_frame).keys())
+
+        # ensures that we always have our own col which starts with a zero index
+        # in case the user has configured something else
+        frame_with_index = with_row_index(data_frame, ROW_IDX_COL_NAME)
+
+        by_names = [col_names[i] for i in sc.by_column]
+        # only the columns to sort by are required to compute the sorted row index
+        frame_with_index = frame_with_index.select([ROW_IDX_COL_NAME, *by_names])
+        if self.__filter_row_idx is not None:
+            frame_with_index = frame_with_index.filter(col(ROW_IDX_COL_NAME).is_in(self.__filter_row_idx))
+
+        sorted_frame = frame_with_index \
+            .sort(
+                by_names,
+                descending=[not asc for asc in sc.ascending],
+                # a stable sort ensures that the leading window of a progressive sort matches the full sort
+                maintain_order=self.__progressive_sort_window_size > 0,
+            ) \
+            .select(ROW_IDX_COL_NAME)
+        if isinstance(sorted_frame, LazyFrame):
+            # only the sorted row index is materialized, the sorting is done by the lazy engine
+            sorted_frame = sorted_frame.collect()
+        return sorted_frame.get_column(ROW_IDX_COL_NAME)
@@ -0,0 +1,117 @@
+#  Copyright 2021-2025 cms.rendner (Daniel Schmidt)
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from typing import Dict, Iterator, List, Union
+
+import polars as pl
+
+from cms_rendner_sdfv.base.types import Region
+from cms_rendner_sdfv.polars.visible_frame import describe_columns
+
+ROW_IDX_COL_NAME: str = "cms_render_sdfv__row_nr"
+
+
+def collect_schema(frame: Union[pl.DataFrame, pl.LazyFrame]) -> Dict[str, pl.DataType]:
+    # "LazyFrame.schema" resolves the schema too, but is deprecated since polars 1.0
+    if isinstance(frame, pl.LazyFrame) and hasattr(frame, 'collect_schema'):
+        return dict(frame.collect_schema())
+    return dict(frame.schema)
+
+
+def count_rows(frame: pl.LazyFrame) -> int:
+    # "pl.len" was added in polars 0.20.5
+    return frame.select(pl.len() if hasattr(pl, 'len') else pl.count()).collect().item()
+
+
+def with_row_index(frame: Union[pl.DataFrame, pl.LazyFrame], name: str, offset: int = 0):
+    if hasattr(frame, 'with_row_index'):
+        return frame.with_row_index(name, offset)
+    return frame.with_row_count(name, offset)
+
+
+class LazyVisibleFrame:
+    def __init__(self,
+                 unsorted_source_frame: pl.LazyFrame,
+                 rows_count: int,
+                 sorted_row_idx: Union[None, pl.Series] = None,
+                 org_col_idx: Union[None, List[int]] = None,
+                 ):
+        self.__column_names: List[str] = list(collect_schema(unsorted_source_frame).keys())
+        self.region = Region.with_frame_shape((rows_count, len(self.__column_names)))
+        self.__unsorted_source_frame: pl.LazyFrame = unsorted_source_frame
+        self.__sorted_row_idx: Union[None, pl.Series] = sorted_row_idx
+        self.__org_col_idx: Union[None, List[int]] = org_col_idx
+        self.__chunk_region: Union[None, Region] = None
+        self.__chunk: Union[None, pl.DataFrame] = None
+
+    def unlink(self):
+        self.__unsorted_source_frame = None
+        self.__column_names = None
+        self.__sorted_row_idx = None
+        self.__org_col_idx = None
+        self.__chunk_region = None
+        self.__chunk = None
+
+    def row_idx_iter(self, region: Region = None) -> Iterator[int]:
+        yield from self.row_idx_slice(region).to_list()
+
+    def row_idx_slice(self, region: Region = None) -> pl.Series:
+        region = self.region.get_bounded_region(region)
+        if self.__sorted_row_idx is None:
+            return pl.int_range(region.first_row, region.first_row + region.rows, eager=True)
+        return self.__sorted_row_idx.slice(region.first_row, region.rows)
+
+    def series_chunk_at(self, col: int, region: Region = None) -> pl.Series:
+        region = self.region.get_bounded_region(region)
+        # The chunk data generator requests the columns of a region one after another.
+        # Therefore, all columns of a region are collected at once, to scan the data source only once per region.
+        if self.__chunk_region != region:
+            self.__chunk = self.__collect_chunk(region)
+            self.__chunk_region = region
+        return self.__chunk.get_column(self.__column_names[self.region.first_col + col])
+
+    def __collect_chunk(self, region: Region) -> pl.DataFrame:
+        names = self.__column_names[region.first_col:region.first_col + region.cols]
+        if self.__sorted_row_idx is None or region.rows == 0:
+            return self.__unsorted_source_frame.slice(region.first_row, region.rows).select(names).collect()
+
+        # The rows of a sorted chunk are spread over the whole data source.
+        # Therefore, they are selected only by their row index, to not collect the rows in between.
+        row_idx = self.row_idx_slice(region)
+        chunk = with_row_index(
+            self.__unsorted_source_frame.select(names),
+            ROW_IDX_COL_NAME,
+        ).filter(pl.col(ROW_IDX_COL_NAME).is_in(row_idx)).collect()
+        # The rows are collected in the order of the data source and have to be brought into sort order.
+        # The row indices are unique, therefore the rank of a row index is its position in the collected chunk.
+        return chunk.select(pl.col(names).gather(row_idx.rank('ordinal') - 1))
+
+    def get_column_indices(self) -> List[int]:
+        if self.__org_col_idx is None:
+            return list(range(self.region.cols))
+        return self.__org_col_idx
+
+    def get_col_index_in_source_frame(self, col: int) -> int:
+        return col if self.__org_col_idx is None else self.__org_col_idx[col]
+
+    def get_column_statistics(self, col_index: int) -> Dict[str, str]:
+        return self.get_columns_statistics([col_index])[col_index]
+
+    def get_columns_statistics(self, col_indices: List[int]) -> Dict[int, Dict[str, str]]:
+        col_indices = list(dict.fromkeys(col_indices))
+        names = [self.__column_names[self.region.first_col + c] for c in col_indices]
+        frame = self.__unsorted_source_frame.select(names).collect()
+        if self.__sorted_row_idx is not None and len(self.__sorted_row_idx) != frame.height:
+            # the statistics don't depend on the order of the rows, only the filtered rows are required
+            frame = frame[self.__sorted_row_idx]
+        return describe_columns(frame, col_indices)
@@ -11,15 +11,18 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Any
+from typing import Any, Dict, List, Tuple, Union
 
-from polars import DataFrame, Series, datatypes
+import polars as pl
+from polars import DataFrame, LazyFrame, Series, datatypes
 
-from cms_rendner_sdfv.base.table_source import AbstractMetaComputer
+from cms_rendner_sdfv.base.table_source import AbstractMetaComputer, MinMaxInfo
+from cms_rendner_sdfv.base.types import CellMeta
+from cms_rendner_sdfv.polars.lazy_visible_frame import collect_schema
 
 
 class MetaComputer(AbstractMetaComputer):
-    def __init__(self, source_frame: DataFrame):
+    def __init__(self, source_frame: Union[DataFrame, LazyFrame]):
         super().__init__()
         self.__source_frame = source_frame
 
@@ -27,8 +30,70 @@ class MetaComputer(AbstractMetaComputer):
         self.__source_frame = None
 
     def _compute_min_max_at(self, col: int) -> (Any, Any):
+        if isinstance(self.__source_frame, LazyFrame):
+            name, dtype = list(collect_schema(self.__source_frame).items())[col]
+            if dtype.is_numeric() and dtype is not datatypes.Boolean:
+                # only the min and max value are materialized
+                return self.__source_frame.select(
+                    pl.col(name).min().alias("min"),
+                    pl.col(name).max().alias("max"),
+                ).collect().row(0)
+            return None, None
+
         name = self.__source_frame.columns[col]
         column: Series = self.__source_frame.get_column(name)
         if column.dtype.is_numeric() and column.dtype is not datatypes.Boolean:
             return column.min(), column.max()
         return None, None
+
+    def _compute_min_max_of_all_columns(self) -> Dict[int, Tuple[Any, Any]]:
+        result: Dict[int, Tuple[Any, Any]] = {}
+
+        exprs = []
+        numeric_cols = []
+        for col, (name, dtype) in enumerate(collect_schema(self.__source_frame).items()):
+            if dtype.is_numeric() and dtype is not datatypes.Boolean:
+                numeric_cols.append(col)
+                exprs.append(pl.col(name).min().alias(f"min_{col}"))
+                exprs.append(pl.col(name).max().alias(f"max_{col}"))
+            else:
+                result[col] = (None, None)
+
+        if exprs:
+            # all columns are reduced in a single query
+            min_max_frame = self.__source_frame.select(exprs)
+            if isinstance(min_max_frame, LazyFrame):
+                min_max_frame = min_max_frame.collect()
+            min_max = min_max_frame.row(0)
+            for i, col in enumerate(numeric_cols):
+                result[col] = (min_max[2 * i], min_max[2 * i + 1])
+
+        return result
+
+    def _compute_column_cell_meta(self, info: MinMaxInfo, values: Any) -> List[CellMeta]:
+        if not isinstance(values, Series) or not (values.dtype.is_integer() or values.dtype.is_float()):
+            return super()._compute_column_cell_meta(info, values)
+
+        org_v = pl.lit(values)
+        v = org_v.cast(pl.Float64)
+        if info.is_inf:
+            cmap = pl.lit(-1)
+        elif info.min == info.max:
+            cmap = pl.lit(0)
+        else:
+            cmap = (100_000 * ((v - info.min) / (info.max - info.min))).cast(pl.Int64, strict=False)
+
+        df = pl.select(
+            is_null=org_v.is_null(),
+            is_nan=org_v.is_nan() if values.dtype.is_float() else pl.lit(False),
+            is_min=org_v == info.min,
+            is_max=org_v == info.max,
+            cmap=cmap,
+        )
+
+        return [
+            CellMeta(cmap_value=-1) if is_null
+            else CellMeta.nan() if is_nan
+            else CellMeta(is_min=is_min, is_max=is_max, cmap_value=cmap)
+            for is_null, is_nan, is_min, is_max, cmap in df.iter_rows()
+        ]
@@ -19,6 +19,7 @@ from cms_rendner_sdfv.base.table_source import AbstractTableSource, AbstractTabl
 from cms_rendner_sdfv.base.types import CreateTableSourceConfig, CreateTableSourceFailure, CreateTableSourceErrorKind
 from cms_rendner_sdfv.polars.create_fingerprint import create_fingerprint
 from cms_rendner_sdfv.polars.frame_context import FrameContext
+from cms_rendner_sdfv.polars.lazy_visible_frame import ROW_IDX_COL_NAME, with_row_index
 from cms_rendner_sdfv.polars.table_source import TableSource
 
 
@@ -32,7 +33,7 @@ class TableSourceFactory(AbstractTableSourceFactory):
         ds_frame = None
         if isinstance(data_source, dict):
             ds_frame = pl.from_dict(data_source)
-        elif isinstance(data_source, pl.DataFrame):
+        elif isinstance(data_source, (pl.DataFrame, pl.LazyFrame)):
             ds_frame = data_source
         else:
             return CreateTableSourceFailure(
@@ -41,7 +42,7 @@ class TableSourceFactory(AbstractTableSourceFactory):
             )
 
         pre_fingerprint = config.previous_fingerprint
-        cur_fingerprint = create_fingerprint(ds_frame, data_source)
+        cur_fingerprint = create_fingerprint(ds_frame, data_source, bool(config.fingerprint_content_sample))
         if pre_fingerprint is not None and pre_fingerprint != cur_fingerprint:
             return CreateTableSourceFailure(
                 error_kind=CreateTableSourceErrorKind.INVALID_FINGERPRINT,
@@ -49,6 +50,7 @@ class TableSourceFactory(AbstractTableSourceFactory):
             )
 
         filtered_frame = None
+        filter_row_idx = None
         filter_eval_expr = config.filter_eval_expr
         if filter_eval_expr is not None and filter_eval_expr != "":
             try:
@@ -63,10 +65,33 @@ class TableSourceFactory(AbstractTableSourceFactory):
                     info=repr(e),
                 )
 
-            if not isinstance(filtered_frame, pl.DataFrame):
-                return CreateTableSourceFailure(
-                    error_kind=CreateTableSourceErrorKind.FILTER_FRAME_OF_WRONG_TYPE,
-                    info=str(type(filtered_frame)),
-                )
+            if isinstance(filtered_frame, pl.Expr) or \
+                    (isinstance(filtered_frame, pl.Series) and filtered_frame.dtype == pl.Boolean):
+                # only the positions of the matching rows are kept instead of a filtered copy of the data-frame
+                try:
+                    filter_row_idx = with_row_index(ds_frame.lazy(), ROW_IDX_COL_NAME) \
+                        .filter(filtered_frame) \
+                        .select(ROW_IDX_COL_NAME) \
+                        .collect() \
+                        .get_column(ROW_IDX_COL_NAME)
+                except Exception as e:
+                    return CreateTableSourceFailure(
+                        error_kind=CreateTableSourceErrorKind.FILTER_FRAME_EVAL_FAILED,
+                        info=repr(e),
+                    )
+                filtered_frame = None
+            else:
+                if isinstance(ds_frame, pl.LazyFrame):
+                    if isinstance(filtered_frame, pl.DataFrame):
+                        filtered_frame = filtered_frame.lazy()
+                    expected_type = pl.LazyFrame
+                else:
+                    expected_type = pl.DataFrame
+
+                if not isinstance(filtered_frame, expected_type):
+                    return CreateTableSourceFailure(
+                        error_kind=CreateTableSourceErrorKind.FILTER_FRAME_OF_WRONG_TYPE,
+                        info=str(type(filtered_frame)),
+                    )
 
-        return TableSource(FrameContext(ds_frame, filtered_frame), fingerprint=cur_fingerprint)
+        return TableSource(FrameContext(ds_frame, filtered_frame, filter_row_idx), fingerprint=cur_fingerprint)
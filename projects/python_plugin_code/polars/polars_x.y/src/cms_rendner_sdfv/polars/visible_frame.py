@@ -25,7 +25,11 @@ class VisibleFrame:
                  sorted_row_idx: Union[None, pl.Series] = None,
                  org_col_idx: Union[None, List[int]] = None,
                  ):
-        self.region = Region.with_frame_shape(unsorted_source_frame.shape)
+        # a sorted row index can also only contain the rows which match a filter expression
+        self.region = Region.with_frame_shape(
+            unsorted_source_frame.shape if sorted_row_idx is None
+            else (len(sorted_row_idx), unsorted_source_frame.width)
+        )
         self.__unsorted_source_frame: pl.DataFrame = unsorted_source_frame
         self.__column_names: List[str] = unsorted_source_frame.columns
         self.__sorted_row_idx: Union[None, pl.Series] = sorted_row_idx
@@ -38,19 +42,25 @@ class VisibleFrame:
         self.__org_col_idx = None
 
     def row_idx_iter(self, region: Region = None) -> Iterator[int]:
+        yield from self.row_idx_slice(region).to_list()
+
+    def row_idx_slice(self, region: Region = None) -> pl.Series:
         region = self.region.get_bounded_region(region)
-        r = 0
-        while r < region.rows:
-            if self.__sorted_row_idx is None:
-                yield r + region.first_row
-            else:
-                yield self.__sorted_row_idx[r + region.first_row]
-            r += 1
+        if self.__sorted_row_idx is None:
+            return pl.int_range(region.first_row, region.first_row + region.rows, eager=True)
+        return self.__sorted_row_idx.slice(region.first_row, region.rows)
 
     def series_at(self, col: int) -> pl.Series:
         name = self.__column_names[self.region.first_col + col]
         return self.__unsorted_source_frame.get_column(name)
 
+    def series_chunk_at(self, col: int, region: Region = None) -> pl.Series:
+        series = self.series_at(col)
+        if self.__sorted_row_idx is None:
+            region = self.region.get_bounded_region(region)
+            return series.slice(region.first_row, region.rows)
+        return series.gather(self.row_idx_slice(region))
+
     def get_column_indices(self) -> List[int]:
         if self.__org_col_idx is None:
             return list(range(self.region.cols))
@@ -60,16 +70,39 @@ class VisibleFrame:
         return col if self.__org_col_idx is None else self.__org_col_idx[col]
 
     def get_column_statistics(self, col_index: int) -> Dict[str, str]:
-        def truncate(v) -> str:
-            vs = str(v)
-            # truncate too long values
-            return vs if len(vs) <= COL_STATISTIC_ENTRY_MAX_STR_LEN else vs[:COL_STATISTIC_ENTRY_MAX_STR_LEN - 1] + '…'
-
-        try:
-            s = self.series_at(col_index)
-            df = s.describe()
-            keys = df.get_column(df.columns[0]).to_list()
-            values = [truncate(v) for v in df.get_column(df.columns[1]).to_list()]
-            return dict(zip(keys, values))
-        except TypeError as e:
-            return {'error': str(e)}
+        return self.get_columns_statistics([col_index])[col_index]
+
+    def get_columns_statistics(self, col_indices: List[int]) -> Dict[int, Dict[str, str]]:
+        col_indices = list(dict.fromkeys(col_indices))
+        names = [self.__column_names[self.region.first_col + c] for c in col_indices]
+        frame = self.__unsorted_source_frame.select(names)
+        if self.__sorted_row_idx is not None and len(self.__sorted_row_idx) != frame.height:
+            # the statistics don't depend on the order of the rows, only the filtered rows are required
+            frame = frame[self.__sorted_row_idx]
+        return describe_columns(frame, col_indices)
+
+
+def describe_columns(frame: pl.DataFrame, col_indices: List[int]) -> Dict[int, Dict[str, str]]:
+    def truncate(v) -> str:
+        vs = str(v)
+        # truncate too long values
+        return vs if len(vs) <= COL_STATISTIC_ENTRY_MAX_STR_LEN else vs[:COL_STATISTIC_ENTRY_MAX_STR_LEN - 1] + '…'
+
+    try:
+        # all columns are described in one pass
+        df = frame.describe()
+    except TypeError as e:
+        if frame.width == 1:
+            return {col_indices[0]: {'error': str(e)}}
+        # describe each column separately, to report the error only for the affected columns
+        result = {}
+        for i, col in enumerate(col_indices):
+            result.update(describe_columns(frame.select(frame.columns[i]), [col]))
+        return result
+
+    keys = df.get_column(df.columns[0]).to_list()
+    return {
+        # statistics which are not available for a column are null, same as "Series.describe" they are skipped
+        col: {k: truncate(v) for k, v in zip(keys, df.to_series(i + 1).to_list()) if v is not None}
+        for i, col in enumerate(col_indices)
+    }
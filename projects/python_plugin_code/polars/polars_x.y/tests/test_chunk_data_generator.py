@@ -1,7 +1,10 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
 import polars as pl
 
 from cms_rendner_sdfv.base.constants import CELL_MAX_STR_LEN, CELL_MAX_LIST_LEN
-from cms_rendner_sdfv.base.types import ChunkDataResponse, Cell, CellMeta
+from cms_rendner_sdfv.base.types import ChunkDataResponse, Cell, CellMeta, Region
 from cms_rendner_sdfv.polars.frame_context import FrameContext
 
 
@@ -94,6 +97,32 @@ def test_config_float_precision():
     assert actual.cells[0][0].value == '1.235'
 
 
+def test_non_stringlike_values_are_formatted_like_polars():
+    df = pl.DataFrame({
+        "int": [3, None, 1_000_000, -2],
+        "float": [1.5, float("nan"), 1.23456789e12, None],
+        "bool": [True, False, None, True],
+        "date": [date(2024, 1, 31), None, date(1970, 1, 1), date(2000, 2, 29)],
+        "datetime": [datetime(2024, 1, 31, 12, 30), None, datetime(1970, 1, 1), datetime(2000, 2, 29, 0, 0, 1)],
+        "duration": [timedelta(days=1, hours=2), None, timedelta(0), timedelta(microseconds=5)],
+        "decimal": pl.Series([Decimal("1.10"), None, Decimal("-3.00"), Decimal("0.01")], dtype=pl.Decimal(10, 2)),
+    })
+
+    ctx = FrameContext(df)
+    ctx.set_sort_criteria([0], [False])
+    actual = ctx.get_chunk_data_generator().generate(Region(first_row=1, rows=3, cols=df.width))
+
+    sorted_df = df.sort("int", descending=True)
+    with pl.Config() as cfg:
+        cfg.set_fmt_str_lengths(CELL_MAX_STR_LEN)
+        cfg.set_fmt_table_cell_list_len(CELL_MAX_LIST_LEN)
+        expected = [
+            [sorted_df.to_series(c)._s.get_fmt(r, CELL_MAX_STR_LEN) for c in range(df.width)]
+            for r in range(1, 4)
+        ]
+    assert [[c.value for c in row] for row in actual.cells] == expected
+
+
 def test_respects_plugin_max_str_length():
     df = pl.DataFrame({"0": "a" * 2 * CELL_MAX_STR_LEN})
 
@@ -110,3 +139,55 @@ def test_respects_plugin_max_list_length():
     actual = FrameContext(df).get_chunk_data_generator().generate()
 
     assert actual.cells[0][0].value.count('a') == CELL_MAX_LIST_LEN
+
+
+def test_stringlike_values_are_truncated_like_polars():
+    df = pl.DataFrame({"0": ['"a"' * CELL_MAX_STR_LEN, '', None]})
+
+    actual = FrameContext(df).get_chunk_data_generator().generate()
+
+    assert actual.cells == [
+        [Cell(value=('"a"' * CELL_MAX_STR_LEN)[:CELL_MAX_STR_LEN] + '…')],
+        [Cell(value='')],
+        [Cell(value='null')],
+    ]
+
+
+def test_large_nested_values_are_truncated_like_polars():
+    df = pl.DataFrame({
+        "list": [list(range(CELL_MAX_LIST_LEN * 100)), list(range(CELL_MAX_LIST_LEN + 1)), [], None],
+        "nested_list": [[list(range(CELL_MAX_LIST_LEN * 100))] * (CELL_MAX_LIST_LEN * 2), [], [None], None],
+        "struct": [{"a": list(range(CELL_MAX_LIST_LEN * 100))}, {"a": []}, {"a": None}, None],
+    })
+
+    actual = FrameContext(df).get_chunk_data_generator().generate()
+
+    with pl.Config() as cfg:
+        cfg.set_fmt_str_lengths(CELL_MAX_STR_LEN)
+        cfg.set_fmt_table_cell_list_len(CELL_MAX_LIST_LEN)
+        expected = [
+            [Cell(value=df.to_series(c)._s.get_fmt(r, CELL_MAX_STR_LEN)) for c in range(df.width)]
+            for r in range(df.height)
+        ]
+    assert [[Cell(value=c.value) for c in row] for row in actual.cells] == expected
+
+
+def test_nested_string_values_are_formatted_like_polars():
+    long_str = "a" * 2 * CELL_MAX_STR_LEN
+    df = pl.DataFrame({
+        "list": [[long_str, "b"], [long_str] * (CELL_MAX_LIST_LEN * 2), [None, "é" * (CELL_MAX_STR_LEN + 1)]],
+        "struct": [{"a": long_str, "b": 1}, {"a": "b", "b": None}, {"a": None, "b": 2}],
+        "array": pl.Series([[long_str, "b"], ["c", long_str], [None, "d"]], dtype=pl.Array(pl.Utf8, 2)),
+        "list_of_struct": [[{"a": long_str}] * (CELL_MAX_LIST_LEN * 2), [], None],
+    })
+
+    actual = FrameContext(df).get_chunk_data_generator().generate()
+
+    with pl.Config() as cfg:
+        cfg.set_fmt_str_lengths(CELL_MAX_STR_LEN)
+        cfg.set_fmt_table_cell_list_len(CELL_MAX_LIST_LEN)
+        expected = [
+            [Cell(value=df.to_series(c)._s.get_fmt(r, CELL_MAX_STR_LEN)) for c in range(df.width)]
+            for r in range(df.height)
+        ]
+    assert [[Cell(value=c.value) for c in row] for row in actual.cells] == expected
@@ -31,3 +31,19 @@ def test_different_frames_with_same_source_have_same_fingerprint():
     f1 = create_fingerprint(a, df_dict)
     f2 = create_fingerprint(b, df_dict)
     assert f1 == f2
+
+
+def test_content_sample_detects_in_place_modifications():
+    frame = pl.DataFrame(df_dict)
+    f1 = create_fingerprint(frame, with_content_sample=True)
+    frame[0, '0'] = 99
+    f2 = create_fingerprint(frame, with_content_sample=True)
+    assert f1 != f2
+
+
+def test_content_sample_is_optional():
+    frame = pl.DataFrame(df_dict)
+    f1 = create_fingerprint(frame)
+    frame[0, '0'] = 99
+    f2 = create_fingerprint(frame)
+    assert f1 == f2
@@ -1,4 +1,7 @@
+import threading
+
 import polars as pl
+import pytest
 
 from cms_rendner_sdfv.base.types import TableStructureColumnInfo, TableStructureColumn, \
     TableStructure, CompletionVariant, TextAlign
@@ -35,6 +38,76 @@ def test_previous_sort_criteria_does_not_affect_later_sort_criteria():
     assert index_after_first_sort == index_after_last_sort
 
 
+def test_previous_sort_permutation_is_reused():
+    ctx = FrameContext(df)
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[False])
+    first_sorted_row_idx = ctx.visible_frame._VisibleFrame__sorted_row_idx
+
+    ctx.set_sort_criteria(sort_by_column_index=[1], sort_ascending=[True])
+    assert ctx.visible_frame._VisibleFrame__sorted_row_idx is not first_sorted_row_idx
+
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[False])
+    assert ctx.visible_frame._VisibleFrame__sorted_row_idx is first_sorted_row_idx
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize("ascending", [True, False])
+def test_progressive_sort(ascending: bool, lazy: bool):
+    progressive_df = pl.from_dict({"col_0": [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5], "col_1": list(range(11))})
+    expected_row_idx = progressive_df \
+        .sort("col_0", descending=not ascending, maintain_order=True) \
+        .get_column("col_1") \
+        .to_list()
+
+    ctx = FrameContext(progressive_df.lazy() if lazy else progressive_df)
+    ctx.enable_progressive_sort(window_size=4)
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[ascending])
+    leading_row_idx = list(ctx.visible_frame.row_idx_iter())
+
+    for t in threading.enumerate():
+        if t is not threading.current_thread() and t.daemon:
+            t.join(timeout=5)
+
+    assert ctx.is_sort_complete()
+    assert leading_row_idx[:4] == expected_row_idx[:4]
+    assert sorted(leading_row_idx) == sorted(expected_row_idx)
+    assert list(ctx.visible_frame.row_idx_iter()) == expected_row_idx
+
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_failed_progressive_sort_can_be_reapplied(monkeypatch, lazy: bool):
+    progressive_df = pl.from_dict({"col_0": [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5], "col_1": list(range(11))})
+    expected_row_idx = progressive_df.sort("col_0", maintain_order=True).get_column("col_1").to_list()
+
+    def compute_sorted_row_idx(*args, **kwargs):
+        raise MemoryError()
+
+    monkeypatch.setattr(FrameContext, '_FrameContext__compute_sorted_row_idx', compute_sorted_row_idx)
+
+    ctx = FrameContext(progressive_df.lazy() if lazy else progressive_df)
+    ctx.enable_progressive_sort(window_size=4)
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[True])
+    _join_daemon_threads()
+
+    # only the leading window is sorted
+    assert not ctx.is_sort_complete()
+    assert list(ctx.visible_frame.row_idx_iter())[:4] == expected_row_idx[:4]
+
+    monkeypatch.undo()
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[True])
+    _join_daemon_threads()
+
+    assert ctx.is_sort_complete()
+    assert list(ctx.visible_frame.row_idx_iter()) == expected_row_idx
+
+
+def _join_daemon_threads():
+    for t in threading.enumerate():
+        if t is not threading.current_thread() and t.daemon:
+            t.join(timeout=5)
+
+
 def test_filter_is_respected():
     ctx = FrameContext(df, df.filter(pl.col('col_0').is_between(1, 2)))
     table_structure = ctx.get_table_structure("")
@@ -43,6 +116,38 @@ def test_filter_is_respected():
     assert table_structure.org_rows_count == 5
 
 
+def test_filter_is_respected_for_lazy_frame():
+    lf = df.lazy()
+    ctx = FrameContext(lf, lf.filter(pl.col('col_0').is_between(1, 2)))
+    table_structure = ctx.get_table_structure("")
+
+    assert table_structure.rows_count == 2
+    assert table_structure.org_rows_count == 5
+
+
+@pytest.mark.parametrize("source", [df, df.lazy()])
+def test_filter_row_idx_is_respected(source):
+    ctx = FrameContext(source, filter_row_idx=pl.Series([1, 2], dtype=pl.UInt32))
+    table_structure = ctx.get_table_structure("")
+
+    assert table_structure.rows_count == 2
+    assert table_structure.org_rows_count == 5
+    assert list(ctx.visible_frame.row_idx_iter()) == [1, 2]
+
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[False])
+    assert list(ctx.visible_frame.row_idx_iter()) == [2, 1]
+
+
+@pytest.mark.parametrize("source", [df, df.lazy()])
+def test_column_statistics_with_filter_row_idx(source):
+    filter_row_idx = pl.Series([1, 2], dtype=pl.UInt32)
+    expected = FrameContext(df, df[filter_row_idx]).get_columns_statistics([0, 1])
+
+    ctx = FrameContext(source, filter_row_idx=filter_row_idx)
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[False])
+    assert ctx.get_columns_statistics([0, 1]) == expected
+
+
 def test_column_name_completion_variants():
     ctx = FrameContext(df2)
 
@@ -90,3 +195,18 @@ def test_table_structure():
             ]
         )
     )
+
+
+def test_table_structure_for_lazy_frame():
+    assert FrameContext(df.lazy()).get_table_structure(fingerprint="finger-1") == \
+           FrameContext(df).get_table_structure(fingerprint="finger-1")
+
+
+def test_column_statistics_are_cached():
+    ctx = FrameContext(df)
+
+    first = ctx.get_column_statistics(1)
+    ctx.set_sort_criteria(sort_by_column_index=[0], sort_ascending=[False])
+
+    assert ctx.get_column_statistics(1) is first
+    assert ctx.get_columns_statistics([0, 1]) == {0: ctx.get_column_statistics(0), 1: first}
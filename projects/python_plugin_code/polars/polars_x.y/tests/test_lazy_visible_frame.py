@@ -0,0 +1,42 @@
+import polars as pl
+
+from cms_rendner_sdfv.base.types import Region
+from cms_rendner_sdfv.polars.lazy_visible_frame import LazyVisibleFrame
+
+df_dict = {
+    "col_0": [4, 4, 4, 1, 4],
+    "col_1": ["1", "4", "4", "1", "2"],
+}
+
+lf = pl.LazyFrame(df_dict)
+
+
+def test_region():
+    vf = LazyVisibleFrame(unsorted_source_frame=lf, rows_count=5)
+    assert vf.region == Region(0, 0, 5, 2)
+
+
+def test_series_chunk_at():
+    vf = LazyVisibleFrame(unsorted_source_frame=lf, rows_count=5)
+    assert vf.series_chunk_at(1, Region(2, 0, 10, 2)).to_list() == ["4", "1", "2"]
+    assert vf.series_chunk_at(0, Region(2, 0, 10, 2)).to_list() == [4, 1, 4]
+
+
+def test_series_chunk_at_sorted():
+    vf = LazyVisibleFrame(unsorted_source_frame=lf, rows_count=5, sorted_row_idx=pl.Series([4, 1, 3, 0, 2]))
+    assert vf.series_chunk_at(1, Region(1, 0, 3, 2)).to_list() == ["4", "1", "1"]
+    assert vf.series_chunk_at(1, Region(5, 0, 3, 2)).to_list() == []
+
+
+def test_series_chunk_at_sorted_does_not_slice_source(monkeypatch):
+    def slice_source(*args, **kwargs):
+        raise AssertionError("rows of a sorted chunk have to be selected by their row index")
+
+    monkeypatch.setattr(pl.LazyFrame, 'slice', slice_source)
+    vf = LazyVisibleFrame(unsorted_source_frame=lf, rows_count=5, sorted_row_idx=pl.Series([4, 1, 3, 0, 2]))
+    assert vf.series_chunk_at(1, Region(0, 0, 2, 2)).to_list() == ["2", "4"]
+
+
+def test_get_column_statistics():
+    vf = LazyVisibleFrame(unsorted_source_frame=lf, rows_count=5)
+    assert vf.get_column_statistics(0)['max'] == '4.0'
@@ -1,4 +1,5 @@
 import polars as pl
+import pytest
 
 from cms_rendner_sdfv.base.types import CellMeta
 from cms_rendner_sdfv.polars.frame_context import MetaComputer
@@ -64,3 +65,36 @@ def test_with_string():
 
     actual = mc.compute_cell_meta(0, df.item(0, 0))
     assert actual is None
+
+
+@pytest.mark.parametrize(
+    "values", [
+        [1, 2, None, 4],
+        [1.5, float("nan"), None, -3.25, 8.0],
+        [1.5, float("inf"), 2.0],
+        [7, 7],
+        ["a", "b"],
+    ]
+)
+def test_compute_column_meta_matches_compute_cell_meta(values):
+    df = pl.from_dict({'a': values})
+
+    mc = MetaComputer(df)
+
+    actual = mc.compute_column_meta(0, df.get_column('a'))
+    assert actual == [mc.compute_cell_meta(0, v) for v in values]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_precompute_min_max_matches_min_max_per_column(lazy: bool):
+    df = pl.from_dict({
+        'a': [1, 2, 3],
+        'b': [1.5, float("nan"), -3.25],
+        'c': ["a", "b", "c"],
+        'd': [True, False, True],
+        'e': [None, 5, 6],
+    })
+
+    mc = MetaComputer(df.lazy() if lazy else df)
+    actual = mc._compute_min_max_of_all_columns()
+    assert actual == {col: mc._compute_min_max_at(col) for col in range(len(df.columns))}
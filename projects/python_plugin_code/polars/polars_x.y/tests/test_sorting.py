@@ -54,3 +54,40 @@ def test_sorting_by_multiple_columns(sort_by, descending):
         sort_by,
         descending,
     )
+
+
+@pytest.mark.parametrize(
+    "sort_by, descending", [
+        ([0], [True]),
+        ([4, 2, 3], [False, True, False]),
+    ]
+)
+def test_sorting_lazy_frame(sort_by, descending):
+    sorted_df = df.sort(by=[df.columns[i] for i in sort_by], descending=descending)
+    expected_chunk_data = FrameContext(sorted_df).get_chunk_data_generator().generate()
+
+    actual_ctx = FrameContext(df.lazy())
+    actual_ctx.set_sort_criteria(sort_by, sort_ascending=[not desc for desc in descending])
+    actual_chunk_data = actual_ctx.get_chunk_data_generator().generate_by_combining_chunks(
+        rows_per_chunk=2,
+        cols_per_chunk=2,
+    )
+
+    assert actual_chunk_data == expected_chunk_data
+
+
+@pytest.mark.parametrize("source", [df, df.lazy()])
+def test_sorting_with_filter_row_idx(source):
+    filter_row_idx = pl.Series([0, 2, 3], dtype=pl.UInt32)
+    expected_ctx = FrameContext(df, df[filter_row_idx])
+    expected_ctx.set_sort_criteria([1], sort_ascending=[False])
+    expected_chunk_data = expected_ctx.get_chunk_data_generator().generate()
+
+    actual_ctx = FrameContext(source, filter_row_idx=filter_row_idx)
+    actual_ctx.set_sort_criteria([1], sort_ascending=[False])
+    actual_chunk_data = actual_ctx.get_chunk_data_generator().generate_by_combining_chunks(
+        rows_per_chunk=2,
+        cols_per_chunk=2,
+    )
+
+    assert actual_chunk_data == expected_chunk_data
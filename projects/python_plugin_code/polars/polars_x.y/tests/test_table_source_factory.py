@@ -2,6 +2,7 @@ import json
 from typing import Any, Union
 
 import polars as pl
+import pytest
 
 from cms_rendner_sdfv.base.table_source import AbstractTableSource
 from cms_rendner_sdfv.base.types import CreateTableSourceConfig, CreateTableSourceFailure, ChunkDataResponse, \
@@ -98,12 +99,25 @@ def test_create_fails_on_unsupported_data_source():
     assert failure.info == str(type([]))
 
 
-def test_create_fails_on_unsupported_data_source__for_lazy_frames():
-    failure = _create_table_source(pl.LazyFrame())
+def test_create_for_lazy_frame():
+    table_source = _create_table_source(df.lazy())
+    assert isinstance(table_source, TableSource)
 
-    assert isinstance(failure, CreateTableSourceFailure)
-    assert failure.error_kind == CreateTableSourceErrorKind.UNSUPPORTED_DATA_SOURCE_TYPE
-    assert failure.info == str(type(pl.LazyFrame()))
+    info = json.loads(table_source.get_info())
+    assert info['structure']['rows_count'] == 3
+    assert info['structure']['columns_count'] == 2
+
+
+def test_create_with_filter_for_lazy_frame():
+    table_source = _create_table_source(
+        df.lazy(),
+        CreateTableSourceConfig(filter_eval_expr="_df.filter(pl.col('0') > 0)", filter_eval_expr_provide_frame=True),
+    )
+    assert isinstance(table_source, TableSource)
+
+    info = json.loads(table_source.get_info())
+    assert info['structure']['org_rows_count'] == 3
+    assert info['structure']['rows_count'] == 2
 
 
 def test_create_fails_on_invalid_fingerprint():
@@ -181,6 +195,55 @@ def test_create_with_filter():
     )
 
 
+@pytest.mark.parametrize(
+    "data_source, filter_eval_expr",
+    [
+        (df, "pl.col('0').is_between(1, 3)"),
+        (df, "_df.get_column('0').is_between(1, 3)"),
+        (df.lazy(), "pl.col('0').is_between(1, 3)"),
+    ],
+)
+def test_create_with_filter_predicate(data_source, filter_eval_expr: str):
+    table_source = _create_table_source(
+        data_source,
+        CreateTableSourceConfig(filter_eval_expr=filter_eval_expr, filter_eval_expr_provide_frame=True),
+    )
+    assert isinstance(table_source, TableSource)
+
+    info = json.loads(table_source.get_info())
+    assert info['structure']['org_rows_count'] == 3
+    assert info['structure']['rows_count'] == 2
+    assert info['structure']['columns_count'] == 2
+
+    assert table_source.compute_chunk_data(
+        Region(0, 0, 2, 2),
+    ) == table_source.serialize(
+        ChunkDataResponse(
+            cells=[
+                [
+                    Cell(value='1', meta=CellMeta(cmap_value=50000).pack()),
+                    Cell(value='4', meta=CellMeta(cmap_value=50000).pack()),
+                ],
+                [
+                    Cell(value='2', meta=CellMeta.max().pack()),
+                    Cell(value='5', meta=CellMeta.max().pack()),
+                ],
+            ],
+        )
+    )
+
+
+def test_create_fails_on_non_boolean_filter_series():
+    failure = _create_table_source(
+        df,
+        CreateTableSourceConfig(filter_eval_expr="_df.get_column('0')", filter_eval_expr_provide_frame=True),
+    )
+
+    assert isinstance(failure, CreateTableSourceFailure)
+    assert failure.error_kind == CreateTableSourceErrorKind.FILTER_FRAME_OF_WRONG_TYPE
+    assert failure.info == str(pl.Series)
+
+
 def test_filter_expr_can_resolve_local_variable():
     # used in the filter query
     col = pl.col('0')
@@ -1,6 +1,7 @@
 import polars as pl
 
 from cms_rendner_sdfv.base.constants import COL_STATISTIC_ENTRY_MAX_STR_LEN
+from cms_rendner_sdfv.base.types import Region
 from cms_rendner_sdfv.polars.visible_frame import VisibleFrame
 
 df_dict = {
@@ -17,6 +18,27 @@ def test_series_at():
     assert vf.series_at(1).name == "col_1"
 
 
+def test_row_idx_slice():
+    vf = VisibleFrame(unsorted_source_frame=df)
+    assert vf.row_idx_slice(Region(1, 0, 3, 1)).to_list() == [1, 2, 3]
+
+
+def test_row_idx_slice_sorted():
+    vf = VisibleFrame(unsorted_source_frame=df, sorted_row_idx=pl.Series([4, 3, 2, 1, 0]))
+    assert vf.row_idx_slice(Region(1, 0, 3, 1)).to_list() == [3, 2, 1]
+    assert list(vf.row_idx_iter()) == [4, 3, 2, 1, 0]
+
+
+def test_series_chunk_at():
+    vf = VisibleFrame(unsorted_source_frame=df)
+    assert vf.series_chunk_at(1, Region(2, 0, 10, 1)).to_list() == ["4", "1", "2"]
+
+
+def test_series_chunk_at_sorted():
+    vf = VisibleFrame(unsorted_source_frame=df, sorted_row_idx=pl.Series([4, 3, 2, 1, 0]))
+    assert vf.series_chunk_at(1, Region(2, 0, 10, 1)).to_list() == ["4", "4", "1"]
+
+
 def test_get_column_indices():
     vf = VisibleFrame(unsorted_source_frame=df)
 
@@ -60,3 +82,19 @@ def test_truncate_column_statistics():
     actual = vf.get_column_statistics(0)
     assert len(actual.get('min')) == COL_STATISTIC_ENTRY_MAX_STR_LEN
     assert len(actual.get('max')) == COL_STATISTIC_ENTRY_MAX_STR_LEN
+
+
+def test_get_columns_statistics_matches_get_column_statistics():
+    source = pl.from_dict({
+        'str': ['d', 'e', None],
+        'numeric': [1, 2, 3],
+        'bool': [True, False, None],
+        'list': [[1], [2, 3], []],
+    })
+    vf = VisibleFrame(unsorted_source_frame=source)
+
+    actual = vf.get_columns_statistics([0, 1, 2, 3])
+    assert actual == {
+        col: {k: str(v) for k, v in source.to_series(col).describe().rows()}
+        for col in range(4)
+    }
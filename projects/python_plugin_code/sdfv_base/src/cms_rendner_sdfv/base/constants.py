@@ -14,4 +14,7 @@
 CELL_MAX_LIST_LEN = 42
 CELL_MAX_STR_LEN = 200
 COL_STATISTIC_ENTRY_MAX_STR_LEN = 120
+FINGERPRINT_CONTENT_SAMPLE_ROWS = 100
+PROGRESSIVE_SORT_WINDOW_SIZE = 1000
+STYLE_PRECOMPUTE_MAX_CELLS = 100_000
 
@@ -13,15 +13,18 @@
 #  limitations under the License.
 import inspect
 import math
+import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass, field
-from typing import Any, List, Union, TypeVar, Dict, Callable
+from typing import Any, List, Union, TypeVar, Dict, Callable, Tuple
 
+from cms_rendner_sdfv.base.constants import PROGRESSIVE_SORT_WINDOW_SIZE
 from cms_rendner_sdfv.base.temp import TEMP_VARS, EvaluatedVarsCleaner
 from cms_rendner_sdfv.base.transforms import to_json
 from cms_rendner_sdfv.base.types import CreateTableSourceConfig, CreateTableSourceFailure, Region, ChunkDataResponse, \
     TableSourceKind, TableStructure, CreateTableSourceErrorKind, TableInfo, \
-    CompletionVariant, NestedCompletionVariant, ChunkDataRequest, CellMeta, TextAlign
+    CompletionVariant, NestedCompletionVariant, ChunkDataRequest, CellMeta, TextAlign, SortCriteria
 import cms_rendner_sdfv.base.types as _types
 
 
@@ -47,13 +50,34 @@ class AbstractMetaComputer:
     def clear_min_max_cache(self):
         self.__min_max_cache.clear()
 
+    def precompute_min_max(self, in_background: bool = False):
+        if in_background:
+            threading.Thread(target=self.__precompute_min_max, daemon=True).start()
+        else:
+            self.__precompute_min_max()
+
     @abstractmethod
     def _compute_min_max_at(self, col: int) -> (Any, Any):
         pass
 
+    def _compute_min_max_of_all_columns(self) -> Dict[int, Tuple[Any, Any]]:
+        # Subclasses should compute the min and max values of all columns at once.
+        # The default implementation doesn't support it, the values are computed on demand per column.
+        return {}
+
     def _is_nan(self, v: Any) -> bool:
         return math.isnan(v)
 
+    def __precompute_min_max(self):
+        try:
+            min_max_of_columns = self._compute_min_max_of_all_columns()
+        except:
+            return
+
+        for col, (min, max) in min_max_of_columns.items():
+            # don't replace an already computed entry
+            self.__min_max_cache.setdefault(col, self.__create_min_max_info(min, max))
+
     def __get_min_max_info_at(self, col: int) -> Union[None, MinMaxInfo]:
         if col not in self.__min_max_cache:
             try:
@@ -61,13 +85,16 @@ class AbstractMetaComputer:
             except:
                 min, max = None, None
 
-            if min is None or max is None:
-                self.__min_max_cache[col] = None
-            else:
-                self.__min_max_cache[col] = MinMaxInfo(min=min, max=max)
+            self.__min_max_cache[col] = self.__create_min_max_info(min, max)
 
         return self.__min_max_cache.get(col)
 
+    @staticmethod
+    def __create_min_max_info(min: Any, max: Any) -> Union[None, MinMaxInfo]:
+        if min is None or max is None:
+            return None
+        return MinMaxInfo(min=min, max=max)
+
     def compute_cell_meta(self,
                           col: int,
                           value: Any,
@@ -77,30 +104,54 @@ class AbstractMetaComputer:
         if info is None:
             return None
 
+        meta = self.__create_cell_meta(info, value)
+        self.__apply_css(meta, css)
+        return meta.pack()
+
+    def compute_column_meta(self,
+                            col: int,
+                            values: Any,
+                            css: Union[None, List[Union[None, Dict[str, str]]]] = None,
+                            ) -> List[Union[None, str]]:
+        info = self.__get_min_max_info_at(col)
+        if info is None:
+            return [None] * len(values)
+
+        metas = self._compute_column_cell_meta(info, values)
+        if css is not None:
+            for meta, cell_css in zip(metas, css):
+                self.__apply_css(meta, cell_css)
+        return [meta.pack() for meta in metas]
+
+    def _compute_column_cell_meta(self, info: MinMaxInfo, values: Any) -> List[CellMeta]:
+        # subclasses can override this method to compute the meta of all values at once
+        return [self.__create_cell_meta(info, v) for v in values]
+
+    def __create_cell_meta(self, info: MinMaxInfo, value: Any) -> CellMeta:
         if value is None:
-            meta = CellMeta(cmap_value=-1)
-        else:
-            try:
-                is_nan = self._is_nan(value)
-            except:
-                is_nan = False
+            return CellMeta(cmap_value=-1)
 
-            if is_nan:
-                meta = CellMeta.nan()
-            else:
-                meta = CellMeta(
-                    is_min=value == info.min,
-                    is_max=value == info.max,
-                    cmap_value=self.__compute_cmap_value(info, value),
-                )
+        try:
+            is_nan = self._is_nan(value)
+        except:
+            is_nan = False
 
+        if is_nan:
+            return CellMeta.nan()
+
+        return CellMeta(
+            is_min=value == info.min,
+            is_max=value == info.max,
+            cmap_value=self.__compute_cmap_value(info, value),
+        )
+
+    @staticmethod
+    def __apply_css(meta: CellMeta, css: Union[None, Dict[str, str]]):
         if css is not None:
             meta.background_color = css.get('background-color')
             meta.text_color = css.get('color')
             meta.text_align = TextAlign.from_css(css.get('text-align'))
 
-        return meta.pack()
-
     @staticmethod
     def __compute_cmap_value(info: MinMaxInfo, value: Any) -> Union[None, int]:
         if info.is_inf:
@@ -124,10 +175,62 @@ class AbstractMetaComputer:
             return None
 
 
+class SortPermutationCache:
+    def __init__(self,
+                 size_of: Callable[[Any], int],
+                 max_entries: int = 8,
+                 max_bytes: int = 256 * 1024 * 1024,
+                 ):
+        self.__size_of = size_of
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        # insertion order is used as LRU order, the least recently used entry is the first one
+        self.__entries: Dict[tuple, Tuple[Any, int]] = dict()
+        self.__total_bytes = 0
+
+    @staticmethod
+    def __to_key(sort_criteria: SortCriteria) -> tuple:
+        # None and [] are interpreted as "no sorting"
+        return tuple(sort_criteria.by_column or []), tuple(sort_criteria.ascending or [])
+
+    def clear(self):
+        self.__entries.clear()
+        self.__total_bytes = 0
+
+    def get(self, sort_criteria: SortCriteria) -> Any:
+        key = self.__to_key(sort_criteria)
+        entry = self.__entries.pop(key, None)
+        if entry is None:
+            return None
+        self.__entries[key] = entry
+        return entry[0]
+
+    def put(self, sort_criteria: SortCriteria, permutation: Any):
+        key = self.__to_key(sort_criteria)
+        old_entry = self.__entries.pop(key, None)
+        if old_entry is not None:
+            self.__total_bytes -= old_entry[1]
+
+        size = self.__size_of(permutation)
+        if size > self.__max_bytes:
+            return
+
+        self.__entries[key] = (permutation, size)
+        self.__total_bytes += size
+
+        while len(self.__entries) > self.__max_entries or self.__total_bytes > self.__max_bytes:
+            lru_key = next(iter(self.__entries))
+            self.__total_bytes -= self.__entries.pop(lru_key)[1]
+
+
 class ChunkDataGenerator(ABC):
     def __init__(self, bounds: Region):
         self.__bounds = bounds
 
+    @property
+    def bounds(self) -> Region:
+        return self.__bounds
+
     def _before_generate(self, region: Region):
         pass
 
@@ -199,6 +302,148 @@ class ChunkDataGenerator(ABC):
         return result if result is not None else ChunkDataResponse()
 
 
+class ChunkPrefetcher:
+    """
+    Computes the chunks adjacent to a requested chunk in a background thread.
+
+    The prefetched chunks are kept in a bounded cache, which is checked first by the next request.
+    Chunks are never computed in parallel. A request waits at most for the chunk which is currently
+    prefetched, all prefetches which haven't been started yet are skipped by the request.
+
+    A single worker thread is used for all prefetches, it only knows the prefetch of the latest request.
+    """
+
+    def __init__(self,
+                 create_generator: Callable[[], ChunkDataGenerator],
+                 is_sort_complete: Callable[[], bool],
+                 max_entries: int = 8,
+                 ):
+        self.__create_generator = create_generator
+        # a progressive sort replaces the order of the rows when completed, which invalidates the chunks
+        self.__is_sort_complete = is_sort_complete
+        self.__max_entries = max_entries
+        # guards the bookkeeping, never held during a computation
+        self.__lock = threading.Lock()
+        # serializes the computations, reentrant to allow a request inside of an "exclusive" block
+        self.__compute_lock = threading.RLock()
+        # insertion order is used as LRU order, the least recently used entry is the first one
+        self.__entries: Dict[tuple, ChunkDataResponse] = dict()
+        # incremented on every request and change of the chunk source, prefetches of previous requests are skipped
+        self.__request_id = 0
+        self.__last_region: Union[None, Region] = None
+        # wakes up the worker thread if a prefetch is pending or the prefetcher was unlinked
+        self.__has_work = threading.Condition(self.__lock)
+        # the prefetch of the latest request: (request_id, regions, request)
+        self.__pending_prefetch: Union[None, Tuple[int, List[Region], ChunkDataRequest]] = None
+        self.__worker: Union[None, threading.Thread] = None
+        self.__is_unlinked = False
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def unlink(self):
+        with self.__lock:
+            self.__request_id += 1
+            self.__entries.clear()
+            self.__pending_prefetch = None
+            self.__is_unlinked = True
+            self.__has_work.notify()
+        with self.__compute_lock:
+            self.__create_generator = None
+            self.__is_sort_complete = None
+
+    @contextmanager
+    def exclusive(self):
+        # Skips the pending prefetches and blocks the computations in the background until the block is left.
+        with self.__lock:
+            self.__request_id += 1
+        with self.__compute_lock:
+            yield
+
+    def change_source(self, change: Callable[[], None]):
+        with self.exclusive():
+            change()
+            with self.__lock:
+                self.__entries.clear()
+
+    def generate(self, region: Region, request: Union[None, ChunkDataRequest] = None) -> ChunkDataResponse:
+        if request is None:
+            request = ChunkDataRequest()
+
+        with self.exclusive():
+            key = (region, request, self.__is_sort_complete())
+            with self.__lock:
+                response = self.__entries.pop(key, None)
+                if response is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+            if response is None:
+                response = self.__create_generator().generate(region=region, request=request)
+
+            with self.__lock:
+                self.__request_id += 1
+                self.__pending_prefetch = (self.__request_id, self.__get_adjacent_regions(region), request)
+                self.__last_region = region
+                if self.__worker is None:
+                    self.__worker = threading.Thread(target=self.__run_worker, daemon=True)
+                    self.__worker.start()
+                self.__has_work.notify()
+
+        return response
+
+    def __get_adjacent_regions(self, region: Region) -> List[Region]:
+        # The chunk in scroll direction is prefetched first, followed by the one in the opposite direction.
+        last = self.__last_region
+        if last is None or last.first_col == region.first_col:
+            forward, backward = region.translate(region.rows, 0), region.translate(-region.rows, 0)
+            if last is not None and region.first_row < last.first_row:
+                forward, backward = backward, forward
+        else:
+            forward, backward = region.translate(0, region.cols), region.translate(0, -region.cols)
+            if region.first_col < last.first_col:
+                forward, backward = backward, forward
+        return [r for r in (forward, backward) if r.is_valid() and not r.is_empty()]
+
+    def __is_outdated(self, request_id: int) -> bool:
+        with self.__lock:
+            return request_id != self.__request_id
+
+    def __run_worker(self):
+        while True:
+            with self.__lock:
+                while self.__pending_prefetch is None and not self.__is_unlinked:
+                    self.__has_work.wait()
+                if self.__is_unlinked:
+                    return
+                request_id, regions, request = self.__pending_prefetch
+                self.__pending_prefetch = None
+            self.__prefetch(request_id, regions, request)
+
+    def __prefetch(self, request_id: int, regions: List[Region], request: ChunkDataRequest):
+        for region in regions:
+            if self.__is_outdated(request_id):
+                return
+            with self.__compute_lock:
+                # a request could have been made while waiting for the lock
+                if self.__is_outdated(request_id):
+                    return
+                key = (region, request, self.__is_sort_complete())
+                with self.__lock:
+                    if key in self.__entries:
+                        continue
+                try:
+                    generator = self.__create_generator()
+                    if generator.bounds.get_bounded_region(region).is_empty():
+                        continue
+                    response = generator.generate(region=region, request=request)
+                except Exception:
+                    return
+                with self.__lock:
+                    self.__entries[key] = response
+                    while len(self.__entries) > self.__max_entries:
+                        self.__entries.pop(next(iter(self.__entries)))
+
+
 class AbstractTableSourceContext(ABC):
     @abstractmethod
     def unlink(self):
@@ -207,6 +452,15 @@ class AbstractTableSourceContext(ABC):
     def set_sort_criteria(self, sort_by_column_index: Union[None, List[int]], sort_ascending: Union[None, List[bool]]):
         pass
 
+    def precompute_min_max(self, in_background: bool = False):
+        pass
+
+    def enable_progressive_sort(self, window_size: int = PROGRESSIVE_SORT_WINDOW_SIZE):
+        pass
+
+    def is_sort_complete(self) -> bool:
+        return True
+
     def get_column_name_completion_variants(self, source: Any, is_synthetic_df: bool) -> List[
         Union[CompletionVariant, NestedCompletionVariant]]:
         pass
@@ -215,6 +469,9 @@ class AbstractTableSourceContext(ABC):
     def get_column_statistics(self, col_index: int) -> Dict[str, str]:
         pass
 
+    def get_columns_statistics(self, col_indices: List[int]) -> Dict[int, Dict[str, str]]:
+        return {col: self.get_column_statistics(col) for col in col_indices}
+
     @abstractmethod
     def get_table_structure(self, fingerprint: str) -> TableStructure:
         pass
@@ -235,8 +492,12 @@ class AbstractTableSource(ABC):
         self.__kind = kind
         self._context = context
         self._fingerprint = fingerprint
+        self.__chunk_prefetcher: Union[None, ChunkPrefetcher] = None
 
     def unlink(self):
+        if self.__chunk_prefetcher is not None:
+            self.__chunk_prefetcher.unlink()
+            self.__chunk_prefetcher = None
         self._context.unlink()
         self._context = None
 
@@ -268,21 +529,67 @@ class AbstractTableSource(ABC):
     def get_column_statistics(self, col_index: int) -> str:
         return self.serialize(self._context.get_column_statistics(col_index))
 
+    def get_columns_statistics(self, col_indices: List[int]) -> str:
+        return self.serialize(self._context.get_columns_statistics(col_indices))
+
     def set_sort_criteria(self,
                           by_column_index: Union[None, List[int]] = None,
                           ascending: Union[None, List[bool]] = None,
                           ) -> 'AbstractTableSource':
-        self._context.set_sort_criteria(by_column_index, ascending)
+        if self.__chunk_prefetcher is None:
+            self._context.set_sort_criteria(by_column_index, ascending)
+        else:
+            self.__chunk_prefetcher.change_source(lambda: self._context.set_sort_criteria(by_column_index, ascending))
         # allow to chain the calls
         return self
 
+    def precompute_min_max(self, in_background: bool = False) -> 'AbstractTableSource':
+        self._context.precompute_min_max(in_background)
+        # allow to chain the calls
+        return self
+
+    def enable_progressive_sort(self, window_size: int = PROGRESSIVE_SORT_WINDOW_SIZE) -> 'AbstractTableSource':
+        self._context.enable_progressive_sort(window_size)
+        # allow to chain the calls
+        return self
+
+    def enable_chunk_prefetch(self) -> 'AbstractTableSource':
+        if self.__chunk_prefetcher is None:
+            self.__chunk_prefetcher = ChunkPrefetcher(
+                create_generator=self.__create_chunk_data_generator,
+                is_sort_complete=self.__is_sort_complete,
+            )
+        # allow to chain the calls
+        return self
+
+    def is_sort_complete(self) -> str:
+        return self.serialize(self._context.is_sort_complete())
+
     def compute_chunk_data(self,
                            region: Region,
                            request: Union[None, ChunkDataRequest] = None,
                            ) -> str:
-        return self.serialize(
-            self._context.get_chunk_data_generator().generate(region=region, request=request)
-        )
+        return self.serialize(self._generate_chunk_data(region, request))
+
+    def _generate_chunk_data(self,
+                             region: Region,
+                             request: Union[None, ChunkDataRequest] = None,
+                             ) -> ChunkDataResponse:
+        if self.__chunk_prefetcher is None:
+            return self._context.get_chunk_data_generator().generate(region=region, request=request)
+        return self.__chunk_prefetcher.generate(region, request)
+
+    def _exclusive_chunk_computation(self):
+        # no chunks are prefetched in the background while the returned context is active
+        if self.__chunk_prefetcher is None:
+            return nullcontext()
+        return self.__chunk_prefetcher.exclusive()
+
+    def __create_chunk_data_generator(self) -> ChunkDataGenerator:
+        return self._context.get_chunk_data_generator()
+
+    def __is_sort_complete(self) -> bool:
+        return self._context.is_sort_complete()
 
     def clear(self, id_names: List[str]) -> 'AbstractTableSource':
         EvaluatedVarsCleaner.clear(id_names, 1)
@@ -320,6 +627,15 @@ class AbstractTableSourceFactory(ABC):
                     f"Created table_source is of type: {actual_type}, expected: ${expected_type}."
                 )
 
+            if config.precompute_min_max:
+                table_source.precompute_min_max(in_background=True)
+
+            if config.progressive_sort:
+                table_source.enable_progressive_sort()
+
+            if config.prefetch_chunks:
+                table_source.enable_chunk_prefetch()
+
             if config.temp_var_slot_id is not None:
                 TEMP_VARS[config.temp_var_slot_id] = table_source
 
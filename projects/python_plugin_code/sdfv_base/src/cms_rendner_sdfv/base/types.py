@@ -259,6 +259,15 @@ class CreateTableSourceConfig:
     previous_fingerprint: Union[None, str] = None
     filter_eval_expr: Union[None, str] = None
     filter_eval_expr_provide_frame: Union[None, bool] = None
+    precompute_min_max: Union[None, bool] = None
+    fingerprint_content_sample: Union[None, bool] = None
+    progressive_sort: Union[None, bool] = None
+    prefetch_chunks: Union[None, bool] = None
+    style_precompute: Union[None, bool] = None
+    style_validation_workers: Union[None, int] = None
+    style_validation_sample_size: Union[None, int] = None
+    # seconds
+    style_validation_time_budget: Union[None, float] = None
 
 
 class CreateTableSourceErrorKind(Enum):
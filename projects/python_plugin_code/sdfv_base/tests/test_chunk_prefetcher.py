@@ -0,0 +1,154 @@
+import threading
+import time
+from typing import Callable, List
+
+from cms_rendner_sdfv.base.table_source import ChunkDataGenerator, ChunkPrefetcher
+from cms_rendner_sdfv.base.types import Region, ChunkDataResponse, Cell
+
+
+class TestChunkDataGenerator(ChunkDataGenerator):
+    def __init__(self,
+                 bounds: Region,
+                 computed_regions: List[Region],
+                 label: str = '',
+                 on_compute: Callable[[Region], None] = None,
+                 ):
+        super().__init__(bounds)
+        self.__computed_regions = computed_regions
+        self.__label = label
+        self.__on_compute = on_compute
+
+    def _compute_cells(self, region: Region, response: ChunkDataResponse):
+        if self.__on_compute is not None:
+            self.__on_compute(region)
+        self.__computed_regions.append(region)
+        response.cells = [[Cell(value=f'{self.__label}{region.first_row}/{region.first_col}')]]
+
+
+def _wait_for(condition):
+    deadline = time.time() + 5
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    assert condition()
+
+
+def test_adjacent_chunks_are_prefetched():
+    computed = []
+    prefetcher = ChunkPrefetcher(
+        create_generator=lambda: TestChunkDataGenerator(Region(rows=30, cols=10), computed),
+        is_sort_complete=lambda: True,
+    )
+
+    prefetcher.generate(Region(first_row=10, rows=10, cols=10))
+    # chunks below and above
+    _wait_for(lambda: len(computed) == 3)
+
+    actual = prefetcher.generate(Region(first_row=20, rows=10, cols=10))
+    assert actual.cells == [[Cell(value='20/0')]]
+    assert (prefetcher.hits, prefetcher.misses) == (1, 1)
+    prefetcher.unlink()
+
+
+def test_chunks_outside_of_bounds_are_not_prefetched():
+    computed = []
+    prefetcher = ChunkPrefetcher(
+        create_generator=lambda: TestChunkDataGenerator(Region(rows=10, cols=10), computed),
+        is_sort_complete=lambda: True,
+    )
+
+    prefetcher.generate(Region(rows=10, cols=10))
+    time.sleep(0.1)
+    assert computed == [Region(rows=10, cols=10)]
+    prefetcher.unlink()
+
+
+def test_prefetched_chunks_are_discarded_on_source_change():
+    computed = []
+    source = {'label': 'a'}
+    prefetcher = ChunkPrefetcher(
+        create_generator=lambda: TestChunkDataGenerator(Region(rows=30, cols=10), computed, source['label']),
+        is_sort_complete=lambda: True,
+    )
+
+    prefetcher.generate(Region(first_row=10, rows=10, cols=10))
+    _wait_for(lambda: len(computed) == 3)
+
+    prefetcher.change_source(lambda: source.update(label='b'))
+    actual = prefetcher.generate(Region(first_row=20, rows=10, cols=10))
+    assert actual.cells == [[Cell(value='b20/0')]]
+    assert (prefetcher.hits, prefetcher.misses) == (0, 2)
+    prefetcher.unlink()
+
+
+def test_request_skips_pending_prefetches():
+    computed = []
+    prefetch_started = threading.Event()
+    continue_prefetch = threading.Event()
+
+    def on_compute(region: Region):
+        if region.first_row == 20:
+            prefetch_started.set()
+            continue_prefetch.wait(5)
+
+    prefetcher = ChunkPrefetcher(
+        create_generator=lambda: TestChunkDataGenerator(Region(rows=60, cols=10), computed, on_compute=on_compute),
+        is_sort_complete=lambda: True,
+    )
+
+    prefetcher.generate(Region(first_row=10, rows=10, cols=10))
+    assert prefetch_started.wait(5)
+
+    # the request waits only for the chunk which is currently prefetched
+    request = threading.Thread(target=lambda: prefetcher.generate(Region(first_row=40, rows=10, cols=10)))
+    request.start()
+    time.sleep(0.05)
+    continue_prefetch.set()
+    request.join(5)
+
+    _wait_for(lambda: len(computed) == 5)
+    time.sleep(0.05)
+    # the chunk above the first request (first_row=0) isn't prefetched anymore
+    assert [r.first_row for r in computed] == [10, 20, 40, 50, 30]
+    prefetcher.unlink()
+
+
+def test_no_chunks_are_prefetched_in_exclusive_block():
+    computed = []
+    prefetcher = ChunkPrefetcher(
+        create_generator=lambda: TestChunkDataGenerator(Region(rows=30, cols=10), computed),
+        is_sort_complete=lambda: True,
+    )
+
+    with prefetcher.exclusive():
+        prefetcher.generate(Region(first_row=10, rows=10, cols=10))
+        time.sleep(0.05)
+        assert computed == [Region(first_row=10, rows=10, cols=10)]
+
+    _wait_for(lambda: len(computed) == 3)
+    prefetcher.unlink()
+
+
+def test_prefetches_run_in_a_single_worker_thread():
+    computed = []
+    prefetch_threads = set()
+
+    def on_compute(region: Region):
+        if threading.current_thread() is not threading.main_thread():
+            prefetch_threads.add(threading.current_thread())
+
+    prefetcher = ChunkPrefetcher(
+        create_generator=lambda: TestChunkDataGenerator(Region(rows=100, cols=10), computed, on_compute=on_compute),
+        is_sort_complete=lambda: True,
+    )
+
+    for i, first_row in enumerate([10, 40, 70]):
+        prefetcher.generate(Region(first_row=first_row, rows=10, cols=10))
+        # requested chunk and the chunks below and above
+        _wait_for(lambda: len(computed) == (i + 1) * 3)
+
+    assert len(prefetch_threads) == 1
+    worker = prefetch_threads.pop()
+
+    prefetcher.unlink()
+    worker.join(5)
+    assert not worker.is_alive()
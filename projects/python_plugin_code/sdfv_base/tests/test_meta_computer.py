@@ -1,3 +1,4 @@
+import threading
 from typing import Any, Dict, Tuple
 
 import pytest
@@ -81,3 +82,65 @@ def test_compute_cell_meta_works_if__compute_min_max_at__raises():
     actual = mc.compute_cell_meta(0, 0)
     assert actual is None
 
+
+
+def test_compute_column_meta():
+    mc = TestMetaComputer({0: (1, 3)})
+
+    actual = mc.compute_column_meta(0, [1, 2, 3, None, float('nan')])
+    assert actual == [
+        CellMeta(is_min=True, cmap_value=0).pack(),
+        CellMeta(cmap_value=50000).pack(),
+        CellMeta(is_max=True, cmap_value=100000).pack(),
+        CellMeta(cmap_value=-1).pack(),
+        CellMeta.nan().pack(),
+    ]
+
+
+def test_compute_column_meta_with_css():
+    mc = TestMetaComputer({0: (1, 2)})
+
+    actual = mc.compute_column_meta(0, [1, 2], [{'background-color': 'red'}, None])
+    assert actual == [
+        CellMeta(is_min=True, cmap_value=0, background_color='red').pack(),
+        CellMeta(is_max=True, cmap_value=100000).pack(),
+    ]
+
+
+def test_compute_column_meta_without_min_max():
+    mc = TestMetaComputer({0: (None, None)})
+
+    actual = mc.compute_column_meta(0, ["a", "b"])
+    assert actual == [None, None]
+
+
+class BulkTestMetaComputer(AbstractMetaComputer):
+    def __init__(self, source: Dict[int, Tuple[Any, Any]]):
+        super().__init__()
+        self.__source = source
+        self.computed_columns = []
+
+    def _compute_min_max_at(self, col: int) -> (Any, Any):
+        self.computed_columns.append(col)
+        return self.__source[col]
+
+    def _compute_min_max_of_all_columns(self) -> Dict[int, Tuple[Any, Any]]:
+        return dict(self.__source)
+
+
+@pytest.mark.parametrize("in_background", [False, True])
+def test_precompute_min_max(in_background: bool):
+    mc = BulkTestMetaComputer({0: (1, 3), 1: (None, None)})
+    mc.precompute_min_max(in_background=in_background)
+
+    if in_background:
+        for t in threading.enumerate():
+            if t is not threading.current_thread() and t.daemon:
+                t.join(timeout=5)
+
+    assert mc.compute_column_meta(0, [1, 3]) == [
+        CellMeta(is_min=True, cmap_value=0).pack(),
+        CellMeta(is_max=True, cmap_value=100000).pack(),
+    ]
+    assert mc.compute_column_meta(1, ["a"]) == [None]
+    assert mc.computed_columns == []
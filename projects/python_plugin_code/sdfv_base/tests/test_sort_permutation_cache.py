@@ -0,0 +1,46 @@
+from cms_rendner_sdfv.base.table_source import SortPermutationCache
+from cms_rendner_sdfv.base.types import SortCriteria
+
+
+def test_get_returns_cached_permutation():
+    cache = SortPermutationCache(size_of=len)
+    cache.put(SortCriteria([0], [True]), [2, 1, 0])
+
+    assert cache.get(SortCriteria([0], [True])) == [2, 1, 0]
+    assert cache.get(SortCriteria([0], [False])) is None
+
+
+def test_empty_lists_and_none_are_the_same_key():
+    cache = SortPermutationCache(size_of=len)
+    cache.put(SortCriteria(), [0, 1])
+
+    assert cache.get(SortCriteria([], [])) == [0, 1]
+
+
+def test_least_recently_used_entry_is_evicted_by_count():
+    cache = SortPermutationCache(size_of=len, max_entries=2)
+    cache.put(SortCriteria([0]), [0])
+    cache.put(SortCriteria([1]), [1])
+    # mark first entry as recently used
+    cache.get(SortCriteria([0]))
+    cache.put(SortCriteria([2]), [2])
+
+    assert cache.get(SortCriteria([0])) == [0]
+    assert cache.get(SortCriteria([1])) is None
+    assert cache.get(SortCriteria([2])) == [2]
+
+
+def test_least_recently_used_entry_is_evicted_by_size():
+    cache = SortPermutationCache(size_of=len, max_bytes=5)
+    cache.put(SortCriteria([0]), [0, 0, 0])
+    cache.put(SortCriteria([1]), [1, 1, 1])
+
+    assert cache.get(SortCriteria([0])) is None
+    assert cache.get(SortCriteria([1])) == [1, 1, 1]
+
+
+def test_too_large_permutation_is_not_cached():
+    cache = SortPermutationCache(size_of=len, max_bytes=2)
+    cache.put(SortCriteria([0]), [0, 0, 0])
+
+    assert cache.get(SortCriteria([0])) is None